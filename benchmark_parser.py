@@ -0,0 +1,48 @@
+"""
+Benchmark for the heuristic job description section parser.
+Times parse_sections over the sample postings used by test_job_parsing.py and test_messy_job.py,
+plus a long posting built by repeating them, and prints the sections found.
+"""
+
+import argparse
+import statistics
+import time
+from job_tracker.utils.section_parser import parse_sections
+from test_job_parsing import TEST_JOB_DESCRIPTION
+from test_messy_job import MESSY_JOB_DESCRIPTION
+
+
+def time_parse(description, repeat):
+    """
+    Parse a description `repeat` times.
+
+    Returns:
+        Tuple of (median milliseconds per parse, sections from the last run)
+    """
+    timings = []
+    sections = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        sections = parse_sections(description)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), sections
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the heuristic job description section parser")
+    parser.add_argument("--repeat", type=int, default=500, help="Parses per sample")
+    parser.add_argument("--long-copies", type=int, default=20, help="Copies of the samples in the long posting")
+    args = parser.parse_args()
+
+    samples = {
+        "clean": TEST_JOB_DESCRIPTION,
+        "messy": MESSY_JOB_DESCRIPTION,
+        "long": "\n\n".join([TEST_JOB_DESCRIPTION, MESSY_JOB_DESCRIPTION] * args.long_copies),
+    }
+    for name, description in samples.items():
+        median_ms, sections = time_parse(description, args.repeat)
+        print(f"{name:6s} chars={len(description):7d} median={median_ms:.3f} ms sections={len(sections)}")
+        for section in sections:
+            size = len(section["content"])
+            unit = "items" if section["type"] == "list" else "chars"
+            print(f"         {section['title']} ({size} {unit})")
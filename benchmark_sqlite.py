@@ -0,0 +1,103 @@
+"""
+Concurrency benchmark for the SQLite engine profiles.
+Runs reader threads against a scratch database while a writer commits notes and status
+updates, and reports read latency for each profile in job_tracker.utils.sqlite_profile.
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+from sqlalchemy import create_engine, text
+from job_tracker.utils.sqlite_profile import SQLITE_PROFILES, get_engine_options, register_sqlite_pragmas
+
+
+def _seed(engine, jobs):
+    """Create a minimal job/note schema and fill it with rows."""
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE job (id INTEGER PRIMARY KEY, title TEXT, status TEXT, date_added TEXT)"))
+        conn.execute(text("CREATE TABLE note (id INTEGER PRIMARY KEY, job_id INTEGER, content TEXT)"))
+        conn.execute(text("CREATE INDEX ix_job_status_date_added ON job (status, date_added)"))
+        conn.execute(
+            text("INSERT INTO job (title, status, date_added) VALUES (:title, :status, :date_added)"),
+            [{"title": f"Job {i}", "status": "Saved" if i % 2 else "Applied",
+              "date_added": f"2024-01-01 00:00:{i % 60:02d}"} for i in range(jobs)]
+        )
+
+
+def run_profile(profile_name, readers, duration, jobs):
+    """
+    Benchmark one profile.
+
+    Returns:
+        Dictionary with read/write counts and read latency percentiles in milliseconds
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        uri = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        options = get_engine_options(profile_name, uri) or {"connect_args": {"timeout": 5, "check_same_thread": False}}
+        options.setdefault("pool_size", readers + 2)
+        options["pool_size"] = max(options["pool_size"], readers + 2)
+        engine = create_engine(uri, **options)
+        register_sqlite_pragmas(engine, profile_name)
+        _seed(engine, jobs)
+
+        stop = threading.Event()
+        latencies = []
+        writes = [0]
+        lock = threading.Lock()
+
+        def reader():
+            local = []
+            while not stop.is_set():
+                start = time.perf_counter()
+                with engine.connect() as conn:
+                    conn.execute(text(
+                        "SELECT id, title FROM job WHERE status = 'Applied' ORDER BY date_added DESC LIMIT 50"
+                    )).fetchall()
+                local.append((time.perf_counter() - start) * 1000)
+            with lock:
+                latencies.extend(local)
+
+        def writer():
+            i = 0
+            while not stop.is_set():
+                with engine.begin() as conn:
+                    conn.execute(text("INSERT INTO note (job_id, content) VALUES (:job_id, :content)"),
+                                 {"job_id": i % jobs + 1, "content": "x" * 200})
+                    conn.execute(text("UPDATE job SET status = :status WHERE id = :id"),
+                                 {"status": "Applied" if i % 2 else "Saved", "id": i % jobs + 1})
+                i += 1
+            writes[0] = i
+
+        threads = [threading.Thread(target=reader) for _ in range(readers)] + [threading.Thread(target=writer)]
+        for thread in threads:
+            thread.start()
+        time.sleep(duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        engine.dispose()
+
+    latencies.sort()
+    return {
+        "reads": len(latencies),
+        "writes": writes[0],
+        "p50": statistics.median(latencies),
+        "p99": latencies[int(len(latencies) * 0.99) - 1],
+        "max": latencies[-1],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark SQLite engine profiles under concurrent reads and writes")
+    parser.add_argument("--readers", type=int, default=4, help="Number of reader threads")
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds to run each profile")
+    parser.add_argument("--jobs", type=int, default=5000, help="Number of seeded job rows")
+    args = parser.parse_args()
+
+    for name in SQLITE_PROFILES:
+        result = run_profile(name, args.readers, args.duration, args.jobs)
+        print(f"{name:12s} reads={result['reads']:7d} writes={result['writes']:6d} "
+              f"read p50={result['p50']:.2f} ms p99={result['p99']:.2f} ms max={result['max']:.2f} ms")
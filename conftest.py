@@ -0,0 +1,27 @@
+"""
+Shared pytest fixtures: an application bound to a fresh SQLite database per test.
+"""
+
+import pytest
+from job_tracker import create_app, db
+from job_tracker.utils import company_parser, llm_parser
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """Application with its own database, no worker threads and no Groq key; yields inside an app context."""
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'jobs.db'}")
+    monkeypatch.setenv('TASK_QUEUE_WORKERS', '0')
+    monkeypatch.setenv('GROQ_API_KEY', '')
+    # The parsers read the key when they are first imported, so clear their copies as well
+    monkeypatch.setattr(llm_parser, 'GROQ_API_KEY', '')
+    monkeypatch.setattr(company_parser, 'GROQ_API_KEY', '')
+    app = create_app()
+    with app.app_context():
+        yield app
+        db.session.remove()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
@@ -0,0 +1,32 @@
+"""
+Command line bulk import of jobs from CSV, JSONL or a list of URLs.
+"""
+import argparse
+from job_tracker import create_app
+from job_tracker.utils.bulk_import import IMPORT_FORMATS, import_file
+
+# Setup command line arguments
+parser = argparse.ArgumentParser(description='Bulk import jobs into the Job Tracker database')
+parser.add_argument('path', help='CSV, JSONL or text file with one job URL per line')
+parser.add_argument('--format', choices=IMPORT_FORMATS, default=None, help='Input format (detected from the extension by default)')
+parser.add_argument('--workers', type=int, default=4, help='Number of descriptions fetched/parsed concurrently')
+parser.add_argument('--batch-size', type=int, default=100, help='Number of jobs inserted per transaction')
+parser.add_argument('--no-parse', action='store_true', help='Skip parsing descriptions into sections')
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    app = create_app()
+    with app.app_context():
+        stats = import_file(
+            args.path,
+            fmt=args.format,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            parse=not args.no_parse
+        )
+
+    print(f"Read {stats['read']} records: imported {stats['imported']}, "
+          f"{stats['duplicates']} duplicates, {stats['skipped']} skipped, {stats['errors']} errors")
+    if stats['invalid_lines']:
+        print(f"Unreadable lines: {', '.join(str(line) for line in stats['invalid_lines'])}")
+    print(f"Took {stats['seconds']} s ({stats['jobs_per_second']} jobs/second)")
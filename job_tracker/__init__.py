@@ -5,6 +5,9 @@ from datetime import datetime
 import jinja2
 from datetime import timezone
 from markupsafe import Markup
+from job_tracker.utils.http_cache import DEFAULT_CACHE_VERSION
+from job_tracker.utils.logging_config import configure_logging
+from job_tracker.utils.sqlite_profile import DEFAULT_PROFILE, get_engine_options, register_sqlite_pragmas
 
 # Initialize extensions
 db = SQLAlchemy()
@@ -15,17 +18,57 @@ def create_app():
 
     # Configure the app
     app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-key-for-testing')
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///jobs.db'
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///jobs.db')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
     app.config['UPLOAD_FOLDER'] = '../uploads'
+    app.config['JOBS_PER_PAGE'] = int(os.environ.get('JOBS_PER_PAGE', 50))
+    app.config['STATUS_CACHE_TTL'] = int(os.environ.get('STATUS_CACHE_TTL', 300))
+    app.config['TASK_QUEUE_WORKERS'] = int(os.environ.get('TASK_QUEUE_WORKERS', 2))
+    app.config['TASK_QUEUE_EAGER'] = os.environ.get('TASK_QUEUE_EAGER', '0') == '1'
+    app.config['TASK_STALE_SECONDS'] = int(os.environ.get('TASK_STALE_SECONDS', 600))
+    app.config['IMPORT_WORKERS'] = int(os.environ.get('IMPORT_WORKERS', 4))
+    app.config['IMPORT_BATCH_SIZE'] = int(os.environ.get('IMPORT_BATCH_SIZE', 100))
+    app.config['EXTRACTION_WORKERS'] = int(os.environ.get('EXTRACTION_WORKERS', min(4, os.cpu_count() or 1)))
+    app.config['EXTRACTION_TIMEOUT'] = float(os.environ.get('EXTRACTION_TIMEOUT', 20))
+    app.config['MAX_PDF_PAGES'] = int(os.environ.get('MAX_PDF_PAGES', 50))
+    app.config['DISCOVERY_TTL_SECONDS'] = int(os.environ.get('DISCOVERY_TTL_SECONDS', 7 * 24 * 3600))
+    app.config['DISCOVERY_NEGATIVE_TTL_SECONDS'] = int(os.environ.get('DISCOVERY_NEGATIVE_TTL_SECONDS', 24 * 3600))
+    app.config['DISCOVERY_RETRY_TTL_SECONDS'] = int(os.environ.get('DISCOVERY_RETRY_TTL_SECONDS', 15 * 60))
+    app.config['COMPANY_MATCH_THRESHOLD'] = float(os.environ.get('COMPANY_MATCH_THRESHOLD', 0.7))
+    app.config['COMPANY_INDEX_TTL'] = int(os.environ.get('COMPANY_INDEX_TTL', 300))
+    app.config['DUPLICATE_THRESHOLD'] = float(os.environ.get('DUPLICATE_THRESHOLD', 0.8))
+    # Part of every page ETag, so it must be the same in every worker; bump it (or set it to the
+    # release's git SHA) whenever a deploy changes the job or company templates
+    app.config['CACHE_VERSION'] = os.environ.get('CACHE_VERSION', DEFAULT_CACHE_VERSION)
+    app.config['FRAGMENT_CACHE_SIZE'] = int(os.environ.get('FRAGMENT_CACHE_SIZE', 256))
+    app.config['COVER_LETTER_CONTEXT_TOKENS'] = int(os.environ.get('COVER_LETTER_CONTEXT_TOKENS', 3000))
+    app.config['LOG_LEVEL'] = os.environ.get('LOG_LEVEL', 'WARNING')
+    app.config['LOG_FORMAT'] = os.environ.get('LOG_FORMAT', 'text')
+    app.config['PROFILE_ENABLED'] = os.environ.get('PROFILE_ENABLED', '0') == '1'
+    app.config['PROFILE_TOKEN'] = os.environ.get('PROFILE_TOKEN')
+    app.config['PROFILE_DIR'] = os.environ.get('PROFILE_DIR')
+    app.config['PROFILE_INTERVAL_MS'] = int(os.environ.get('PROFILE_INTERVAL_MS', 5))
+
+    # Package loggers stay quiet below WARNING unless LOG_LEVEL asks for more
+    configure_logging(app.config['LOG_LEVEL'], app.config['LOG_FORMAT'])
 
     # Ensure upload directory exists
     os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
+    # Select the SQLite engine profile (pragmas + connection pool)
+    app.config['DB_PROFILE'] = os.environ.get('JOB_TRACKER_DB_PROFILE', DEFAULT_PROFILE)
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = get_engine_options(
+        app.config['DB_PROFILE'], app.config['SQLALCHEMY_DATABASE_URI']
+    )
+
     # Initialize database with app
     db.init_app(app)
     with app.app_context():
+        register_sqlite_pragmas(db.engine, app.config['DB_PROFILE'])
+        from job_tracker import models  # noqa: F401 - register tables before create_all
         db.create_all()
+        from job_tracker.utils.search_index import ensure_search_index
+        ensure_search_index(db.engine)
 
     # Import and register blueprints
     from job_tracker.routes.main_routes import main_bp
@@ -35,6 +78,8 @@ def create_app():
     from job_tracker.routes.cv_routes import cv_bp
     from job_tracker.routes.document_routes import document_bp
     from job_tracker.routes.cover_letter_routes import cover_letter_bp
+    from job_tracker.routes.task_routes import task_bp
+    from job_tracker.routes.metrics_routes import metrics_bp
 
     app.register_blueprint(main_bp)
     app.register_blueprint(job_bp, url_prefix='/jobs')
@@ -43,6 +88,18 @@ def create_app():
     app.register_blueprint(cv_bp)
     app.register_blueprint(document_bp)
     app.register_blueprint(cover_letter_bp)
+    app.register_blueprint(task_bp, url_prefix='/tasks')
+    app.register_blueprint(metrics_bp)
+
+    # Opt-in request profiling (PROFILE_ENABLED, or ?profile=<PROFILE_TOKEN> per request)
+    from job_tracker.utils.profiling import request_profiler
+    with app.app_context():
+        request_profiler.init_app(app, db.engine)
+
+    # Start the background worker pool (importing tasks registers the handlers)
+    import job_tracker.tasks  # noqa: F401
+    from job_tracker.utils.task_queue import task_queue
+    task_queue.init_app(app)
 
     # Add template context processor for global template variables
     @app.context_processor
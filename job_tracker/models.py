@@ -1,13 +1,18 @@
 from datetime import datetime
 from job_tracker import db
 
+# Deferred column groups on Job. The large Text blobs are only loaded when a
+# query asks for them with db.undefer_group(...) or when first accessed.
+POSTING_GROUP = 'posting'  # description, parsed_data
+ENRICHMENT_GROUP = 'enrichment'  # company_data, company_reviews (also on CompanySource)
+
 class Job(db.Model):
     """Model for job listings."""
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
     company = db.Column(db.String(100), nullable=False)
     location = db.Column(db.String(100))
-    description = db.Column(db.Text)
+    description = db.deferred(db.Column(db.Text), group=POSTING_GROUP)
     url = db.Column(db.String(500))
     salary = db.Column(db.String(100))
     job_type = db.Column(db.String(50))  # Full-time, Part-time, Contract, etc.
@@ -15,11 +20,32 @@ class Job(db.Model):
     date_added = db.Column(db.DateTime, default=datetime.utcnow)
     status = db.Column(db.String(50), default='Saved')  # Saved, Applied, Interview, Offer, Rejected
     date_applied = db.Column(db.DateTime)
-    parsed_data = db.Column(db.Text)  # JSON string with structured job description data
-    company_data = db.Column(db.Text)  # JSON string with structured company information
-    company_reviews = db.Column(db.Text)  # JSON string with structured company reviews
+    parsed_data = db.deferred(db.Column(db.Text), group=POSTING_GROUP)  # JSON string with structured job description data
+    # Legacy per-job copies of the enrichment data, now stored once on CompanySource; only read as a fallback
+    company_data = db.deferred(db.Column(db.Text), group=ENRICHMENT_GROUP)
+    company_reviews = db.deferred(db.Column(db.Text), group=ENRICHMENT_GROUP)
+    company_source_id = db.Column(db.Integer, db.ForeignKey('company_source.id'))
+    processing_status = db.Column(db.String(20))  # None/ready, pending, failed - state of background tasks
+    seniority = db.Column(db.String(20))  # intern, junior, mid, senior, lead, principal; set when parsed_data is stored
+    match_score = db.Column(db.Float)  # Share (0-1) of the job's skills found in the CV; None without skills or CV
+    minhash = db.deferred(db.Column(db.LargeBinary))  # MinHash signature of the description, for near-duplicate checks
+    # Bumped by every write to the row (also Core updates); add_note/add_contact bump it by hand. Versions the job pages.
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     notes = db.relationship('Note', backref='job', lazy=True, cascade="all, delete-orphan")
     contacts = db.relationship('Contact', backref='job', lazy=True, cascade="all, delete-orphan")
+    tasks = db.relationship('Task', backref='job', lazy=True, cascade="all, delete-orphan")
+    skills = db.relationship('JobSkill', backref='job', lazy=True, cascade="all, delete-orphan")
+    lsh_bands = db.relationship('JobLSHBand', lazy=True, cascade="all, delete-orphan")
+    company_source = db.relationship('CompanySource', backref=db.backref('jobs', lazy='dynamic'), lazy=True)
+    
+    __table_args__ = (
+        db.Index('ix_job_status_date_added', 'status', 'date_added'),
+        db.Index('ix_job_date_added', 'date_added'),
+        db.Index('ix_job_url', 'url'),
+        db.Index('ix_job_company_source_id', 'company_source_id'),
+        db.Index('ix_job_seniority_date_added', 'seniority', 'date_added'),
+        db.Index('ix_job_match_score_id', 'match_score', 'id'),
+    )
     
     def __repr__(self):
         return f'<Job {self.title} at {self.company}>'
@@ -31,6 +57,10 @@ class Note(db.Model):
     date_added = db.Column(db.DateTime, default=datetime.utcnow)
     job_id = db.Column(db.Integer, db.ForeignKey('job.id'), nullable=False)
     
+    __table_args__ = (
+        db.Index('ix_note_job_id_date_added', 'job_id', 'date_added'),
+    )
+    
     def __repr__(self):
         return f'<Note {self.id} for Job {self.job_id}>'
 
@@ -45,17 +75,88 @@ class Contact(db.Model):
     notes = db.Column(db.Text)
     job_id = db.Column(db.Integer, db.ForeignKey('job.id'), nullable=False)
     
+    __table_args__ = (
+        db.Index('ix_contact_job_id', 'job_id'),
+    )
+    
     def __repr__(self):
         return f'<Contact {self.name} for Job {self.job_id}>'
 
+class JobSkill(db.Model):
+    """Skill extracted from a job's parsed Skills section, for indexed skill filters."""
+    id = db.Column(db.Integer, primary_key=True)
+    job_id = db.Column(db.Integer, db.ForeignKey('job.id'), nullable=False)
+    name = db.Column(db.String(100), nullable=False)  # as written in the posting
+    normalized = db.Column(db.String(100), nullable=False)  # normalize_skill(name), the lookup key
+    
+    __table_args__ = (
+        db.Index('ix_job_skill_normalized_job_id', 'normalized', 'job_id'),
+        db.Index('ix_job_skill_job_id', 'job_id'),
+    )
+    
+    def __repr__(self):
+        return f'<JobSkill {self.name} for Job {self.job_id}>'
+
+class JobLSHBand(db.Model):
+    """One LSH bucket of a job's MinHash signature; jobs sharing a bucket are near-duplicate candidates."""
+    id = db.Column(db.Integer, primary_key=True)
+    job_id = db.Column(db.Integer, db.ForeignKey('job.id'), nullable=False)
+    band = db.Column(db.Integer, nullable=False)  # 0 .. LSH_BANDS-1
+    bucket = db.Column(db.BigInteger, nullable=False)  # 64-bit hash of the signature rows in this band
+    
+    __table_args__ = (
+        db.Index('ix_job_lsh_band_band_bucket_job_id', 'band', 'bucket', 'job_id'),
+        db.Index('ix_job_lsh_band_job_id', 'job_id'),
+    )
+    
+    def __repr__(self):
+        return f'<JobLSHBand {self.band}:{self.bucket} for Job {self.job_id}>'
+
 class CompanySource(db.Model):
     """Model for tracking company information sources."""
     id = db.Column(db.Integer, primary_key=True)
     company_name = db.Column(db.String(100), nullable=False)
+    normalized_name = db.Column(db.String(100))  # normalize_company_name(company_name), the lookup key
     linkedin_url = db.Column(db.String(500))
     website_url = db.Column(db.String(500))
     glassdoor_url = db.Column(db.String(500))
     last_updated = db.Column(db.DateTime, default=datetime.utcnow)
+    # Last automatic URL discovery and whether it found anything (reused within the discovery TTLs);
+    # discovery_hit stays None after an attempt whose lookups failed, which is retried sooner
+    discovered_at = db.Column(db.DateTime)
+    discovery_hit = db.Column(db.Boolean)
+    # Enrichment shared by every job at the company (JSON strings)
+    company_data = db.deferred(db.Column(db.Text), group=ENRICHMENT_GROUP)
+    company_reviews = db.deferred(db.Column(db.Text), group=ENRICHMENT_GROUP)
+    enriched_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)  # versions the company pages
+    
+    __table_args__ = (
+        db.Index('ix_company_source_company_name', 'company_name'),
+        db.Index('ix_company_source_normalized_name', 'normalized_name'),
+    )
     
     def __repr__(self):
         return f'<CompanySource {self.company_name}>'
+
+class Task(db.Model):
+    """Model for background tasks (LLM parsing, company enrichment) run by the worker pool."""
+    id = db.Column(db.Integer, primary_key=True)
+    task_type = db.Column(db.String(50), nullable=False)  # parse_job, enrich_company
+    status = db.Column(db.String(20), nullable=False, default='pending')  # pending, running, done, failed
+    job_id = db.Column(db.Integer, db.ForeignKey('job.id'))
+    payload = db.Column(db.Text)  # JSON string with task arguments
+    result = db.Column(db.Text)  # JSON string returned by the task handler
+    error = db.Column(db.Text)
+    attempts = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+    
+    __table_args__ = (
+        db.Index('ix_task_status_created_at', 'status', 'created_at'),
+        db.Index('ix_task_job_id', 'job_id'),
+    )
+    
+    def __repr__(self):
+        return f'<Task {self.id} {self.task_type} ({self.status})>'
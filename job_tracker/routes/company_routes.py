@@ -2,110 +2,89 @@
 Routes for company information handling.
 """
 
-from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, current_app
 import json
 from job_tracker import db
-from job_tracker.models import Job, CompanySource
-from job_tracker.utils.company_parser import CompanyInfoParser
-from job_tracker.utils.url_discovery import URLDiscovery
+from job_tracker.models import Job
+from job_tracker.utils.company_enrichment import (
+    company_profile,
+    company_source_for_job,
+    link_company_source,
+    needs_url_discovery,
+)
+from job_tracker.utils.http_cache import cached_fragment, conditional_response, last_modified, page_version
+from job_tracker.utils.task_queue import task_queue
 
 # Create blueprint
 company_bp = Blueprint('company', __name__)
 
+def _company_version(page, job, company_source):
+    """Version of a company page: the job (name, title, status) and the shared company data it shows."""
+    if company_source is None:
+        return page_version(page, job.id, job.updated_at)
+    return page_version(page, job.id, job.updated_at, company_source.id, company_source.updated_at)
+
+def _company_modified(job, company_source):
+    """Last-Modified of a company page."""
+    return last_modified(job.updated_at, company_source.updated_at if company_source else None)
+
 @company_bp.route('/job/<int:job_id>/company', methods=['GET'])
 def view_company_info(job_id):
     """Route to view company information for a specific job."""
+    # The profile/review blobs stay deferred; they are only loaded when the tabs are rendered
     job = Job.query.get_or_404(job_id)
     
-    # Check if we need to fetch company information automatically
-    company_source = CompanySource.query.filter_by(company_name=job.company).first()
+    # Company information is shared by all jobs at the company
+    company_source = company_source_for_job(job)
     
-    # If we don't have company source information yet, try to discover URLs automatically
-    if not company_source or not (company_source.website_url or company_source.linkedin_url or company_source.glassdoor_url):
+    # Discover URLs and fetch data in the background unless a recent discovery (hit or miss) can be reused
+    needs_discovery = needs_url_discovery(
+        company_source,
+        current_app.config['DISCOVERY_TTL_SECONDS'],
+        current_app.config['DISCOVERY_NEGATIVE_TTL_SECONDS'],
+        current_app.config['DISCOVERY_RETRY_TTL_SECONDS']
+    )
+    if needs_discovery and not task_queue.find_active('enrich_company', job.id):
         try:
-            # Discover URLs for this company
-            discovered_urls = URLDiscovery.discover_company_urls(job.company)
-            
-            # Create or update the company source record
-            if not company_source:
-                company_source = CompanySource(company_name=job.company)
-                db.session.add(company_source)
-            
-            # Update with discovered URLs
-            if discovered_urls.get('website_url') and not company_source.website_url:
-                company_source.website_url = discovered_urls.get('website_url')
-            
-            if discovered_urls.get('linkedin_url') and not company_source.linkedin_url:
-                company_source.linkedin_url = discovered_urls.get('linkedin_url')
-            
-            if discovered_urls.get('glassdoor_url') and not company_source.glassdoor_url:
-                company_source.glassdoor_url = discovered_urls.get('glassdoor_url')
-            
-            db.session.commit()
-            
-            # If we discovered URLs, try to fetch company information automatically
-            auto_fetch = False
-            if (discovered_urls.get('website_url') or discovered_urls.get('linkedin_url')) and not job.company_data:
-                try:
-                    # Fetch and parse company information
-                    company_data = CompanyInfoParser.fetch_company_data(
-                        job.company, 
-                        website_url=discovered_urls.get('website_url'), 
-                        linkedin_url=discovered_urls.get('linkedin_url')
-                    )
-                    
-                    # Update the job record with the company data
-                    job.company_data = json.dumps(company_data)
-                    db.session.commit()
-                    auto_fetch = True
-                except Exception as e:
-                    print(f"Error auto-fetching company information: {str(e)}")
-            
-            # If we discovered a Glassdoor URL, try to fetch reviews automatically
-            if discovered_urls.get('glassdoor_url') and not job.company_reviews:
-                try:
-                    # Fetch and parse company reviews
-                    company_reviews = CompanyInfoParser.fetch_company_reviews(
-                        job.company,
-                        glassdoor_url=discovered_urls.get('glassdoor_url')
-                    )
-                    
-                    # Update the job record with the company reviews
-                    job.company_reviews = json.dumps(company_reviews)
-                    db.session.commit()
-                    auto_fetch = True
-                except Exception as e:
-                    print(f"Error auto-fetching company reviews: {str(e)}")
-            
-            if auto_fetch:
-                flash("Company information and reviews were automatically fetched!", "success")
-            else:
-                flash("We've automatically found sources for this company!", "info")
-                
+            task_queue.enqueue('enrich_company', job_id=job.id, discover=True, only_missing=True)
+            flash("We're looking up sources and information for this company in the background.", "info")
         except Exception as e:
             flash(f"Error discovering company URLs: {str(e)}", "warning")
     
-    # Get company data if it exists, otherwise return empty dict
-    company_data = {}
-    if job.company_data:
-        try:
-            company_data = json.loads(job.company_data)
-        except json.JSONDecodeError:
-            flash("Error loading company data", "danger")
-    
-    # Get company reviews if they exist, otherwise return empty dict
-    company_reviews = {}
-    if job.company_reviews:
-        try:
-            company_reviews = json.loads(job.company_reviews)
-        except json.JSONDecodeError:
-            flash("Error loading company reviews", "danger")
-    
-    return render_template('jobs/company_info.html', 
-                          job=job,
-                          company_data=company_data,
-                          company_reviews=company_reviews,
-                          company_source=company_source)
+    version = _company_version('company', job, company_source)
+
+    def render_tabs():
+        company_data_json, company_reviews_json = company_profile(job, company_source)
+
+        # Get company data if it exists, otherwise return empty dict
+        company_data = {}
+        if company_data_json:
+            try:
+                company_data = json.loads(company_data_json)
+            except json.JSONDecodeError:
+                flash("Error loading company data", "danger")
+        
+        # Get company reviews if they exist, otherwise return empty dict
+        company_reviews = {}
+        if company_reviews_json:
+            try:
+                company_reviews = json.loads(company_reviews_json)
+            except json.JSONDecodeError:
+                flash("Error loading company reviews", "danger")
+        
+        return render_template('jobs/_company_tabs.html',
+                               job=job,
+                               company_data=company_data,
+                               company_reviews=company_reviews,
+                               company_source=company_source)
+
+    def render():
+        return render_template('jobs/company_info.html', 
+                              job=job,
+                              tabs_html=cached_fragment(f'company-tabs:{version}', render_tabs),
+                              company_source=company_source)
+
+    return conditional_response(version, _company_modified(job, company_source), render)
 
 @company_bp.route('/job/<int:job_id>/company/update', methods=['POST'])
 def update_company_info(job_id):
@@ -115,43 +94,14 @@ def update_company_info(job_id):
     # Check if we should try to auto-discover URLs
     auto_discover = request.form.get('auto_discover') == 'true'
     
-    if auto_discover:
-        try:
-            # Discover URLs for this company
-            discovered_urls = URLDiscovery.discover_company_urls(job.company)
-            
-            # Create or update the company source record
-            company_source = CompanySource.query.filter_by(company_name=job.company).first()
-            if not company_source:
-                company_source = CompanySource(company_name=job.company)
-                db.session.add(company_source)
-            
-            # Update with discovered URLs (only if they don't already exist)
-            if discovered_urls.get('website_url') and not company_source.website_url:
-                company_source.website_url = discovered_urls.get('website_url')
-            
-            if discovered_urls.get('linkedin_url') and not company_source.linkedin_url:
-                company_source.linkedin_url = discovered_urls.get('linkedin_url')
-            
-            if discovered_urls.get('glassdoor_url') and not company_source.glassdoor_url:
-                company_source.glassdoor_url = discovered_urls.get('glassdoor_url')
-                
-            db.session.commit()
-            
-            flash("URLs discovered successfully!", "success")
-        except Exception as e:
-            flash(f"Error discovering URLs: {str(e)}", "danger")
-    else:
+    if not auto_discover:
         # Manual update - Get form data
         website_url = request.form.get('website_url', '')
         linkedin_url = request.form.get('linkedin_url', '')
         glassdoor_url = request.form.get('glassdoor_url', '')
         
         # Create or update the company source record
-        company_source = CompanySource.query.filter_by(company_name=job.company).first()
-        if not company_source:
-            company_source = CompanySource(company_name=job.company)
-            db.session.add(company_source)
+        company_source = link_company_source(job)
         
         # Update URLs
         if website_url:
@@ -163,43 +113,12 @@ def update_company_info(job_id):
         
         db.session.commit()
     
-    # Get the updated company source
-    company_source = CompanySource.query.filter_by(company_name=job.company).first()
-    
-    # Fetch and parse company information if we have sources
-    if company_source and (company_source.website_url or company_source.linkedin_url):
-        try:
-            # Fetch and parse company information
-            company_data = CompanyInfoParser.fetch_company_data(
-                job.company, 
-                website_url=company_source.website_url, 
-                linkedin_url=company_source.linkedin_url
-            )
-            
-            # Update the job record with the company data
-            job.company_data = json.dumps(company_data)
-            db.session.commit()
-            
-            flash("Company information updated successfully", "success")
-        except Exception as e:
-            flash(f"Error fetching company information: {str(e)}", "danger")
-    
-    # Fetch and parse company reviews if we have a Glassdoor URL
-    if company_source and company_source.glassdoor_url:
-        try:
-            # Fetch and parse company reviews
-            company_reviews = CompanyInfoParser.fetch_company_reviews(
-                job.company,
-                glassdoor_url=company_source.glassdoor_url
-            )
-            
-            # Update the job record with the company reviews
-            job.company_reviews = json.dumps(company_reviews)
-            db.session.commit()
-            
-            flash("Company reviews updated successfully", "success")
-        except Exception as e:
-            flash(f"Error fetching company reviews: {str(e)}", "danger")
+    # Discovery and fetching the company information and reviews run in the background
+    try:
+        task_queue.enqueue('enrich_company', job_id=job.id, discover=auto_discover, only_missing=False)
+        flash("Company information is being updated in the background.", "info")
+    except Exception as e:
+        flash(f"Error scheduling company information update: {str(e)}", "danger")
     
     return redirect(url_for('company.view_company_info', job_id=job_id))
 
@@ -207,25 +126,33 @@ def update_company_info(job_id):
 def api_get_company_info(job_id):
     """API endpoint to get company information for a specific job."""
     job = Job.query.get_or_404(job_id)
-    
-    # Get company data if it exists
-    company_data = {}
-    if job.company_data:
-        try:
-            company_data = json.loads(job.company_data)
-        except json.JSONDecodeError:
-            return jsonify({"error": "Error parsing company data"}), 500
-    
-    # Get company reviews if they exist
-    company_reviews = {}
-    if job.company_reviews:
-        try:
-            company_reviews = json.loads(job.company_reviews)
-        except json.JSONDecodeError:
-            return jsonify({"error": "Error parsing company reviews"}), 500
-    
-    return jsonify({
-        "company_name": job.company,
-        "company_data": company_data,
-        "company_reviews": company_reviews
-    })
+    company_source = company_source_for_job(job)
+
+    def render():
+        company_data_json, company_reviews_json = company_profile(job, company_source)
+        
+        # Get company data if it exists
+        company_data = {}
+        if company_data_json:
+            try:
+                company_data = json.loads(company_data_json)
+            except json.JSONDecodeError:
+                return jsonify({"error": "Error parsing company data"}), 500
+        
+        # Get company reviews if they exist
+        company_reviews = {}
+        if company_reviews_json:
+            try:
+                company_reviews = json.loads(company_reviews_json)
+            except json.JSONDecodeError:
+                return jsonify({"error": "Error parsing company reviews"}), 500
+        
+        return jsonify({
+            "company_name": job.company,
+            "company_data": company_data,
+            "company_reviews": company_reviews
+        })
+
+    return conditional_response(
+        _company_version('company-api', job, company_source), _company_modified(job, company_source), render
+    )
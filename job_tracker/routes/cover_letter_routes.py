@@ -1,77 +1,127 @@
-from flask import Blueprint, request, jsonify, flash
+from flask import Blueprint, Response, request, jsonify, flash, current_app, stream_with_context
 import os
 import glob
+import json
 from job_tracker.utils.llm_parser import JobDescriptionParser
+from job_tracker.utils.llm_client import LLMStreamError
+from job_tracker.utils.context_selection import select_context
+from job_tracker.utils.document_text import extract_documents, extraction_options
 
 cover_letter_bp = Blueprint('cover_letter', __name__)
 UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.dirname(__file__)), '..', 'uploads')
 COVER_LETTERS_DIR = os.path.join(UPLOAD_FOLDER, 'cover_letters')
 OTHER_DOCS_DIR = os.path.join(UPLOAD_FOLDER, 'other_docs')
 
-@cover_letter_bp.route('/cover-letter/generate', methods=['POST'])
-def generate_cover_letter():
-    data = request.get_json()
-    job_description = data.get('job_description', '')
+
+def _prepare_cover_letter_inputs(data):
+    """
+    Read the CV and documents and select the prompt context for a cover letter request.
+
+    Args:
+        data: Request JSON with a job_description
+
+    Returns:
+        Tuple of (inputs dictionary, None) or (None, error response tuple)
+    """
+    job_description = (data or {}).get('job_description', '')
+    if not job_description:
+        return None, (jsonify({'error': 'Job description is required.'}), 400)
+
     # Find the uploaded CV (if any)
-    cv_text = ''
+    cv_path = None
     for ext in ['pdf', 'doc', 'docx', 'txt']:
         path = os.path.join(UPLOAD_FOLDER, f'cv.{ext}')
         if os.path.exists(path):
-            try:
-                if ext == 'pdf':
-                    import PyPDF2
-                    with open(path, 'rb') as f:
-                        reader = PyPDF2.PdfReader(f)
-                        cv_text = "\n".join(page.extract_text() or '' for page in reader.pages)
-                elif ext in ['doc', 'docx']:
-                    import docx
-                    doc = docx.Document(path)
-                    cv_text = "\n".join([para.text for para in doc.paragraphs])
-                else:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        cv_text = f.read()
-            except Exception as e:
-                return jsonify({'error': f'Could not read CV: {str(e)}'}), 400
+            cv_path = path
             break
-    if not cv_text:
-        return jsonify({'error': 'No CV uploaded or unable to read CV.'}), 400
-    if not job_description:
-        return jsonify({'error': 'Job description is required.'}), 400
+    if cv_path is None:
+        return None, (jsonify({'error': 'No CV uploaded or unable to read CV.'}), 400)
+
+    # Extract the CV and all additional docs (cover letters + other docs) together; unchanged files come from the cache
+    doc_paths = glob.glob(os.path.join(COVER_LETTERS_DIR, '*')) + glob.glob(os.path.join(OTHER_DOCS_DIR, '*'))
+    results = extract_documents([cv_path] + doc_paths, **extraction_options(current_app.config))
+    extraction = [
+        {'file': os.path.basename(r['path']), 'ms': round(r['seconds'] * 1000, 1), 'cached': r['cached'], 'error': r['error']}
+        for r in results
+    ]
+
+    cv_result = results[0]
+    if cv_result['error']:
+        return None, (jsonify({'error': f"Could not read CV: {cv_result['error']}", 'extraction': extraction}), 400)
+    if not cv_result['text']:
+        return None, (jsonify({'error': 'No CV uploaded or unable to read CV.', 'extraction': extraction}), 400)
+
+    # Only the chunks most relevant to the job description go into the prompt
+    cv_text, additional_docs, context = select_context(
+        job_description, cv_result['text'], [r['text'] for r in results[1:]],
+        current_app.config['COVER_LETTER_CONTEXT_TOKENS']
+    )
+    return {
+        'job_description': job_description,
+        'cv_text': cv_text,
+        'additional_docs': additional_docs,
+        'extraction': extraction,
+        'context': context,
+    }, None
 
-    # Gather all additional docs (cover letters + other docs)
-    def extract_text_from_file(path):
-        ext = path.split('.')[-1].lower()
-        try:
-            if ext == 'pdf':
-                import PyPDF2
-                with open(path, 'rb') as f:
-                    reader = PyPDF2.PdfReader(f)
-                    return "\n".join(page.extract_text() or '' for page in reader.pages)
-            elif ext in ['doc', 'docx']:
-                import docx
-                doc = docx.Document(path)
-                return "\n".join([para.text for para in doc.paragraphs])
-            else:
-                with open(path, 'r', encoding='utf-8') as f:
-                    return f.read()
-        except Exception:
-            return ''
-
-    additional_docs = []
-    # Cover letters
-    for fname in glob.glob(os.path.join(COVER_LETTERS_DIR, '*')):
-        additional_docs.append(extract_text_from_file(fname))
-    # Other docs
-    for fname in glob.glob(os.path.join(OTHER_DOCS_DIR, '*')):
-        additional_docs.append(extract_text_from_file(fname))
+
+def _sse_event(data, event=None):
+    """Format one server-sent event with a JSON payload."""
+    prefix = f'event: {event}\n' if event else ''
+    return f'{prefix}data: {json.dumps(data)}\n\n'
+
+
+@cover_letter_bp.route('/cover-letter/generate', methods=['POST'])
+def generate_cover_letter():
+    inputs, error = _prepare_cover_letter_inputs(request.get_json())
+    if error:
+        return error
 
     try:
-        letter = JobDescriptionParser.generate_cover_letter(job_description, cv_text, additional_docs)
+        letter = JobDescriptionParser.generate_cover_letter(
+            inputs['job_description'], inputs['cv_text'], inputs['additional_docs']
+        )
         # If the letter looks like an error message, surface it as an error
         if letter.startswith('[LLM API Error') or letter.startswith('[Could not extract cover letter'):
             return jsonify({'error': letter}), 500
-        return jsonify({'cover_letter': letter})
+        return jsonify({'cover_letter': letter, 'extraction': inputs['extraction'], 'context': inputs['context']})
     except Exception as e:
         import traceback
         tb = traceback.format_exc()
         return jsonify({'error': f'{str(e)}\n{tb}'}), 500
+
+
+@cover_letter_bp.route('/cover-letter/stream', methods=['POST'])
+def stream_cover_letter():
+    """
+    Stream a cover letter as server-sent events.
+
+    Events: "meta" (extraction and context stats), unnamed {"delta": text} events as tokens
+    arrive, then "done" or "error".
+    """
+    inputs, error = _prepare_cover_letter_inputs(request.get_json())
+    if error:
+        return error
+
+    def generate():
+        yield _sse_event({'extraction': inputs['extraction'], 'context': inputs['context']}, event='meta')
+        try:
+            for delta in JobDescriptionParser.stream_cover_letter(
+                inputs['job_description'], inputs['cv_text'], inputs['additional_docs']
+            ):
+                yield _sse_event({'delta': delta})
+        except (LLMStreamError, EnvironmentError, ValueError) as e:
+            yield _sse_event({'error': str(e)}, event='error')
+            return
+        except Exception as e:
+            current_app.logger.exception("Cover letter stream failed")
+            yield _sse_event({'error': f'Exception during LLM API call: {e}'}, event='error')
+            return
+        yield _sse_event({}, event='done')
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        # Stop proxies (e.g. nginx) from buffering the stream
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
@@ -1,5 +1,7 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, send_from_directory, current_app
 import os
+from job_tracker.utils.document_text import cache_document_text, extraction_options
+from job_tracker.utils.task_queue import task_queue
 
 cv_bp = Blueprint('cv', __name__)
 
@@ -23,7 +25,12 @@ def upload_cv():
         return redirect(url_for('main.dashboard'))
     if file and allowed_file(file.filename):
         filename = 'cv.' + file.filename.rsplit('.', 1)[1].lower()
-        file.save(os.path.join(UPLOAD_FOLDER, filename))
+        path = os.path.join(UPLOAD_FOLDER, filename)
+        file.save(path)
+        # Extract once now so cover letter generation reads cached text
+        cache_document_text(path, **extraction_options(current_app.config))
+        # Every job's match score depends on the CV
+        task_queue.enqueue('score_jobs')
         flash('CV uploaded successfully!', 'success')
         return redirect(url_for('main.dashboard'))
     else:
@@ -1,5 +1,6 @@
 from flask import Blueprint, request, redirect, url_for, flash, send_from_directory, jsonify, current_app
 import os
+from job_tracker.utils.document_text import cache_document_text, extraction_options, invalidate_document_text
 
 # Set up directories
 BASE_UPLOAD = os.path.join(os.path.dirname(os.path.dirname(__file__)), '..', 'uploads')
@@ -27,7 +28,10 @@ def upload_document(doc_type):
     if file and allowed_file(file.filename):
         save_dir = COVER_LETTERS_DIR if doc_type == 'cover_letter' else OTHER_DOCS_DIR
         filename = file.filename
-        file.save(os.path.join(save_dir, filename))
+        path = os.path.join(save_dir, filename)
+        file.save(path)
+        # Extract once now so cover letter generation reads cached text
+        cache_document_text(path, **extraction_options(current_app.config))
         flash(f'{doc_type.replace("_", " ").title()} uploaded successfully!', 'success')
     else:
         flash('Invalid file type.', 'danger')
@@ -49,7 +53,9 @@ def download_document(doc_type, filename):
 def delete_document(doc_type, filename):
     dir_path = COVER_LETTERS_DIR if doc_type == 'cover_letter' else OTHER_DOCS_DIR
     try:
-        os.remove(os.path.join(dir_path, filename))
+        path = os.path.join(dir_path, filename)
+        os.remove(path)
+        invalidate_document_text(path)
         return jsonify({'success': True})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
@@ -1,22 +1,219 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash
-from job_tracker.models import Job, Note, Contact
+from flask import Blueprint, render_template, request, redirect, url_for, flash, current_app
+from sqlalchemy import tuple_
+from sqlalchemy.orm import load_only
+from werkzeug.utils import secure_filename
+from job_tracker.models import Job, JobSkill, Note, Contact, POSTING_GROUP
 from job_tracker import db
+from job_tracker.utils.bulk_import import IMPORT_FORMATS, detect_format
+from job_tracker.utils.company_enrichment import link_company_source
+from job_tracker.utils.http_cache import cached_fragment, conditional_response, last_modified, page_version
+from job_tracker.utils.job_sections import SENIORITY_LEVELS, detect_seniority, load_parsed_data, normalize_skill
+from job_tracker.utils.near_duplicates import (
+    duplicate_warning,
+    find_duplicate_groups,
+    find_near_duplicates,
+    minhash_signature,
+    store_signature,
+)
+from job_tracker.utils.search_index import search_jobs
+from job_tracker.utils.stats_cache import invalidate_status_histogram
+from job_tracker.utils.task_queue import task_queue
 from datetime import datetime
-import json
+import base64
+import os
 
 job_bp = Blueprint('job', __name__)
 
+# Columns rendered by jobs/list.html; everything else stays in the database
+JOB_LIST_COLUMNS = (
+    Job.id, Job.title, Job.company, Job.location,
+    Job.status, Job.date_added, Job.date_applied, Job.match_score
+)
+# Orders of the job list (always descending, ties broken by id): sort column, how a cursor
+# stores its value and whether the column can be NULL (those jobs are listed last, newest first;
+# date_added is NULL on legacy rows and rows inserted outside the ORM).
+# repr() round-trips floats exactly, which keyset comparisons need.
+JOB_SORTS = {
+    'date': (Job.date_added, datetime.isoformat, datetime.fromisoformat, True),
+    'match': (Job.match_score, repr, float, True),
+}
+MAX_JOBS_PER_PAGE = 200
+IMPORT_FOLDER = os.path.join(os.path.dirname(os.path.dirname(__file__)), '..', 'uploads', 'imports')
+
+
+def _encode_cursor(job, sort='date'):
+    """
+    Encode the keyset position of a job as an opaque URL-safe token.
+    
+    Args:
+        job: Job object (only the sort column and id are used)
+        sort: Key of JOB_SORTS the list is ordered by
+        
+    Returns:
+        Cursor string
+    """
+    column, encode = JOB_SORTS[sort][:2]
+    value = getattr(job, column.key)
+    # An empty value marks a job in the trailing NULL part of the order
+    raw = f"{encode(value) if value is not None else ''}|{job.id}"
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(token, sort='date'):
+    """
+    Decode a cursor produced by _encode_cursor.
+    
+    Args:
+        token: Cursor string from the query string
+        sort: Key of JOB_SORTS the cursor was encoded for
+        
+    Returns:
+        Tuple of (sort value, id) or None if the cursor is missing or invalid; the sort
+        value is None for positions among the jobs whose sort column is NULL
+    """
+    if not token:
+        return None
+        
+    _, _, decode, nullable = JOB_SORTS[sort]
+    try:
+        raw = base64.urlsafe_b64decode(token.encode('ascii')).decode('utf-8')
+        value_part, id_part = raw.split('|', 1)
+        if not value_part:
+            return (None, int(id_part)) if nullable else None
+        return decode(value_part), int(id_part)
+    except (ValueError, UnicodeError):
+        return None
+
+
+def _get_per_page():
+    """Read the requested page size, falling back to the configured default."""
+    default = current_app.config.get('JOBS_PER_PAGE', 50)
+    per_page = request.args.get('per_page', default, type=int)
+    return max(1, min(per_page, MAX_JOBS_PER_PAGE))
+
+
+def _paginate_jobs(query, per_page, after=None, before=None, sort='date'):
+    """
+    Fetch one page of jobs ordered by (sort column, id) descending using keyset cursors.
+    
+    Jobs whose sort column is NULL (unscored jobs, or legacy jobs without date_added) come last, newest first.
+    They are read in a second keyset phase on id, so each phase stays a range scan of its index.
+    
+    Args:
+        query: Base Job query (filters applied, no ordering)
+        per_page: Number of jobs per page
+        after: Decoded cursor; return jobs that sort after this position
+        before: Decoded cursor; return jobs that sort before this position
+        sort: Key of JOB_SORTS
+        
+    Returns:
+        Tuple of (jobs, next_cursor, prev_cursor)
+    """
+    column, _, _, nullable = JOB_SORTS[sort]
+    position = tuple_(column, Job.id)
+    valued = query.filter(column.isnot(None))
+    nulls = query.filter(column.is_(None))
+    
+    if before:
+        # Walk backwards from the cursor (NULL part first), then restore display order
+        rows = []
+        if before[0] is None:
+            rows = nulls.filter(Job.id > before[1]).order_by(Job.id.asc()).limit(per_page + 1).all()
+        if len(rows) <= per_page:
+            if before[0] is not None:
+                valued = valued.filter(position > before)
+            rows += (valued.order_by(column.asc(), Job.id.asc())
+                     .limit(per_page + 1 - len(rows)).all())
+        has_more = len(rows) > per_page
+        jobs = list(reversed(rows[:per_page]))
+        has_next, has_prev = True, has_more
+    else:
+        rows = []
+        if not after or after[0] is not None:
+            if after:
+                valued = valued.filter(position < after)
+            rows = (valued.order_by(column.desc(), Job.id.desc())
+                    .limit(per_page + 1).all())
+        if nullable and len(rows) <= per_page:
+            if after and after[0] is None:
+                nulls = nulls.filter(Job.id < after[1])
+            rows += nulls.order_by(Job.id.desc()).limit(per_page + 1 - len(rows)).all()
+        jobs = rows[:per_page]
+        has_next, has_prev = len(rows) > per_page, after is not None
+    
+    next_cursor = _encode_cursor(jobs[-1], sort) if jobs and has_next else None
+    prev_cursor = _encode_cursor(jobs[0], sort) if jobs and has_prev else None
+    return jobs, next_cursor, prev_cursor
+
+
 @job_bp.route('/jobs')
 def list_jobs():
-    """List all jobs."""
+    """List jobs one page at a time."""
     status_filter = request.args.get('status', None)
+    skill_filter = request.args.get('skill', '').strip()
+    seniority_filter = request.args.get('seniority', '').strip()
+    sort = request.args.get('sort', 'date')
+    if sort not in JOB_SORTS:
+        sort = 'date'
+    per_page = _get_per_page()
     
+    query = Job.query.options(load_only(*JOB_LIST_COLUMNS))
     if status_filter and status_filter != 'All':
-        jobs = Job.query.filter_by(status=status_filter).order_by(Job.date_added.desc()).all()
-    else:
-        jobs = Job.query.order_by(Job.date_added.desc()).all()
+        query = query.filter(Job.status == status_filter)
+    if skill_filter:
+        # IN (not EXISTS) so SQLite reads the matching ids from the (normalized, job_id) index
+        # instead of probing it for every job in date order
+        query = query.filter(Job.id.in_(
+            db.select(JobSkill.job_id).where(JobSkill.normalized == normalize_skill(skill_filter))
+        ))
+    if seniority_filter:
+        query = query.filter(Job.seniority == seniority_filter)
+    
+    jobs, next_cursor, prev_cursor = _paginate_jobs(
+        query,
+        per_page,
+        after=_decode_cursor(request.args.get('after'), sort),
+        before=_decode_cursor(request.args.get('before'), sort),
+        sort=sort
+    )
     
-    return render_template('jobs/list.html', jobs=jobs, current_status=status_filter or 'All')
+    return render_template(
+        'jobs/list.html',
+        jobs=jobs,
+        current_status=status_filter or 'All',
+        skill=skill_filter,
+        seniority=seniority_filter,
+        seniority_levels=SENIORITY_LEVELS,
+        sort=sort,
+        per_page=per_page,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor
+    )
+
+@job_bp.route('/jobs/search')
+def search():
+    """Full-text search over jobs, their parsed sections, notes and contacts, best matches first."""
+    query = request.args.get('q', '').strip()
+    per_page = _get_per_page()
+    page = max(1, request.args.get('page', 1, type=int))
+    
+    results, total = search_jobs(db.session, query, limit=per_page, offset=(page - 1) * per_page) if query else ([], 0)
+    
+    return render_template(
+        'jobs/search.html',
+        query=query,
+        results=results,
+        total=total,
+        page=page,
+        per_page=per_page,
+        has_next=page * per_page < total
+    )
+
+@job_bp.route('/jobs/duplicates')
+def duplicates():
+    """Report groups of jobs whose descriptions are near-duplicates of each other."""
+    threshold = current_app.config['DUPLICATE_THRESHOLD']
+    return render_template('jobs/duplicates.html', groups=find_duplicate_groups(threshold), threshold=threshold)
 
 @job_bp.route('/jobs/add', methods=['GET', 'POST'])
 def add_job():
@@ -35,6 +232,9 @@ def add_job():
             flash('Job title and company are required!', 'danger')
             return redirect(url_for('job_bp.add_job'))
         
+        signature = minhash_signature(description)
+        duplicates = find_near_duplicates(signature)
+        
         job_instance = Job(
             title=title,
             company=company,
@@ -53,122 +253,57 @@ def add_job():
             if date_applied:
                 job_instance.date_applied = datetime.strptime(date_applied, '%Y-%m-%d')
         
+        store_signature(job_instance, signature)
+        link_company_source(job_instance)
         db.session.add(job_instance)
         db.session.commit()
+        invalidate_status_histogram()
         
         flash('Job added successfully!', 'success')
+        if warning := duplicate_warning(duplicates):
+            flash(warning, 'warning')
         return redirect(url_for('job_bp.view_job', job_id=job_instance.id))
     
     return render_template('jobs/add.html')
 
-
-def _parse_job_data(job_data):
-    """
-    Parse JSON string into Python dictionary.
-    
-    Args:
-        job_data: JSON string to parse
-        
-    Returns:
-        Parsed dictionary or None if parsing fails
-    """
-    if not job_data:
-        return None
+@job_bp.route('/jobs/import', methods=['GET', 'POST'])
+def bulk_import():
+    """Import many jobs at once from a CSV/JSONL upload or a list of URLs."""
+    if request.method == 'POST':
+        upload = request.files.get('import_file')
+        job_urls = request.form.get('job_urls', '')
+        fmt = request.form.get('format') or None
+        parse = request.form.get('parse') == 'on'
         
-    try:
-        return json.loads(job_data)
-    except (json.JSONDecodeError, TypeError):
-        return None
-
-
-def _clean_text_content(content):
-    """
-    Clean text content by removing artifacts and excessive whitespace.
-    
-    Args:
-        content: String content to clean
+        if fmt and fmt not in IMPORT_FORMATS:
+            flash('Unknown import format.', 'danger')
+            return redirect(url_for('job.bulk_import'))
         
-    Returns:
-        Cleaned string content
-    """
-    if not isinstance(content, str):
-        return content
+        os.makedirs(IMPORT_FOLDER, exist_ok=True)
+        stamp = datetime.utcnow().strftime('%Y%m%d%H%M%S%f')
         
-    # Clean excessive whitespace and newlines
-    content = content.strip()
-    content = content.replace('\n\n\n', '\n').replace('\n\n', '\n')
-    
-    # Remove "show more/less" text and similar artifacts
-    artifacts = ['show more', 'show less', 'Show more', 'Show less', '...']
-    for artifact in artifacts:
-        content = content.replace(artifact, '')
+        if upload and upload.filename:
+            filename = secure_filename(upload.filename) or 'import.txt'
+            path = os.path.join(IMPORT_FOLDER, f'{stamp}_{filename}')
+            upload.save(path)
+            fmt = fmt or detect_format(filename)
+        elif job_urls.strip():
+            path = os.path.join(IMPORT_FOLDER, f'{stamp}_urls.txt')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(job_urls)
+            fmt = 'urls'
+        else:
+            flash('Please upload a file or paste some job URLs.', 'danger')
+            return redirect(url_for('job.bulk_import'))
         
-    return content
-
-
-def _clean_list_items(items):
-    """
-    Clean a list of text items.
+        # The import itself runs on the background task queue
+        task = task_queue.enqueue('bulk_import', path=os.path.abspath(path), fmt=fmt, parse=parse)
+        flash('Import started. Progress is shown below.', 'info')
+        return redirect(url_for('job.bulk_import', task_id=task.id))
     
-    Args:
-        items: List of string items to clean
-        
-    Returns:
-        List of cleaned string items
-    """
-    cleaned_items = []
-    
-    for item in items:
-        if isinstance(item, str) and (clean_item := _clean_text_content(item)):
-            cleaned_items.append(clean_item)
-            
-    return cleaned_items
-
-
-def _process_parsed_sections(sections):
-    """
-    Process and clean sections from parsed job data.
-    
-    Args:
-        sections: List of section dictionaries
-        
-    Returns:
-        Processed sections with cleaned content
-    """
-    if not sections:
-        return sections
-        
-    for section in sections:
-        if section['type'] == 'paragraph' and isinstance(section['content'], str):
-            section['content'] = _clean_text_content(section['content'])
-        elif section['type'] == 'list' and isinstance(section['content'], list):
-            section['content'] = _clean_list_items(section['content'])
-            
-    return sections
+    return render_template('jobs/import.html', task_id=request.args.get('task_id', type=int))
 
 
-def _prepare_job_parsed_data(job):
-    """
-    Process and prepare job's parsed data for display.
-    
-    Args:
-        job: Job object with potential parsed_data
-        
-    Returns:
-        Job object with processed parsed_data
-    """
-    # Skip processing if no parsed data exists
-    if not (parsed_data := _parse_job_data(job.parsed_data)):
-        return job
-        
-    job.parsed_data = parsed_data
-    
-    # Process sections if they exist
-    if 'sections' in parsed_data:
-        job.parsed_data['sections'] = _process_parsed_sections(parsed_data['sections'])
-        
-    return job
-
 def _get_job_related_data(job_id):
     """
     Fetch notes and contacts related to a specific job.
@@ -189,36 +324,48 @@ def view_job(job_id):
     View a specific job with its notes and contacts.
     
     Retrieves job details, associated notes and contacts, and processes
-    any parsed job description data for display.
+    any parsed job description data for display. The page is versioned by
+    job.updated_at: a client holding the current version gets a 304, and the
+    description tabs are rendered once per version.
     
     Args:
         job_id: ID of the job to view
         
     Returns:
-        Rendered template with job, notes, and contacts
+        Rendered template with job, notes, and contacts (or 304 Not Modified)
     """
-    # Get job by ID and process its parsed data in one step
+    # The description/parsed_data blobs stay deferred; they are only loaded when the fragment is rendered
     job = Job.query.get_or_404(job_id)
-        
-    # Get related data
-    notes, contacts = _get_job_related_data(job_id)
-    
-    # Process any parsed data the job might have
-    job = _prepare_job_parsed_data(job)
-    
-    return render_template(
-        'jobs/view_with_tabs.html', 
-        job=job, 
-        notes=notes, 
-        contacts=contacts
-    )
+    version = page_version('job', job.id, job.updated_at)
+
+    def render():
+        # Get related data
+        notes, contacts = _get_job_related_data(job_id)
+
+        # Sections were cleaned when parsed_data was stored, so this only decodes the JSON
+        description_html = cached_fragment(f'job-description:{version}', lambda: render_template(
+            'jobs/_description_tabs.html',
+            job=job,
+            parsed_data=load_parsed_data(job.parsed_data)
+        ))
+
+        return render_template(
+            'jobs/view_with_tabs.html', 
+            job=job, 
+            description_html=description_html,
+            notes=notes, 
+            contacts=contacts
+        )
+
+    return conditional_response(version, last_modified(job.updated_at), render)
 
 @job_bp.route('/jobs/<int:job_id>/edit', methods=['GET', 'POST'])
 def edit_job(job_id):
     """Edit a job."""
-    job_instance = Job.query.get_or_404(job_id)
+    job_instance = Job.query.options(db.undefer_group(POSTING_GROUP)).get_or_404(job_id)
     
     if request.method == 'POST':
+        old_description = job_instance.description
         job_instance.title = request.form.get('title')
         job_instance.company = request.form.get('company')
         job_instance.location = request.form.get('location')
@@ -239,7 +386,17 @@ def edit_job(job_id):
         if date_applied:
             job_instance.date_applied = datetime.strptime(date_applied, '%Y-%m-%d')
         
+        # Seniority follows the title; skills only change when the description is parsed again
+        parsed_data = load_parsed_data(job_instance.parsed_data) or {}
+        job_instance.seniority = detect_seniority(job_instance.title, parsed_data.get('sections'))
+        
+        if job_instance.description != old_description:
+            store_signature(job_instance, minhash_signature(job_instance.description))
+        
+        # The company may have been renamed
+        link_company_source(job_instance)
         db.session.commit()
+        invalidate_status_histogram()
         flash('Job updated successfully!', 'success')
         return redirect(url_for('job_bp.view_job', job_id=job_instance.id))
     
@@ -252,6 +409,7 @@ def delete_job(job_id):
     
     db.session.delete(job_instance)
     db.session.commit()
+    invalidate_status_histogram()
     
     flash('Job deleted successfully!', 'success')
     return redirect(url_for('main.dashboard'))
@@ -265,6 +423,8 @@ def add_note(job_id):
     if note_content:
         note = Note(content=note_content, job_id=job_instance.id)
         db.session.add(note)
+        # Notes are shown on the job page, so they change its version
+        job_instance.updated_at = datetime.utcnow()
         db.session.commit()
         flash('Note added successfully!', 'success')
     
@@ -293,6 +453,7 @@ def add_contact(job_id):
             job_id=job_instance.id
         )
         db.session.add(contact)
+        job_instance.updated_at = datetime.utcnow()
         db.session.commit()
         flash('Contact added successfully!', 'success')
     
@@ -311,6 +472,7 @@ def update_status(job_id):
             
         job_instance.status = new_status
         db.session.commit()
+        invalidate_status_histogram()
         flash(f'Status updated to {new_status}!', 'success')
     
     return redirect(request.referrer or url_for('main.dashboard'))
@@ -8,6 +8,7 @@ from job_tracker import db
 from job_tracker.routes.cv_routes import cv_bp
 from job_tracker.routes.cover_letter_routes import cover_letter_bp
 from job_tracker.routes.document_routes import document_bp
+from job_tracker.utils.stats_cache import get_status_histogram, INTERVIEW_STATUSES
 import os
 
 main_bp = Blueprint('main', __name__)
@@ -20,15 +21,12 @@ def index():
 @main_bp.route('/dashboard')
 def dashboard():
     """Dashboard with statistics and overview."""
-    total_jobs = Job.query.count()
-    applied_jobs = Job.query.filter_by(status='Applied').count()
-    interview_jobs = Job.query.filter(
-        (Job.status == 'Phone Interview') | 
-        (Job.status == 'Technical Interview') | 
-        (Job.status == 'Onsite Interview')
-    ).count()
-    offers = Job.query.filter_by(status='Offer').count()
-    rejected = Job.query.filter_by(status='Rejected').count()
+    histogram = get_status_histogram()
+    total_jobs = sum(histogram.values())
+    applied_jobs = histogram.get('Applied', 0)
+    interview_jobs = sum(histogram.get(status, 0) for status in INTERVIEW_STATUSES)
+    offers = histogram.get('Offer', 0)
+    rejected = histogram.get('Rejected', 0)
     
     status_data = {
         'labels': ['Applied', 'Interview', 'Offer', 'Rejected', 'Saved'],
@@ -0,0 +1,32 @@
+"""
+Prometheus metrics endpoint and per-request latency recording.
+"""
+
+import time
+from flask import Blueprint, Response, g, request
+from job_tracker.utils.metrics import HTTP_REQUEST_SECONDS, registry
+
+metrics_bp = Blueprint('metrics', __name__)
+
+
+@metrics_bp.before_app_request
+def _start_request_timer():
+    g.request_started = time.perf_counter()
+
+
+@metrics_bp.after_app_request
+def _record_request_latency(response):
+    if (started := g.pop('request_started', None)) is not None:
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - started,
+            endpoint=request.endpoint or 'unknown',
+            method=request.method,
+            status=response.status_code
+        )
+    return response
+
+
+@metrics_bp.route('/metrics')
+def metrics():
+    """Expose counters and latency histograms in the Prometheus text format."""
+    return Response(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -1,16 +1,22 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
 from job_tracker.models import Job, Note
 from job_tracker import db
+from job_tracker.utils.company_enrichment import link_company_source
 from job_tracker.utils.llm_parser import JobDescriptionParser
+from job_tracker.utils.near_duplicates import duplicate_warning, find_near_duplicates, minhash_signature, store_signature
+from job_tracker.utils.stats_cache import invalidate_status_histogram
+from job_tracker.utils.task_queue import task_queue
 import requests
 from bs4 import BeautifulSoup
 import re
 from datetime import datetime
 import html2text
 import json
+import logging
 import os
 
 parser_bp = Blueprint('parser', __name__)
+logger = logging.getLogger(__name__)
 
 @parser_bp.route('/parse/url', methods=['GET', 'POST'])
 def parse_url():
@@ -90,13 +96,11 @@ def confirm_parsed_job():
         flash('Job title and company are required!', 'danger')
         return redirect(url_for('job.add_job'))
     
-    # Parse job description using LLM to extract structured data
-    parsed_data = {}
-    if description:
-        parser_instance = JobDescriptionParser()
-        parsed_data = parser_instance.parse_description(description)
+    # The same posting pasted as text or found on another board has a different URL, so compare descriptions
+    signature = minhash_signature(description)
+    duplicates = find_near_duplicates(signature)
     
-    # Create job
+    # Create job; the description is parsed by a background task
     job = Job(
         title=title,
         company=company,
@@ -107,13 +111,22 @@ def confirm_parsed_job():
         job_type=job_type,
         status='Saved',
         date_added=datetime.utcnow(),
-        parsed_data=json.dumps(parsed_data)
+        parsed_data=json.dumps({})
     )
     
+    store_signature(job, signature)
+    link_company_source(job)
     db.session.add(job)
     db.session.commit()
+    invalidate_status_histogram()
+    
+    # Parse job description using LLM to extract structured data
+    if description:
+        task_queue.enqueue('parse_job', job_id=job.id)
     
     flash('Job added successfully!', 'success')
+    if warning := duplicate_warning(duplicates):
+        flash(warning, 'warning')
     return redirect(url_for('job.view_job', job_id=job.id))
 
 def extract_from_linkedin(url):
@@ -162,8 +175,8 @@ def extract_from_linkedin(url):
             'salary': salary,
             'job_type': job_type
         }
-    except Exception as e:
-        print(f"LinkedIn extraction error: {str(e)}")
+    except Exception:
+        logger.exception("LinkedIn extraction error", extra={"url": url})
         return None
 
 def extract_from_text(text):
@@ -0,0 +1,59 @@
+"""
+Routes for polling background task status.
+"""
+
+from flask import Blueprint, jsonify
+import json
+from job_tracker.models import Job, Task
+
+task_bp = Blueprint('task', __name__)
+
+
+def _task_to_dict(task):
+    """
+    Serialize a task for the JSON status endpoints.
+
+    Args:
+        task: Task object
+
+    Returns:
+        Dictionary with the task's state and decoded result
+    """
+    result = None
+    if task.result:
+        try:
+            result = json.loads(task.result)
+        except json.JSONDecodeError:
+            result = None
+
+    return {
+        'id': task.id,
+        'task_type': task.task_type,
+        'status': task.status,
+        'job_id': task.job_id,
+        'result': result,
+        'error': task.error,
+        'attempts': task.attempts,
+        'created_at': task.created_at.isoformat() if task.created_at else None,
+        'finished_at': task.finished_at.isoformat() if task.finished_at else None
+    }
+
+
+@task_bp.route('/<int:task_id>')
+def get_task(task_id):
+    """API endpoint returning the status of a single background task."""
+    task = Task.query.get_or_404(task_id)
+    return jsonify(_task_to_dict(task))
+
+
+@task_bp.route('/job/<int:job_id>')
+def get_job_tasks(job_id):
+    """API endpoint returning a job's processing state and its most recent tasks."""
+    job = Job.query.get_or_404(job_id)
+    tasks = Task.query.filter_by(job_id=job_id).order_by(Task.created_at.desc()).limit(10).all()
+
+    return jsonify({
+        'job_id': job.id,
+        'processing_status': job.processing_status or 'ready',
+        'tasks': [_task_to_dict(task) for task in tasks]
+    })
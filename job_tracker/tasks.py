@@ -0,0 +1,88 @@
+"""
+Background task handlers.
+Each handler is registered on the shared task queue and runs in a worker thread with its own
+application context; session changes are committed by the queue together with the task status
+(enrich_company commits its URL discovery early, see there).
+"""
+
+import os
+from flask import current_app
+from job_tracker import db
+from job_tracker.models import Job, POSTING_GROUP
+from job_tracker.utils.company_enrichment import (
+    link_company_source,
+    discover_company_urls,
+    refresh_company_data,
+)
+from job_tracker.utils.bulk_import import import_file
+from job_tracker.utils.job_sections import store_parsed_data
+from job_tracker.utils.llm_parser import JobDescriptionParser
+from job_tracker.utils.match_scoring import update_match_scores
+from job_tracker.utils.task_queue import task_queue
+
+
+@task_queue.handler('parse_job')
+def parse_job(task, payload):
+    """Parse a job's description with the LLM and store the structured sections."""
+    job = Job.query.options(db.undefer_group(POSTING_GROUP)).get(task.job_id)
+    if job is None:
+        return {'skipped': 'job no longer exists'}
+
+    parsed_data = JobDescriptionParser.parse_description(job.description or '')
+    store_parsed_data(job, parsed_data)
+    # The skills just changed, so only this job's score needs recomputing
+    db.session.flush()
+    update_match_scores([job.id])
+    return {'parsing_method': parsed_data.get('metadata', {}).get('parsing_method')}
+
+
+@task_queue.handler('score_jobs')
+def score_jobs(task, payload):
+    """Recompute every job's CV match score (after the CV changed)."""
+    return {'changed': update_match_scores()}
+
+
+@task_queue.handler('enrich_company')
+def enrich_company(task, payload):
+    """
+    Discover company URLs (when payload['discover'] is set) and fetch the company profile and reviews.
+
+    The results are stored on the job's CompanySource. With payload['only_missing'] set, data the
+    company already has is not fetched again.
+
+    Unlike other handlers this one commits part of its work early: the company link and the
+    discovered URLs (with their discovery timestamps) are committed before the profile fetch. They
+    stay valid if the fetch fails, so a retry does not repeat the searches, and the SQLite write
+    transaction is not held open during the slow LLM calls. Only the fetched profile and reviews
+    are rolled back when the task fails.
+    """
+    job = Job.query.get(task.job_id)
+    if job is None:
+        return {'skipped': 'job no longer exists'}
+
+    company_source = link_company_source(job)
+    discovered_urls = {}
+    if payload.get('discover'):
+        discovered_urls = discover_company_urls(company_source)
+    # Intentional early commit, see the docstring
+    db.session.commit()
+
+    fetched = refresh_company_data(company_source, only_missing=payload.get('only_missing', False))
+    return {'discovered_urls': discovered_urls, **fetched}
+
+
+@task_queue.handler('bulk_import')
+def bulk_import(task, payload):
+    """Import a saved CSV/JSONL/URL-list file and delete it afterwards."""
+    path = payload['path']
+    try:
+        return import_file(
+            path,
+            fmt=payload.get('fmt'),
+            parse=payload.get('parse', True),
+            workers=current_app.config.get('IMPORT_WORKERS', 4),
+            batch_size=current_app.config.get('IMPORT_BATCH_SIZE', 100)
+        )
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,228 @@
+"""
+Bulk job import utilities.
+Streams jobs from CSV, JSONL or plain URL lists, parses descriptions concurrently with a bounded
+worker pool, skips URLs that are already tracked and inserts the rest in batched transactions.
+"""
+
+import csv
+import io
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional
+from job_tracker import db
+from job_tracker.models import Job, JobLSHBand, JobSkill
+from job_tracker.utils.job_sections import detect_seniority, materialize_parsed_data, normalize_skill
+from job_tracker.utils.llm_parser import JobDescriptionParser
+from job_tracker.utils.match_scoring import load_cv_terms, update_match_scores
+from job_tracker.utils.near_duplicates import decode_signature, minhash_signature, signature_rows
+from job_tracker.utils.search_index import index_jobs
+from job_tracker.utils.stats_cache import invalidate_status_histogram
+
+IMPORT_FORMATS = ('csv', 'jsonl', 'urls')
+JOB_FIELDS = ('title', 'company', 'location', 'description', 'url', 'salary', 'job_type', 'status')
+INVALID_LINE = '_invalid_line'  # key of the placeholder record yielded for unreadable input lines
+
+logger = logging.getLogger(__name__)
+
+
+def detect_format(filename: str) -> str:
+    """
+    Guess the import format from a file name.
+
+    Args:
+        filename: Name of the uploaded or local file
+
+    Returns:
+        One of IMPORT_FORMATS ('urls' for anything that is not .csv/.jsonl/.json)
+    """
+    extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    if extension == 'csv':
+        return 'csv'
+    if extension in ('jsonl', 'json', 'ndjson'):
+        return 'jsonl'
+    return 'urls'
+
+
+def iter_records(stream: IO[str], fmt: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily read job records from a text stream.
+
+    Args:
+        stream: Text file object
+        fmt: One of IMPORT_FORMATS
+
+    Yields:
+        Dictionaries with a subset of JOB_FIELDS. A JSONL line that is not valid JSON or not an
+        object yields {INVALID_LINE: line_number} instead, so one bad line does not end the import.
+    """
+    if fmt == 'csv':
+        for row in csv.DictReader(stream):
+            yield {key.strip().lower(): (value or '').strip() for key, value in row.items() if key}
+    elif fmt == 'jsonl':
+        for line_number, line in enumerate(stream, start=1):
+            if not (line := line.strip()):
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning("Skipping line %d of the import: invalid JSON (%s)", line_number, e)
+                yield {INVALID_LINE: line_number}
+                continue
+            if not isinstance(record, dict):
+                logger.warning("Skipping line %d of the import: expected a JSON object", line_number)
+                yield {INVALID_LINE: line_number}
+                continue
+            yield record
+    elif fmt == 'urls':
+        for line in stream:
+            if (line := line.strip()) and not line.startswith('#'):
+                yield {'url': line}
+    else:
+        raise ValueError(f"Unknown import format '{fmt}'. Choose one of: {', '.join(IMPORT_FORMATS)}")
+
+
+def _batched(records: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _prepare_record(record: Dict[str, Any], parse: bool) -> Optional[Dict[str, Any]]:
+    """
+    Turn an input record into Job column values, fetching URL-only records and parsing the description.
+    The extracted skills are returned under 'skills' and stored as JobSkill rows after the insert.
+
+    Runs in a worker thread; must not touch the database session.
+    """
+    values = {field: record.get(field) or None for field in JOB_FIELDS}
+
+    if values['url'] and not values['description']:
+        from job_tracker.routes.parser_routes import extract_from_linkedin
+        scraped = extract_from_linkedin(values['url']) or {}
+        for field, value in scraped.items():
+            if field in values and not values[field]:
+                values[field] = value
+
+    if not values['title'] or not values['company']:
+        return None
+
+    values['status'] = values['status'] or 'Saved'
+    values['date_added'] = datetime.utcnow()
+    values['parsed_data'] = None
+    values['seniority'] = detect_seniority(values['title'], [])
+    values['skills'] = []
+    signature = minhash_signature(values['description'])
+    values['minhash'] = signature.tobytes() if signature is not None else None
+    if parse and values['description']:
+        values.update(materialize_parsed_data(values['title'], JobDescriptionParser.parse_description(values['description'])))
+    return values
+
+
+def import_jobs(records: Iterable[Dict[str, Any]], workers: int = 4, batch_size: int = 100,
+                parse: bool = True) -> Dict[str, Any]:
+    """
+    Import job records into the database. Must be called inside an application context.
+
+    Args:
+        records: Iterable of job dictionaries (see iter_records)
+        workers: Maximum number of records fetched/parsed concurrently
+        batch_size: Number of records per insert transaction
+        parse: Whether to parse descriptions into structured sections
+
+    Returns:
+        Dictionary with read/imported/duplicates/skipped/errors counts, the numbers of the input
+        lines that could not be read (invalid_lines), elapsed seconds and jobs_per_second
+    """
+    stats = {'read': 0, 'imported': 0, 'duplicates': 0, 'skipped': 0, 'errors': 0, 'invalid_lines': []}
+    seen_urls = set()
+    start = time.perf_counter()
+    cv_terms = load_cv_terms()
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='job-import') as executor:
+        for batch in _batched(records, batch_size):
+            stats['read'] += len(batch)
+            invalid = [record[INVALID_LINE] for record in batch if INVALID_LINE in record]
+            if invalid:
+                stats['errors'] += len(invalid)
+                stats['invalid_lines'].extend(invalid)
+                batch = [record for record in batch if INVALID_LINE not in record]
+
+            # Deduplicate on url within the import and against the database with one query per batch
+            batch_urls = {record['url'] for record in batch if record.get('url')}
+            existing = {url for (url,) in db.session.query(Job.url).filter(Job.url.in_(batch_urls)).all()} if batch_urls else set()
+            pending = []
+            for record in batch:
+                url = record.get('url')
+                if url and (url in existing or url in seen_urls):
+                    stats['duplicates'] += 1
+                    continue
+                if url:
+                    seen_urls.add(url)
+                pending.append(record)
+
+            futures = [executor.submit(_prepare_record, record, parse) for record in pending]
+            rows = []
+            for future in futures:
+                try:
+                    values = future.result()
+                except Exception:
+                    stats['errors'] += 1
+                    continue
+                if values is None:
+                    stats['skipped'] += 1
+                else:
+                    rows.append(values)
+
+            if rows:
+                skills = [row.pop('skills') for row in rows]
+                # Core inserts skip the ORM flush events, so index the new jobs for search explicitly
+                job_ids = db.session.scalars(db.insert(Job).returning(Job.id, sort_by_parameter_order=True), rows).all()
+                skill_rows = [
+                    {'job_id': job_id, 'name': skill, 'normalized': normalize_skill(skill)}
+                    for job_id, job_skills in zip(job_ids, skills) for skill in job_skills
+                ]
+                if skill_rows:
+                    db.session.execute(db.insert(JobSkill), skill_rows)
+                band_rows = [
+                    band_row for job_id, row in zip(job_ids, rows)
+                    for band_row in signature_rows(job_id, decode_signature(row['minhash']))
+                ]
+                if band_rows:
+                    db.session.execute(db.insert(JobLSHBand), band_rows)
+                index_jobs(db.session.connection(), job_ids)
+                if cv_terms is not None:
+                    update_match_scores(job_ids, cv_terms)
+                db.session.commit()
+                stats['imported'] += len(rows)
+
+    if stats['imported']:
+        invalidate_status_histogram()
+
+    stats['seconds'] = round(time.perf_counter() - start, 3)
+    stats['jobs_per_second'] = round(stats['imported'] / stats['seconds'], 2) if stats['seconds'] else 0.0
+    return stats
+
+
+def import_file(path: str, fmt: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+    """
+    Stream a CSV/JSONL/URL-list file into the database.
+
+    Args:
+        path: File to import
+        fmt: Import format; detected from the extension when omitted
+        **kwargs: Passed to import_jobs
+
+    Returns:
+        Import statistics (see import_jobs)
+    """
+    fmt = fmt or detect_format(path)
+    with io.open(path, 'r', encoding='utf-8', newline='') as stream:
+        return import_jobs(iter_records(stream, fmt), **kwargs)
@@ -0,0 +1,200 @@
+"""
+Company enrichment helpers.
+Shared by the company routes and the background 'enrich_company' task: URL discovery and the
+structured company profile and reviews, stored once per company on CompanySource.
+"""
+
+import json
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+from flask import current_app
+from job_tracker import db
+from job_tracker.models import Job, CompanySource, ENRICHMENT_GROUP
+from job_tracker.utils.company_names import get_company_name_index, normalize_company_name, register_company_name
+from job_tracker.utils.company_parser import CompanyInfoParser
+from job_tracker.utils.url_discovery import URLDiscovery
+
+DISCOVERY_RETRY_TTL_SECONDS = 15 * 60  # default wait before retrying a discovery whose lookups failed
+
+
+def get_company_source(company_name: str, load_profile: bool = False) -> Optional[CompanySource]:
+    """
+    Return the CompanySource for a company name, if one exists.
+
+    Names are matched by their normalized form first, then by trigram similarity
+    (COMPANY_MATCH_THRESHOLD) so spelling variants resolve to the same source.
+
+    Args:
+        company_name: Company name as entered on a job
+        load_profile: Load the deferred company_data/company_reviews in the same query
+    """
+    query = CompanySource.query
+    if load_profile:
+        query = query.options(db.undefer_group(ENRICHMENT_GROUP))
+
+    normalized_name = normalize_company_name(company_name)
+    company_source = query.filter_by(normalized_name=normalized_name).first()
+    if company_source is not None or not normalized_name:
+        return company_source
+
+    match = get_company_name_index().lookup(normalized_name, current_app.config.get('COMPANY_MATCH_THRESHOLD', 0.7))
+    if match is None:
+        return None
+    # The index may still hold a source whose insert was rolled back
+    return query.get(match[0])
+
+
+def get_or_create_company_source(company_name: str) -> CompanySource:
+    """Return the CompanySource for a company name, adding a new one to the session if needed."""
+    company_source = get_company_source(company_name)
+    if not company_source:
+        company_source = CompanySource(company_name=company_name, normalized_name=normalize_company_name(company_name))
+        db.session.add(company_source)
+        db.session.flush()
+        register_company_name(company_source.id, company_source.normalized_name)
+    return company_source
+
+
+def link_company_source(job: Job) -> CompanySource:
+    """Point a job at the CompanySource for its company, creating the source if needed (not committed)."""
+    company_source = get_or_create_company_source(job.company)
+    job.company_source = company_source
+    return company_source
+
+
+def company_source_for_job(job: Job, load_profile: bool = False) -> Optional[CompanySource]:
+    """
+    Return the CompanySource a job belongs to without writing anything.
+
+    Uses the job's link (refreshed whenever the company name is edited) and falls back to a
+    lookup by name for unlinked jobs, e.g. bulk imports.
+    """
+    if job.company_source_id is not None:
+        query = CompanySource.query
+        if load_profile:
+            query = query.options(db.undefer_group(ENRICHMENT_GROUP))
+        company_source = query.get(job.company_source_id)
+        if company_source is not None:
+            return company_source
+    return get_company_source(job.company, load_profile=load_profile)
+
+
+def company_profile(job: Job, company_source: Optional[CompanySource]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Return the (company_data, company_reviews) JSON strings for a job.
+
+    The shared CompanySource copy wins; the job's legacy columns are used for rows that were
+    enriched before the data moved to the company level and have not been migrated.
+    """
+    company_data = company_source.company_data if company_source else None
+    company_reviews = company_source.company_reviews if company_source else None
+    return company_data or job.company_data, company_reviews or job.company_reviews
+
+
+def has_source_urls(company_source: Optional[CompanySource]) -> bool:
+    """Return True if the source has at least one website, LinkedIn or Glassdoor URL."""
+    return bool(company_source and (
+        company_source.website_url or company_source.linkedin_url or company_source.glassdoor_url
+    ))
+
+
+def needs_url_discovery(company_source: Optional[CompanySource], ttl: int, negative_ttl: int,
+                        retry_ttl: int = DISCOVERY_RETRY_TTL_SECONDS, now: Optional[datetime] = None) -> bool:
+    """
+    Decide whether automatic URL discovery should run for a company.
+
+    A previous discovery is reused while it is younger than `ttl` seconds, or `negative_ttl`
+    seconds if it found nothing, or `retry_ttl` seconds if a lookup failed (network error or
+    deadline). Sources that were never discovered only need it when they have no URLs at all,
+    and sources with all three URLs never do.
+
+    Args:
+        company_source: CompanySource for the company, if any
+        ttl: Seconds a successful discovery is reused
+        negative_ttl: Seconds a discovery that found nothing is reused
+        retry_ttl: Seconds before a discovery with failed lookups is retried
+        now: Current UTC time (defaults to datetime.utcnow())
+
+    Returns:
+        True if discovery should be scheduled
+    """
+    if company_source is None:
+        return True
+    if company_source.website_url and company_source.linkedin_url and company_source.glassdoor_url:
+        return False
+    if company_source.discovered_at is None:
+        return not has_source_urls(company_source)
+
+    if company_source.discovery_hit is None:
+        max_age = retry_ttl
+    else:
+        max_age = ttl if company_source.discovery_hit else negative_ttl
+    return (now or datetime.utcnow()) - company_source.discovered_at >= timedelta(seconds=max_age)
+
+
+def discover_company_urls(company_source: CompanySource) -> Dict[str, Optional[str]]:
+    """
+    Discover URLs for a company and fill in any the source is missing.
+
+    The attempt is recorded on the source (discovered_at, discovery_hit) so misses are
+    cached too. If any lookup failed or timed out, discovery_hit is left as None so the
+    attempt is retried after the short retry TTL instead of being cached as a miss.
+
+    Args:
+        company_source: CompanySource to update (not committed)
+
+    Returns:
+        Dictionary with the discovered URLs
+    """
+    discovered_urls, failed = URLDiscovery.discover(company_source.company_name)
+    company_source.discovered_at = datetime.utcnow()
+    company_source.discovery_hit = None if failed else any(discovered_urls.values())
+
+    if discovered_urls.get('website_url') and not company_source.website_url:
+        company_source.website_url = discovered_urls.get('website_url')
+
+    if discovered_urls.get('linkedin_url') and not company_source.linkedin_url:
+        company_source.linkedin_url = discovered_urls.get('linkedin_url')
+
+    if discovered_urls.get('glassdoor_url') and not company_source.glassdoor_url:
+        company_source.glassdoor_url = discovered_urls.get('glassdoor_url')
+
+    return discovered_urls
+
+
+def refresh_company_data(company_source: CompanySource, only_missing: bool = False) -> Dict[str, bool]:
+    """
+    Fetch the company profile and reviews from the source's URLs.
+
+    The results are stored on the source, so every job at the company shares one fetch.
+
+    Args:
+        company_source: CompanySource providing the URLs and storing the results (not committed)
+        only_missing: Skip fetches for data the source already has
+
+    Returns:
+        Dictionary telling which of company_data/company_reviews were fetched
+    """
+    fetched = {'company_data': False, 'company_reviews': False}
+
+    if (company_source.website_url or company_source.linkedin_url) and not (only_missing and company_source.company_data):
+        company_data = CompanyInfoParser.fetch_company_data(
+            company_source.company_name,
+            website_url=company_source.website_url,
+            linkedin_url=company_source.linkedin_url
+        )
+        company_source.company_data = json.dumps(company_data)
+        fetched['company_data'] = True
+
+    if company_source.glassdoor_url and not (only_missing and company_source.company_reviews):
+        company_reviews = CompanyInfoParser.fetch_company_reviews(
+            company_source.company_name,
+            glassdoor_url=company_source.glassdoor_url
+        )
+        company_source.company_reviews = json.dumps(company_reviews)
+        fetched['company_reviews'] = True
+
+    if fetched['company_data'] or fetched['company_reviews']:
+        company_source.enriched_at = datetime.utcnow()
+
+    return fetched
@@ -0,0 +1,127 @@
+"""
+Company name normalization and fuzzy matching.
+CompanySource rows are keyed by the normalized name, and a trigram index over those names lets
+spelling variants ("Google", "Google LLC", "google inc.") share one source, its URLs and its enrichment.
+"""
+
+import re
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Set, Tuple
+from flask import current_app
+from job_tracker import db
+from job_tracker.models import CompanySource
+
+# Trailing tokens dropped from names (after punctuation is removed, so "S.A." is "sa")
+LEGAL_SUFFIXES = frozenset("""
+inc incorporated corp corporation co company llc llp lp ltd limited plc gmbh mbh ag kg se sa sas sarl srl spa
+bv nv oy ab as pty pte pvt kk
+""".split())
+
+JOINING_PUNCTUATION = re.compile(r"[.'’]")
+OTHER_PUNCTUATION = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_company_name(name: str) -> str:
+    """
+    Reduce a company name to its lookup key.
+
+    Accents are stripped, case is folded, "&" becomes "and", punctuation is removed and
+    trailing legal suffixes (Inc, LLC, Ltd, GmbH, ...) are dropped, so "Google LLC" and
+    "google inc." both normalize to "google".
+    """
+    text = unicodedata.normalize('NFKD', name or '').encode('ascii', 'ignore').decode('ascii')
+    text = JOINING_PUNCTUATION.sub('', text.casefold().replace('&', ' and '))
+    tokens = OTHER_PUNCTUATION.sub(' ', text).split()
+    while len(tokens) > 1 and tokens[-1] in LEGAL_SUFFIXES:
+        tokens.pop()
+    return ' '.join(tokens)
+
+
+def trigrams(normalized_name: str) -> Set[str]:
+    """Character trigrams of a normalized name, padded so short names and word starts count."""
+    padded = f'  {normalized_name} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CompanyNameIndex:
+    """Inverted trigram index over normalized company names for fuzzy lookups."""
+
+    def __init__(self, entries: Iterable[Tuple[int, str]] = ()):
+        self.postings: Dict[str, Set[int]] = defaultdict(set)
+        self.sizes: Dict[int, int] = {}
+        for source_id, normalized_name in entries:
+            self.add(source_id, normalized_name)
+
+    def add(self, source_id: int, normalized_name: str) -> None:
+        """Index a company source under its normalized name."""
+        grams = trigrams(normalized_name)
+        for gram in grams:
+            self.postings[gram].add(source_id)
+        self.sizes[source_id] = len(grams)
+
+    def lookup(self, normalized_name: str, min_similarity: float) -> Optional[Tuple[int, float]]:
+        """
+        Find the indexed name most similar to a normalized name.
+
+        Similarity is the Jaccard index of the two trigram sets; only sources sharing at
+        least one trigram are scored.
+
+        Args:
+            normalized_name: Output of normalize_company_name
+            min_similarity: Lowest similarity (0-1) accepted as a match
+
+        Returns:
+            Tuple of (source id, similarity) for the best match, or None
+        """
+        grams = trigrams(normalized_name)
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for source_id in self.postings.get(gram, ()):
+                shared[source_id] += 1
+
+        best = None
+        for source_id, count in shared.items():
+            similarity = count / (len(grams) + self.sizes[source_id] - count)
+            if similarity >= min_similarity and (best is None or similarity > best[1]):
+                best = (source_id, similarity)
+        return best
+
+
+_lock = threading.Lock()
+_index: Optional[CompanyNameIndex] = None
+_loaded_at = 0.0
+
+
+def get_company_name_index() -> CompanyNameIndex:
+    """
+    Return the in-process index of all company sources.
+
+    It is rebuilt after COMPANY_INDEX_TTL seconds so that sources added by other worker
+    processes become visible; sources created here are added with register_company_name().
+    """
+    global _index, _loaded_at
+
+    ttl = current_app.config.get('COMPANY_INDEX_TTL', 300)
+    with _lock:
+        if _index is not None and time.monotonic() - _loaded_at < ttl:
+            return _index
+
+    rows = db.session.query(CompanySource.id, CompanySource.normalized_name).filter(
+        CompanySource.normalized_name.isnot(None)
+    ).all()
+    index = CompanyNameIndex(rows)
+
+    with _lock:
+        _index = index
+        _loaded_at = time.monotonic()
+    return index
+
+
+def register_company_name(source_id: int, normalized_name: str) -> None:
+    """Add a newly created company source to the cached index, if one is loaded."""
+    with _lock:
+        if _index is not None:
+            _index.add(source_id, normalized_name)
@@ -6,22 +6,33 @@ This module handles fetching and structuring company information from various so
 
 import contextlib
 import json
+import logging
 import re
 import os
-import requests
 from typing import Dict, List, Optional, Any, Union
 from bs4 import BeautifulSoup
 import html2text
 from dotenv import load_dotenv
+from job_tracker.utils.llm_client import get_llm_client
+from job_tracker.utils.metrics import timed
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Groq API configuration (same as in llm_parser.py)
 GROQ_API_KEY = os.environ.get('GROQ_API_KEY', "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")
-GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 DEFAULT_MODEL = os.environ.get('GROQ_MODEL', "compound-beta")
 
+
+def _chat_completion(payload: Dict[str, Any]):
+    """POST a chat completion with the configured key; raises EnvironmentError when the key is empty."""
+    if not GROQ_API_KEY:
+        raise EnvironmentError("GROQ_API_KEY not set")
+    return get_llm_client().chat_completion(payload, api_key=GROQ_API_KEY, timeout=60)
+
+
 class CompanyInfoParser:
     """Parser for extracting and structuring company information from websites."""
     
@@ -67,10 +78,6 @@ class CompanyInfoParser:
         4. If any information is missing, leave the field as null or an empty list.
         Output only the JSON object.
         """
-        headers = {
-            "Authorization": f"Bearer {GROQ_API_KEY}",
-            "Content-Type": "application/json"
-        }
         payload = {
             "model": DEFAULT_MODEL,
             "messages": [
@@ -81,20 +88,21 @@ class CompanyInfoParser:
             "max_tokens": 1000
         }
         try:
-            response = requests.post(GROQ_API_URL, headers=headers, json=payload, timeout=60)
+            response = _chat_completion(payload)
             if response.status_code == 200:
                 result = response.json()
                 content = result["choices"][0]["message"]["content"]
                 try:
-                    company_data["consolidated_info"] = json.loads(content)
+                    with timed("json_extraction"):
+                        company_data["consolidated_info"] = json.loads(content)
                 except json.JSONDecodeError:
                     if json_match := re.search(r'```(?:json)?\\s*(.*?)\\s*```', content, re.DOTALL):
                         with contextlib.suppress(json.JSONDecodeError):
                             company_data["consolidated_info"] = json.loads(json_match[1])
             else:
                 company_data["consolidated_info"] = CompanyInfoParser._create_fallback_profile(company_data)
-        except Exception as e:
-            print(f"Error in LLM agentic company info: {str(e)}")
+        except Exception:
+            logger.exception("Error in LLM agentic company info", extra={"company": company_name})
             company_data["consolidated_info"] = CompanyInfoParser._create_fallback_profile(company_data)
         return company_data
 
@@ -128,10 +136,6 @@ class CompanyInfoParser:
            - bottom_line (recommendation)
         Output only the JSON object.
         """
-        headers = {
-            "Authorization": f"Bearer {GROQ_API_KEY}",
-            "Content-Type": "application/json"
-        }
         payload = {
             "model": DEFAULT_MODEL,
             "messages": [
@@ -142,20 +146,21 @@ class CompanyInfoParser:
             "max_tokens": 1000
         }
         try:
-            response = requests.post(GROQ_API_URL, headers=headers, json=payload, timeout=60)
+            response = _chat_completion(payload)
             if response.status_code == 200:
                 result = response.json()
                 content = result["choices"][0]["message"]["content"]
                 try:
-                    reviews_data["structured_reviews"] = json.loads(content)
+                    with timed("json_extraction"):
+                        reviews_data["structured_reviews"] = json.loads(content)
                 except json.JSONDecodeError:
                     if json_match := re.search(r'```(?:json)?\\s*(.*?)\\s*```', content, re.DOTALL):
                         with contextlib.suppress(json.JSONDecodeError):
                             reviews_data["structured_reviews"] = json.loads(json_match[1])
             else:
                 reviews_data["structured_reviews"] = CompanyInfoParser._create_fallback_review_summary(reviews_data)
-        except Exception as e:
-            print(f"Error in LLM agentic company reviews: {str(e)}")
+        except Exception:
+            logger.exception("Error in LLM agentic company reviews", extra={"company": company_name})
             reviews_data["structured_reviews"] = CompanyInfoParser._create_fallback_review_summary(reviews_data)
         return reviews_data
 
@@ -175,10 +180,6 @@ class CompanyInfoParser:
         Output a JSON object with these fields: title, description, about_text, structured_data, contact_info, url, errors (if any).
         Website URL: {url}
         """
-        headers = {
-            "Authorization": f"Bearer {GROQ_API_KEY}",
-            "Content-Type": "application/json"
-        }
         payload = {
             "model": DEFAULT_MODEL,
             "messages": [
@@ -189,7 +190,7 @@ class CompanyInfoParser:
             "max_tokens": 1000
         }
         try:
-            response = requests.post(GROQ_API_URL, headers=headers, json=payload, timeout=60)
+            response = _chat_completion(payload)
             if response.status_code == 200:
                 result = response.json()
                 content = result["choices"][0]["message"]["content"]
@@ -219,10 +220,6 @@ class CompanyInfoParser:
         Output a JSON object with these fields: company_type, employees, headquarters, founded, industry, url, errors (if any).
         LinkedIn URL: {url}
         """
-        headers = {
-            "Authorization": f"Bearer {GROQ_API_KEY}",
-            "Content-Type": "application/json"
-        }
         payload = {
             "model": DEFAULT_MODEL,
             "messages": [
@@ -233,7 +230,7 @@ class CompanyInfoParser:
             "max_tokens": 800
         }
         try:
-            response = requests.post(GROQ_API_URL, headers=headers, json=payload, timeout=60)
+            response = _chat_completion(payload)
             if response.status_code == 200:
                 result = response.json()
                 content = result["choices"][0]["message"]["content"]
@@ -262,10 +259,6 @@ class CompanyInfoParser:
         Output a JSON object with these fields: overall_rating, review_count, pros, cons, culture_ratings, url, errors (if any).
         Glassdoor URL: {url}
         """
-        headers = {
-            "Authorization": f"Bearer {GROQ_API_KEY}",
-            "Content-Type": "application/json"
-        }
         payload = {
             "model": DEFAULT_MODEL,
             "messages": [
@@ -276,7 +269,7 @@ class CompanyInfoParser:
             "max_tokens": 1000
         }
         try:
-            response = requests.post(GROQ_API_URL, headers=headers, json=payload, timeout=60)
+            response = _chat_completion(payload)
             if response.status_code == 200:
                 result = response.json()
                 content = result["choices"][0]["message"]["content"]
@@ -0,0 +1,159 @@
+"""
+Relevance-ranked context selection for cover letter prompts.
+The CV and additional documents are split into chunks, scored against the job description with BM25,
+and the best chunks are packed under a token budget so prompt size no longer grows with the uploads folder.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+PARAGRAPH_PATTERN = re.compile(r'\n[ \t]*\n')
+
+STOPWORDS = frozenset("""
+a about above after again all also am an and any are as at be because been before being below between both
+but by can could did do does doing down during each few for from further had has have having he her here
+hers him his how i if in into is it its itself just me more most my no nor not now of off on once only or
+other our ours out over own same she should so some such than that the their them then there these they
+this those through to too under until up very was we were what when where which while who whom why will
+with would you your yours
+""".split())
+
+CHUNK_WORDS = 120
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords; keeps terms like c++, c# and node.js intact."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate LLM token count (about four characters per token for English text)."""
+    return math.ceil(len(text) / 4)
+
+
+def chunk_text(text: str, max_words: int = CHUNK_WORDS) -> List[str]:
+    """
+    Split text into chunks of about max_words words.
+
+    Paragraphs are kept whole when they fit and merged with their neighbours while the
+    chunk stays under the limit; longer paragraphs are split on word boundaries.
+    """
+    chunks: List[str] = []
+    current: List[str] = []
+    current_words = 0
+    for paragraph in PARAGRAPH_PATTERN.split(text or ''):
+        words = paragraph.split()
+        if not words:
+            continue
+        if current and current_words + len(words) > max_words:
+            chunks.append('\n\n'.join(current))
+            current, current_words = [], 0
+        if len(words) > max_words:
+            for start in range(0, len(words), max_words):
+                chunks.append(' '.join(words[start:start + max_words]))
+            continue
+        current.append(paragraph.strip())
+        current_words += len(words)
+    if current:
+        chunks.append('\n\n'.join(current))
+    return chunks
+
+
+class BM25Index:
+    """Okapi BM25 over a fixed list of documents."""
+
+    def __init__(self, documents: List[List[str]], k1: float = BM25_K1, b: float = BM25_B):
+        self.k1 = k1
+        self.b = b
+        self.term_counts = [Counter(document) for document in documents]
+        self.lengths = [len(document) for document in documents]
+        self.average_length = (sum(self.lengths) / len(self.lengths)) if documents else 0.0
+        document_frequency = Counter(term for counts in self.term_counts for term in counts)
+        total = len(documents)
+        self.idf = {
+            term: math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+            for term, frequency in document_frequency.items()
+        }
+
+    def scores(self, query: List[str]) -> List[float]:
+        """Score every document against the query terms (repeated query terms weigh more)."""
+        query_counts = Counter(term for term in query if term in self.idf)
+        results = []
+        for counts, length in zip(self.term_counts, self.lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / (self.average_length or 1))
+            score = 0.0
+            for term, weight in query_counts.items():
+                if frequency := counts.get(term):
+                    score += weight * self.idf[term] * frequency * (self.k1 + 1) / (frequency + norm)
+            results.append(score)
+        return results
+
+
+def truncate_to_tokens(text: str, token_budget: int) -> str:
+    """Cut text on a word boundary so that estimate_tokens() of the result fits the budget."""
+    max_chars = max(0, token_budget) * 4
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars + 1]
+    return cut.rsplit(None, 1)[0].rstrip() if len(cut.split()) > 1 else text[:max_chars]
+
+
+def select_context(job_description: str, cv_text: str, documents: List[str],
+                   token_budget: int) -> Tuple[str, List[str], Dict[str, Any]]:
+    """
+    Keep the CV and document chunks most relevant to the job description within a token budget.
+
+    The first CV chunk (usually name and summary) is always kept, cut down to the budget if it
+    does not fit on its own. Remaining chunks are added
+    in order of BM25 score while they fit, skipping duplicates, then restored to their original
+    order per source.
+
+    Args:
+        job_description: Query text
+        cv_text: Full CV text
+        documents: Full text of each additional document
+        token_budget: Maximum estimated tokens for the CV and documents together
+
+    Returns:
+        Tuple of (CV context, non-empty document contexts, selection stats)
+    """
+    sources = [cv_text] + list(documents)
+    total_tokens = sum(estimate_tokens(text) for text in sources if text)
+    if total_tokens <= token_budget:
+        stats = {'tokens': total_tokens, 'total_tokens': total_tokens, 'chunks': None, 'total_chunks': None}
+        return cv_text, [doc for doc in documents if doc], stats
+
+    # (source index, position in source, text)
+    chunks = [(source, position, chunk)
+              for source, text in enumerate(sources)
+              for position, chunk in enumerate(chunk_text(text))]
+    if chunks and chunks[0][:2] == (0, 0):
+        chunks[0] = (0, 0, truncate_to_tokens(chunks[0][2], token_budget))
+    index = BM25Index([tokenize(chunk) for _, _, chunk in chunks])
+    scores = index.scores(tokenize(job_description))
+
+    selected = set()
+    seen_texts = set()
+    used = 0
+    ranked = sorted(range(len(chunks)), key=lambda i: (chunks[i][0] != 0 or chunks[i][1] != 0, -scores[i]))
+    for i in ranked:
+        # Identical chunks (e.g. the same paragraph in several cover letters) are only sent once
+        text_key = ' '.join(chunks[i][2].split()).lower()
+        cost = estimate_tokens(chunks[i][2])
+        if text_key in seen_texts or used + cost > token_budget:
+            continue
+        selected.add(i)
+        seen_texts.add(text_key)
+        used += cost
+
+    packed: List[List[str]] = [[] for _ in sources]
+    for i in sorted(selected):
+        packed[chunks[i][0]].append(chunks[i][2])
+
+    stats = {'tokens': used, 'total_tokens': total_tokens, 'chunks': len(selected), 'total_chunks': len(chunks)}
+    return '\n\n'.join(packed[0]), ['\n\n'.join(parts) for parts in packed[1:] if parts], stats
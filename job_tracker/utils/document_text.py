@@ -0,0 +1,314 @@
+"""
+Text extraction for uploaded CVs and documents, with an on-disk cache.
+Extracted text is stored in uploads/.text_cache keyed on the file's path, modification time and size,
+so each upload is only parsed once. Cache misses can be extracted in parallel in a process pool with
+per-file timeouts, so one large or malformed PDF cannot stall a request.
+"""
+
+import atexit
+import functools
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from multiprocessing.pool import Pool
+from typing import Any, Dict, List, Optional
+from job_tracker.utils.metrics import STAGE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.dirname(__file__)), '..', 'uploads')
+TEXT_CACHE_DIR = os.path.join(UPLOAD_FOLDER, '.text_cache')
+
+DEFAULT_MAX_PAGES = 50
+
+
+def extract_text(path: str, max_pages: Optional[int] = None) -> str:
+    """
+    Extract plain text from a PDF, DOC/DOCX or text file.
+
+    Args:
+        path: File to read
+        max_pages: Only read the first max_pages pages of a PDF (None reads all)
+
+    Raises:
+        Exception: Whatever the underlying reader raises for unreadable files
+    """
+    ext = path.rsplit('.', 1)[-1].lower()
+    if ext == 'pdf':
+        import PyPDF2
+        with open(path, 'rb') as f:
+            reader = PyPDF2.PdfReader(f)
+            pages = reader.pages if max_pages is None else reader.pages[:max_pages]
+            return "\n".join(page.extract_text() or '' for page in pages)
+    elif ext in ['doc', 'docx']:
+        import docx
+        doc = docx.Document(path)
+        return "\n".join([para.text for para in doc.paragraphs])
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+
+def _cache_path(path: str) -> str:
+    digest = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()
+    return os.path.join(TEXT_CACHE_DIR, f'{digest}.json')
+
+
+def _file_signature(path: str, max_pages: Optional[int] = None) -> dict:
+    stat = os.stat(path)
+    return {'path': os.path.abspath(path), 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size,
+            'max_pages': max_pages}
+
+
+def _load_cached(path: str, signature: dict) -> Optional[str]:
+    try:
+        with open(_cache_path(path), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if all(entry.get(key) == value for key, value in signature.items()):
+        return entry.get('text')
+    return None
+
+
+def _store(path: str, signature: dict, text: str) -> None:
+    os.makedirs(TEXT_CACHE_DIR, exist_ok=True)
+    cache_path = _cache_path(path)
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({**signature, 'text': text}, f)
+    os.replace(tmp_path, cache_path)
+
+
+def _store_quietly(path: str, signature: dict, text: str) -> None:
+    try:
+        _store(path, signature, text)
+    except OSError:
+        logger.warning("Could not write text cache entry", extra={"path": path})
+
+
+def get_document_text(path: str, max_pages: Optional[int] = DEFAULT_MAX_PAGES) -> str:
+    """
+    Return the text of an uploaded file, extracting and caching it if the file changed.
+
+    Raises:
+        Exception: If the file is missing or cannot be read
+    """
+    signature = _file_signature(path, max_pages)
+    if (text := _load_cached(path, signature)) is not None:
+        return text
+
+    text = extract_text(path, max_pages)
+    _store_quietly(path, signature, text)
+    return text
+
+
+def _timed_extract(path: str, max_pages: Optional[int]) -> Dict[str, Any]:
+    """Worker-process entry point: extract one file and report how long it took."""
+    started = time.perf_counter()
+    try:
+        return {'text': extract_text(path, max_pages), 'error': None, 'seconds': time.perf_counter() - started}
+    except Exception as e:
+        return {'text': '', 'error': f'{type(e).__name__}: {e}', 'seconds': time.perf_counter() - started}
+
+
+class _PoolHandle:
+    """The shared extraction pool with the bookkeeping needed to share it between concurrent requests."""
+
+    def __init__(self, workers: int):
+        self.pool: Pool = _pool_context().Pool(processes=workers)
+        self.workers = workers
+        self.users = 0  # extract_documents calls waiting on this pool
+        self.queued = 0  # tasks submitted and not finished yet
+        self.retired = False  # no new work; terminated once the last user is done
+
+
+_pool: Optional[_PoolHandle] = None
+_pool_lock = threading.Lock()
+
+
+def _pool_context():
+    """
+    Multiprocessing context for the extraction pool.
+
+    forkserver, where available: forking the threaded web server directly can copy locks held by
+    other threads (logging, the SQLAlchemy pool) into the children and deadlock them. Only this
+    module is preloaded into the fork server, so the entry script (run.py builds the app at import
+    time) is not re-imported the way spawn would.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context('spawn')
+
+
+def _acquire_pool(workers: int) -> _PoolHandle:
+    """Return the shared pool, registered as used by the caller; (re)created if it was retired or resized."""
+    global _pool
+    stale = None
+    with _pool_lock:
+        if _pool is None or _pool.retired or _pool.workers != workers:
+            if _pool is not None:
+                _pool.retired = True
+                stale = _pool if _pool.users == 0 else None
+            _pool = _PoolHandle(workers)
+        _pool.users += 1
+        handle = _pool
+    if stale is not None:
+        stale.pool.terminate()
+    return handle
+
+
+def _task_finished(handle: _PoolHandle, _result: Any = None) -> None:
+    """apply_async callback (success or error): the task left the pool's queue."""
+    with _pool_lock:
+        handle.queued -= 1
+
+
+def _release_pool(handle: _PoolHandle, stuck: bool = False) -> None:
+    """
+    Unregister a caller from a pool.
+
+    Args:
+        handle: Pool returned by _acquire_pool
+        stuck: A task timed out; the pool is retired and killed once no other caller waits on it,
+            so a stuck extraction stops consuming CPU without failing other requests' files
+    """
+    global _pool
+    with _pool_lock:
+        handle.users -= 1
+        if stuck:
+            handle.retired = True
+            if _pool is handle:
+                _pool = None
+        terminate = handle.retired and handle.users == 0
+    if terminate:
+        handle.pool.terminate()
+
+
+def _terminate_pool() -> None:
+    """Kill the pool's processes at exit."""
+    global _pool
+    with _pool_lock:
+        handle, _pool = _pool, None
+    if handle is not None:
+        handle.pool.terminate()
+
+
+atexit.register(_terminate_pool)
+
+
+def extract_documents(paths: List[str], workers: int = 4, timeout: float = 20,
+                      max_pages: Optional[int] = DEFAULT_MAX_PAGES) -> List[Dict[str, Any]]:
+    """
+    Extract the text of several files, serving unchanged files from the cache.
+
+    Cache misses run in a process pool shared by concurrent requests. A file gets `timeout`
+    seconds once a worker can pick it up; files that exceed it are reported with an error and
+    the pool is replaced (the old one is killed when no request waits on it any more). With
+    workers <= 0 extraction runs serially in this process and timeouts are not enforced.
+
+    Args:
+        paths: Files to extract
+        workers: Process pool size
+        timeout: Per-file extraction timeout in seconds
+        max_pages: Page limit for PDFs
+
+    Returns:
+        One dictionary per path, in order, with path, text, seconds, cached and error
+    """
+    results: List[Dict[str, Any]] = []
+    misses = []
+    for path in paths:
+        result = {'path': path, 'text': '', 'seconds': 0.0, 'cached': False, 'error': None}
+        results.append(result)
+        try:
+            signature = _file_signature(path, max_pages)
+        except OSError as e:
+            result['error'] = f'{type(e).__name__}: {e}'
+            continue
+        if (text := _load_cached(path, signature)) is not None:
+            result.update(text=text, cached=True)
+        else:
+            misses.append((result, signature))
+
+    if misses and workers <= 0:
+        for result, signature in misses:
+            result.update(_timed_extract(result['path'], max_pages))
+    elif misses:
+        handle = _acquire_pool(workers)
+        started = time.monotonic()
+        # Only submitting holds the lock; waiting for results does not block other requests
+        with _pool_lock:
+            ahead = handle.queued
+            handle.queued += len(misses)
+            finished = functools.partial(_task_finished, handle)
+            pending = [
+                (result, handle.pool.apply_async(_timed_extract, (result['path'], max_pages),
+                                                 callback=finished, error_callback=finished))
+                for result, signature in misses
+            ]
+        timed_out = False
+        try:
+            for index, (result, async_result) in enumerate(pending):
+                # Tasks are picked up in submission order, `workers` at a time, after the ones already queued
+                deadline = started + timeout * ((ahead + index) // workers + 1)
+                try:
+                    result.update(async_result.get(timeout=max(0.0, deadline - time.monotonic())))
+                except multiprocessing.TimeoutError:
+                    timed_out = True
+                    result.update(error=f'Timed out after {timeout:g} s', seconds=time.monotonic() - started)
+        finally:
+            _release_pool(handle, stuck=timed_out)
+
+    for result, signature in misses:
+        if result['error'] is None:
+            _store_quietly(result['path'], signature, result['text'])
+
+    for result in results:
+        if not result['cached']:
+            STAGE_SECONDS.observe(result['seconds'], stage='document_extraction')
+        logger.info("Extracted document text", extra={
+            "path": result['path'], "ms": round(result['seconds'] * 1000, 1),
+            "cached": result['cached'], "error": result['error']})
+    return results
+
+
+def extraction_options(config) -> Dict[str, Any]:
+    """Read extract_documents options from the Flask config."""
+    return {
+        'workers': config.get('EXTRACTION_WORKERS', 4),
+        'timeout': config.get('EXTRACTION_TIMEOUT', 20),
+        'max_pages': config.get('MAX_PDF_PAGES', DEFAULT_MAX_PAGES),
+    }
+
+
+def cache_document_text(path: str, **options) -> bool:
+    """
+    Extract and cache a file's text right after upload.
+
+    Args:
+        path: Uploaded file
+        **options: workers, timeout and max_pages for extract_documents
+
+    Returns:
+        True if the text was cached; failures are logged and left for request time
+    """
+    result = extract_documents([path], **options)[0]
+    if result['error']:
+        logger.warning("Could not extract text from upload", extra={"path": path, "error": result['error']})
+        return False
+    return True
+
+
+def invalidate_document_text(path: str) -> None:
+    """Drop the cached text for a file (e.g. after it is deleted or replaced)."""
+    try:
+        os.remove(_cache_path(path))
+    except FileNotFoundError:
+        pass
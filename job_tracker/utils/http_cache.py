@@ -0,0 +1,109 @@
+"""
+Conditional GET and rendered-fragment caching for the job and company pages.
+A page's version is derived from the updated_at of the rows it shows. It is sent as ETag/Last-Modified so
+unchanged pages are answered with 304, and it keys an in-process cache of rendered template fragments.
+Row timestamps do not see template or code changes: bump CACHE_VERSION when a release changes what the
+pages render.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+from flask import current_app, make_response, request, session
+from flask.globals import request_ctx
+from markupsafe import Markup
+from werkzeug.wrappers import Response
+
+# Default CACHE_VERSION; a constant so every worker process produces the same ETags
+DEFAULT_CACHE_VERSION = '1'
+
+_lock = threading.Lock()
+_fragments: 'OrderedDict[str, Markup]' = OrderedDict()
+
+
+def page_version(*parts: Any) -> str:
+    """
+    Opaque version of a page.
+
+    Args:
+        *parts: Everything the page depends on (row ids and their updated_at values)
+
+    Returns:
+        Hash of the parts and CACHE_VERSION, used as ETag and fragment key
+    """
+    raw = '|'.join(str(part) for part in (current_app.config['CACHE_VERSION'], *parts))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:24]
+
+
+def last_modified(*timestamps: Optional[datetime]) -> Optional[datetime]:
+    """Latest of the given naive UTC timestamps as an aware datetime, or None if none is set."""
+    values = [timestamp for timestamp in timestamps if timestamp is not None]
+    return max(values).replace(tzinfo=timezone.utc) if values else None
+
+
+def _is_fresh(version: str, modified: Optional[datetime]) -> bool:
+    """Whether the client's cached copy matches; If-None-Match takes precedence over If-Modified-Since."""
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(version)
+    if request.if_modified_since and modified:
+        return modified.replace(microsecond=0) <= request.if_modified_since
+    return False
+
+
+def conditional_response(version: str, modified: Optional[datetime], render: Callable[[], Any]) -> Response:
+    """
+    Answer with 304 when the client's copy is current, otherwise render the page and attach validators.
+
+    Flash messages are part of the page but not of its version. While flashes are pending the
+    page is always rendered, and a response that displayed flashes gets no validators, so a
+    flash is never replayed from a cached copy.
+
+    Args:
+        version: Output of page_version
+        modified: Output of last_modified
+        render: Produces the response (anything a view may return); only called on a miss
+
+    Returns:
+        The 304 or rendered response, marked private and no-cache so clients always revalidate
+    """
+    if not session.get('_flashes') and _is_fresh(version, modified):
+        response = current_app.response_class(status=304)
+    else:
+        response = make_response(render())
+
+    # request_ctx.flashes is only set once get_flashed_messages() ran during the render
+    if response.status_code in (200, 304) and not request_ctx.flashes:
+        response.set_etag(version, weak=True)
+        if modified:
+            response.last_modified = modified
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def cached_fragment(key: str, render: Callable[[], str]) -> Markup:
+    """
+    Return a rendered template fragment from the in-process cache, rendering it on a miss.
+
+    Keys include the version of the data the fragment shows, so entries never need invalidating;
+    beyond FRAGMENT_CACHE_SIZE entries the least recently used ones are dropped.
+
+    Args:
+        key: Fragment name and page_version of its data
+        render: Renders the fragment (e.g. a render_template call)
+    """
+    with _lock:
+        if key in _fragments:
+            _fragments.move_to_end(key)
+            return _fragments[key]
+
+    fragment = Markup(render())
+    size = current_app.config.get('FRAGMENT_CACHE_SIZE', 256)
+    with _lock:
+        _fragments[key] = fragment
+        while len(_fragments) > size:
+            _fragments.popitem(last=False)
+    return fragment
+
@@ -0,0 +1,229 @@
+"""
+Write-time processing of parsed job descriptions.
+Sections are cleaned once when parsed_data is stored, and the skills and seniority are materialized
+into indexed columns so views skip re-cleaning and filters do not decode every row.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+from job_tracker.models import Job, JobSkill
+
+SKILL_SECTION_TITLES = ('skills',)
+SKILL_SEPARATORS = re.compile(r'[,;•|/]|\band\b|\bor\b|\bsuch as\b|\bincluding\b|\be\.g\.|\bi\.e\.', re.IGNORECASE)
+PARENTHESES = re.compile(r'\(([^()]*)\)')
+# Lead-ins of requirement bullets ("Proficient in Python", "Solid understanding of SQL"); the skill follows
+SKILL_LEAD_IN = re.compile(
+    r'^(?:(?:strong|solid|excellent|good|proven|hands-on)\s+)*'
+    r'(?:(?:proficien(?:t|cy)|experience(?:\s+working)?|familiar(?:ity)?|knowledge|understanding|expertise|'
+    r'foundation|background|skilled|fluen(?:t|cy))\s+(?:in|with|of)\s+)?',
+    re.IGNORECASE
+)
+SKILL_FILLERS = {'etc', 'others', 'more'}
+MAX_SKILL_WORDS = 4
+MAX_SKILL_LENGTH = 40
+
+# Checked in order; the first level whose pattern matches the title wins
+SENIORITY_PATTERNS = [
+    ('intern', re.compile(r'\b(intern|internship|trainee)\b', re.IGNORECASE)),
+    ('principal', re.compile(r'\b(principal|staff|distinguished)\b', re.IGNORECASE)),
+    ('lead', re.compile(r'\b(lead|head|director|vp)\b', re.IGNORECASE)),
+    ('senior', re.compile(r'\b(senior|sr\.?|iii|expert)\b', re.IGNORECASE)),
+    ('junior', re.compile(r'\b(junior|jr\.?|entry[- ]level|graduate|associate)\b', re.IGNORECASE)),
+    ('mid', re.compile(r'\b(mid[- ]level|intermediate|ii)\b', re.IGNORECASE)),
+]
+YEARS_PATTERN = re.compile(r'(\d{1,2})\s*\+?\s*(?:-\s*\d{1,2}\s*)?years?', re.IGNORECASE)
+SENIORITY_LEVELS = ('intern', 'junior', 'mid', 'senior', 'lead', 'principal')
+
+
+def clean_text_content(content):
+    """
+    Clean text content by removing artifacts and excessive whitespace.
+
+    Args:
+        content: String content to clean
+
+    Returns:
+        Cleaned string content
+    """
+    if not isinstance(content, str):
+        return content
+
+    # Clean excessive whitespace and newlines
+    content = content.strip()
+    content = content.replace('\n\n\n', '\n').replace('\n\n', '\n')
+
+    # Remove "show more/less" text and similar artifacts
+    artifacts = ['show more', 'show less', 'Show more', 'Show less', '...']
+    for artifact in artifacts:
+        content = content.replace(artifact, '')
+
+    return content
+
+
+def clean_list_items(items):
+    """
+    Clean a list of text items.
+
+    Args:
+        items: List of string items to clean
+
+    Returns:
+        List of cleaned string items
+    """
+    cleaned_items = []
+
+    for item in items:
+        if isinstance(item, str) and (clean_item := clean_text_content(item)):
+            cleaned_items.append(clean_item)
+
+    return cleaned_items
+
+
+def clean_sections(sections):
+    """
+    Process and clean sections from parsed job data.
+
+    Args:
+        sections: List of section dictionaries
+
+    Returns:
+        Processed sections with cleaned content
+    """
+    if not sections:
+        return sections
+
+    for section in sections:
+        if section.get('type') == 'paragraph' and isinstance(section.get('content'), str):
+            section['content'] = clean_text_content(section['content'])
+        elif section.get('type') == 'list' and isinstance(section.get('content'), list):
+            section['content'] = clean_list_items(section['content'])
+
+    return sections
+
+
+def normalize_skill(skill: str) -> str:
+    """Lookup key for a skill: case-folded with whitespace collapsed ("PyTorch " -> "pytorch")."""
+    return ' '.join((skill or '').casefold().split())
+
+
+def _skill_fragments(text: str) -> List[str]:
+    """Split one list item (without parentheses) into candidate skills, dropping lead-ins and fillers."""
+    fragments = []
+    for fragment in SKILL_SEPARATORS.split(text):
+        fragment = SKILL_LEAD_IN.sub('', fragment.strip(' .:-*()\t')).strip(' .:-*()\t')
+        if fragment and fragment.lower() not in SKILL_FILLERS:
+            fragments.append(fragment)
+    return fragments
+
+
+def extract_skills(sections: List[Dict[str, Any]]) -> List[str]:
+    """
+    Pull individual skills out of the Skills sections.
+
+    Parenthesized examples ("ML tooling (e.g., NumPy, Pandas)") are split as lists of their own.
+    Items are split on commas, slashes, "and"/"or", "such as" and similar separators, and lead-ins
+    like "Proficient in" are stripped; items with a fragment longer than a few words are treated as
+    prose and dropped, as are header leftovers ("& Qualifications:"). Duplicates are removed,
+    keeping the first spelling.
+    """
+    skills: Dict[str, str] = {}
+    for section in sections or []:
+        if str(section.get('title', '')).strip().lower() not in SKILL_SECTION_TITLES:
+            continue
+        content = section.get('content')
+        items = content if isinstance(content, list) else str(content or '').splitlines()
+        for item in items:
+            item = str(item).strip()
+            if not item or item.startswith('&') or item.endswith(':'):
+                continue
+            for part in [PARENTHESES.sub(' ', item), *PARENTHESES.findall(item)]:
+                fragments = _skill_fragments(part)
+                # One long fragment means the part is a sentence, not a list of skills
+                if any(len(fragment) > MAX_SKILL_LENGTH or len(fragment.split()) > MAX_SKILL_WORDS
+                       for fragment in fragments):
+                    continue
+                for skill in fragments:
+                    skills.setdefault(normalize_skill(skill), skill)
+    return list(skills.values())
+
+
+def detect_seniority(title: str, sections: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Classify a job into one of SENIORITY_LEVELS.
+
+    The title decides when it names a level; otherwise the largest "N years" figure in the
+    Experience/Requirements sections is used (<2 junior, <5 mid, otherwise senior).
+    """
+    for level, pattern in SENIORITY_PATTERNS:
+        if pattern.search(title or ''):
+            return level
+
+    years = []
+    for section in sections or []:
+        if str(section.get('title', '')).strip().lower() not in ('experience', 'requirements'):
+            continue
+        content = section.get('content')
+        text = '\n'.join(map(str, content)) if isinstance(content, list) else str(content or '')
+        years.extend(int(match) for match in YEARS_PATTERN.findall(text))
+    if not years:
+        return None
+    most = max(years)
+    return 'junior' if most < 2 else 'mid' if most < 5 else 'senior'
+
+
+def prepare_parsed_data(parsed_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Clean the sections of a parser result once and mark it so readers can skip cleaning."""
+    parsed_data = dict(parsed_data or {})
+    if 'sections' in parsed_data:
+        parsed_data['sections'] = clean_sections(parsed_data['sections'])
+    parsed_data.setdefault('metadata', {})['cleaned'] = True
+    return parsed_data
+
+
+def materialize_parsed_data(title: str, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compute the stored form of a parser result.
+
+    Args:
+        title: Job title (used for seniority)
+        parsed_data: Result of JobDescriptionParser.parse_description
+
+    Returns:
+        Dictionary with parsed_data (cleaned JSON string), skills (list) and seniority
+    """
+    cleaned = prepare_parsed_data(parsed_data)
+    sections = cleaned.get('sections') or []
+    return {
+        'parsed_data': json.dumps(cleaned),
+        'skills': extract_skills(sections),
+        'seniority': detect_seniority(title, sections),
+    }
+
+
+def store_parsed_data(job: Job, parsed_data: Dict[str, Any]) -> None:
+    """Store a parser result on a job with its skills and seniority (not committed)."""
+    values = materialize_parsed_data(job.title, parsed_data)
+    job.parsed_data = values['parsed_data']
+    job.seniority = values['seniority']
+    job.skills = [JobSkill(name=skill, normalized=normalize_skill(skill)) for skill in values['skills']]
+
+
+def load_parsed_data(parsed_data: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Decode stored parsed_data for display, cleaning rows written before cleaning moved to write time.
+
+    Returns:
+        Parsed dictionary or None if there is none or it is not valid JSON
+    """
+    if not parsed_data:
+        return None
+    try:
+        data = json.loads(parsed_data)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    if not data.get('metadata', {}).get('cleaned') and 'sections' in data:
+        data['sections'] = clean_sections(data['sections'])
+    return data
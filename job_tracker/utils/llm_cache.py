@@ -0,0 +1,147 @@
+"""
+Persistent cache for LLM responses.
+Entries are keyed by a hash of (model, prompt template version, normalized input) and stored
+in a standalone SQLite file with least-recently-used eviction and a time-to-live.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), '..', 'instance', 'llm_cache.db')
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+
+
+def normalize_text(text: str) -> str:
+    """Collapse runs of whitespace so formatting-only differences share a cache entry."""
+    return re.sub(r'\s+', ' ', text or '').strip()
+
+
+class LLMResponseCache:
+    """Size-bounded, TTL-limited key/value store for JSON-serializable LLM results."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def make_key(model: str, prompt_version: str, text: str) -> str:
+        """
+        Build the cache key for an LLM request.
+
+        Args:
+            model: Model name sent to the provider
+            prompt_version: Version string of the prompt template
+            text: Input text inserted into the prompt
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = '\x1f'.join([model or '', prompt_version, normalize_text(text)])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_accessed REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS ix_llm_cache_last_accessed ON llm_cache (last_accessed)")
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for a key, or None on a miss or expired entry.
+        """
+        if self.max_entries <= 0:
+            return None
+
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn.execute("SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                if now - row[1] > self.ttl_seconds:
+                    conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    conn.commit()
+                    return None
+                conn.execute("UPDATE llm_cache SET last_accessed = ? WHERE key = ?", (now, key))
+                conn.commit()
+                return json.loads(row[0])
+            except (sqlite3.Error, json.JSONDecodeError):
+                return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entries beyond max_entries.
+        """
+        if self.max_entries <= 0:
+            return
+
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, created_at, last_accessed) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(value), now, now)
+                )
+                conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+                conn.execute("""
+                    DELETE FROM llm_cache WHERE key IN (
+                        SELECT key FROM llm_cache ORDER BY last_accessed DESC LIMIT -1 OFFSET ?
+                    )
+                """, (self.max_entries,))
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute("DELETE FROM llm_cache")
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """
+    Return the process-wide cache, configured from LLM_CACHE_PATH, LLM_CACHE_MAX_ENTRIES
+    (0 disables caching) and LLM_CACHE_TTL_SECONDS.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMResponseCache(
+                path=os.environ.get('LLM_CACHE_PATH', DEFAULT_CACHE_PATH),
+                max_entries=int(os.environ.get('LLM_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES)),
+                ttl_seconds=int(os.environ.get('LLM_CACHE_TTL_SECONDS', DEFAULT_TTL_SECONDS)),
+            )
+        return _cache
@@ -0,0 +1,222 @@
+"""
+Shared HTTP client for the Groq chat completions API.
+All LLM calls go through one keep-alive connection pool, a token-bucket rate limiter sized to the
+provider quota, and retries with jittered exponential backoff for 429 and 5xx responses.
+"""
+
+import json
+import logging
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
+from job_tracker.utils.metrics import LLM_REQUESTS, STAGE_SECONDS, timed
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+GROQ_API_URL = os.environ.get('GROQ_API_URL', "https://api.groq.com/openai/v1/chat/completions")
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class LLMStreamError(Exception):
+    """Raised when a streaming completion cannot be started or is cut off."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a token is available."""
+
+    def __init__(self, rate_per_second: float, capacity: float):
+        self.rate = rate_per_second
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping if the bucket is empty.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convert a Retry-After header (seconds or HTTP date) into seconds to wait."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class LLMClient:
+    """Pooled, rate-limited, retrying client for OpenAI-compatible chat completion endpoints."""
+
+    def __init__(self, api_url: str = GROQ_API_URL, requests_per_minute: float = 30, burst: float = 5,
+                 max_retries: int = 3, backoff_base: float = 1.0, backoff_max: float = 30.0, pool_size: int = 10):
+        self.api_url = api_url
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.rate_limiter = TokenBucket(requests_per_minute / 60.0, burst)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def _backoff(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Seconds to wait before retry number `attempt` (0-based), honoring Retry-After."""
+        if response is not None:
+            retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+        # Full jitter: uniform over [0, base * 2^attempt], capped
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def chat_completion(self, payload: Dict[str, Any], api_key: Optional[str], timeout: float = 60,
+                        **kwargs) -> requests.Response:
+        """
+        POST a chat completion request.
+
+        Retries connection errors, timeouts, 429 and 5xx responses up to max_retries
+        times. The last response is returned as-is so callers can inspect error
+        statuses; the last connection error is re-raised.
+
+        Args:
+            payload: JSON request body
+            api_key: Bearer token for the provider
+            timeout: Per-attempt timeout in seconds
+            **kwargs: Extra arguments for requests.Session.post (e.g. stream=True)
+
+        Returns:
+            requests.Response
+        """
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                with timed("llm_http"):
+                    response = self.session.post(self.api_url, headers=headers, json=payload, timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                LLM_REQUESTS.inc(status="error")
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                logger.info("LLM request failed, retrying", extra={"attempt": attempt + 1, "delay": round(delay, 2),
+                                                                   "error": type(e).__name__})
+                time.sleep(delay)
+                continue
+
+            LLM_REQUESTS.inc(status=response.status_code)
+            if response.status_code in RETRY_STATUS_CODES and attempt < self.max_retries:
+                delay = self._backoff(attempt, response)
+                logger.info("LLM request returned retryable status", extra={
+                    "attempt": attempt + 1, "status": response.status_code, "delay": round(delay, 2)})
+                response.close()
+                time.sleep(delay)
+                continue
+
+            return response
+
+    def stream_chat_completion(self, payload: Dict[str, Any], api_key: Optional[str],
+                               timeout: float = 60) -> Iterator[str]:
+        """
+        Stream a chat completion, yielding content deltas as they arrive.
+
+        The request goes through chat_completion, so rate limiting and retries apply until the
+        response starts; the body is read as OpenAI-style server-sent events ("data: {...}"
+        lines terminated by "data: [DONE]").
+
+        Args:
+            payload: JSON request body; "stream": true is added
+            api_key: Bearer token for the provider
+            timeout: Connect/read timeout in seconds (between chunks once streaming)
+
+        Raises:
+            LLMStreamError: On a non-200 response or a malformed event
+        """
+        started = time.perf_counter()
+        response = self.chat_completion({**payload, "stream": True}, api_key=api_key, timeout=timeout, stream=True)
+        with response:
+            if response.status_code != 200:
+                try:
+                    detail = response.json().get("error", {}).get("message", "Unknown error")
+                except ValueError:
+                    detail = response.text
+                raise LLMStreamError(f"[LLM API Error: {response.status_code}] {detail}", response.status_code)
+
+            first_token = True
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    return
+                try:
+                    chunk = json.loads(data)
+                except ValueError as e:
+                    raise LLMStreamError(f"Malformed stream event: {data[:200]}") from e
+                choices = chunk.get("choices") or [{}]
+                if content := (choices[0].get("delta") or {}).get("content"):
+                    if first_token:
+                        STAGE_SECONDS.observe(time.perf_counter() - started, stage="llm_first_token")
+                        first_token = False
+                    yield content
+
+
+_client: Optional[LLMClient] = None
+_client_lock = threading.Lock()
+
+
+def get_llm_client() -> LLMClient:
+    """
+    Return the process-wide client, configured from GROQ_API_URL, GROQ_REQUESTS_PER_MINUTE,
+    GROQ_BURST, GROQ_MAX_RETRIES and GROQ_POOL_SIZE.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = LLMClient(
+                api_url=GROQ_API_URL,
+                requests_per_minute=float(os.environ.get('GROQ_REQUESTS_PER_MINUTE', 30)),
+                burst=float(os.environ.get('GROQ_BURST', 5)),
+                max_retries=int(os.environ.get('GROQ_MAX_RETRIES', 3)),
+                pool_size=int(os.environ.get('GROQ_POOL_SIZE', 10)),
+            )
+        return _client
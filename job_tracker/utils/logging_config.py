@@ -0,0 +1,68 @@
+"""
+Logging setup for the job_tracker package.
+Records are emitted as single-line JSON (or key=value text) so they can be shipped and filtered by field.
+"""
+
+import json
+import logging
+import sys
+from datetime import datetime, timezone
+
+# Attributes every LogRecord has; anything else was passed through `extra=` and is emitted as a field
+_RESERVED_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+def _extra_fields(record: logging.LogRecord) -> dict:
+    return {key: value for key, value in vars(record).items() if key not in _RESERVED_ATTRS}
+
+
+class JSONFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            **_extra_fields(record),
+        }
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class KeyValueFormatter(logging.Formatter):
+    """Human-readable format with `extra=` fields appended as key=value pairs."""
+
+    def __init__(self):
+        super().__init__('%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        if fields := _extra_fields(record):
+            line += ' ' + ' '.join(f'{key}={value}' for key, value in fields.items())
+        return line
+
+
+def configure_logging(level: str = 'WARNING', log_format: str = 'text') -> None:
+    """
+    Configure the `job_tracker` logger hierarchy.
+
+    Args:
+        level: Log level name; WARNING keeps per-request diagnostics silent
+        log_format: 'json' for one JSON object per line, anything else for key=value text
+    """
+    logger = logging.getLogger('job_tracker')
+    logger.setLevel(getattr(logging, str(level).upper(), logging.WARNING))
+
+    # Replace our own handler on repeated create_app() calls instead of stacking them
+    for handler in list(logger.handlers):
+        if getattr(handler, '_job_tracker_handler', False):
+            logger.removeHandler(handler)
+
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(JSONFormatter() if log_format == 'json' else KeyValueFormatter())
+    handler._job_tracker_handler = True
+    logger.addHandler(handler)
+    logger.propagate = False
@@ -0,0 +1,156 @@
+"""
+Job-to-CV match scores.
+Job skills and the skills found in the CV become sparse binary term vectors, and the share of each job's
+skills covered by the CV is computed for all jobs at once with a single sparse matrix-vector product.
+"""
+
+import logging
+import os
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import numpy as np
+from flask import current_app
+from scipy import sparse
+from job_tracker import db
+from job_tracker.models import Job, JobSkill
+from job_tracker.utils.context_selection import tokenize
+from job_tracker.utils.document_text import UPLOAD_FOLDER, extract_documents, extraction_options
+from job_tracker.utils.job_sections import MAX_SKILL_WORDS
+
+logger = logging.getLogger(__name__)
+
+CV_EXTENSIONS = ('pdf', 'doc', 'docx', 'txt')
+BATCH_SIZE = 500
+
+
+def find_cv_path(upload_folder: str = UPLOAD_FOLDER) -> Optional[str]:
+    """Path of the uploaded CV (uploads/cv.*), or None if there is none."""
+    for ext in CV_EXTENSIONS:
+        path = os.path.join(upload_folder, f'cv.{ext}')
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def skill_key(skill: str) -> str:
+    """Token form of a skill, as looked up in the CV ("Node.js" -> "node.js", "Machine  Learning" -> "machine learning")."""
+    return ' '.join(tokenize(skill))
+
+
+def text_terms(text: str, max_words: int = MAX_SKILL_WORDS) -> Set[str]:
+    """Every run of up to max_words consecutive tokens in a text, in skill_key form."""
+    tokens = tokenize(text)
+    return {
+        ' '.join(tokens[start:start + size])
+        for size in range(1, max_words + 1)
+        for start in range(len(tokens) - size + 1)
+    }
+
+
+def compute_match_scores(job_skills: Dict[int, Iterable[str]], cv_terms: Set[str]) -> Dict[int, Optional[float]]:
+    """
+    Score jobs against the CV.
+
+    The vocabulary is every distinct skill of the given jobs. The jobs are the rows of a sparse
+    binary job x skill matrix, the CV is a binary vector over the same vocabulary, and a job's
+    score is the share of its skills found in the CV. Binary weights keep a job's score
+    independent of the other jobs, so scoring one job gives the same result as a full recompute.
+
+    Args:
+        job_skills: Normalized skill names per job id
+        cv_terms: Output of text_terms for the CV text
+
+    Returns:
+        Score between 0 and 1 per job id; None for jobs without skills
+    """
+    job_ids = list(job_skills)
+    keys: Dict[str, str] = {}
+    vocabulary: Dict[str, int] = {}
+    rows: List[int] = []
+    columns: List[int] = []
+    for row, job_id in enumerate(job_ids):
+        terms = set()
+        for skill in job_skills[job_id]:
+            if skill not in keys:
+                keys[skill] = skill_key(skill)
+            if keys[skill]:
+                terms.add(vocabulary.setdefault(keys[skill], len(vocabulary)))
+        rows.extend([row] * len(terms))
+        columns.extend(terms)
+
+    matrix = sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, columns)), shape=(len(job_ids), len(vocabulary))
+    )
+    cv_vector = np.zeros(len(vocabulary))
+    cv_vector[[column for term, column in vocabulary.items() if term in cv_terms]] = 1.0
+
+    matched = matrix @ cv_vector
+    totals = np.diff(matrix.indptr)
+    scores = np.divide(matched, totals, out=np.zeros(len(job_ids)), where=totals > 0)
+    return {job_id: float(scores[row]) if totals[row] else None for row, job_id in enumerate(job_ids)}
+
+
+def load_cv_terms() -> Optional[Set[str]]:
+    """
+    Read the uploaded CV (through the text cache) and return its terms.
+
+    Returns:
+        Output of text_terms, or None if no CV is uploaded or it cannot be read
+    """
+    path = find_cv_path()
+    if path is None:
+        return None
+    result = extract_documents([path], **extraction_options(current_app.config))[0]
+    if result['error']:
+        logger.warning("Could not read the CV for match scores: %s", result['error'])
+        return None
+    return text_terms(result['text'])
+
+
+def _load_jobs(job_ids: Optional[List[int]]) -> Tuple[Dict[int, Optional[float]], Dict[int, List[str]]]:
+    """
+    Stored scores and normalized skills of the given jobs (every job when job_ids is None).
+
+    Returns:
+        Tuple of (match_score per job id, skills per job id); jobs without skills map to an empty list
+    """
+    score_query = db.session.query(Job.id, Job.match_score)
+    skill_query = db.session.query(JobSkill.job_id, JobSkill.normalized)
+    if job_ids is None:
+        current = dict(score_query.all())
+        rows = skill_query.all()
+    else:
+        current, rows = {}, []
+        for start in range(0, len(job_ids), BATCH_SIZE):
+            batch = job_ids[start:start + BATCH_SIZE]
+            current.update(score_query.filter(Job.id.in_(batch)).all())
+            rows.extend(skill_query.filter(JobSkill.job_id.in_(batch)).all())
+
+    job_skills: Dict[int, List[str]] = {job_id: [] for job_id in current}
+    for job_id, normalized in rows:
+        if job_id in job_skills:
+            job_skills[job_id].append(normalized)
+    return current, job_skills
+
+
+def update_match_scores(job_ids: Optional[Iterable[int]] = None, cv_terms: Optional[Set[str]] = None) -> int:
+    """
+    Recompute and store the match scores of some or all jobs (not committed).
+    Without a CV the scores are cleared.
+
+    Args:
+        job_ids: Jobs to score; every job when None
+        cv_terms: Output of load_cv_terms, read from the uploaded CV when omitted
+
+    Returns:
+        Number of jobs whose score changed
+    """
+    if cv_terms is None:
+        cv_terms = load_cv_terms()
+    current, job_skills = _load_jobs(None if job_ids is None else sorted(set(job_ids)))
+    scores = dict.fromkeys(job_skills) if cv_terms is None else compute_match_scores(job_skills, cv_terms)
+
+    # Only rows whose score moved are written
+    changed = [{'id': job_id, 'match_score': score} for job_id, score in scores.items() if current[job_id] != score]
+    if changed:
+        db.session.execute(db.update(Job), changed)
+    return len(changed)
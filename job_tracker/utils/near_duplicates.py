@@ -0,0 +1,225 @@
+"""
+Near-duplicate job detection with MinHash and locality-sensitive hashing.
+Each description gets a MinHash signature over its word shingles; the signature is cut into bands whose
+hashes are stored in job_lsh_band, so postings that share a band are found with indexed lookups.
+"""
+
+import hashlib
+import re
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from flask import current_app
+from sqlalchemy import and_, func, or_
+from job_tracker import db
+from job_tracker.models import Job, JobLSHBand
+
+SHINGLE_SIZE = 5  # words per shingle
+MIN_WORDS = 20  # shorter descriptions ("See link", "TBD") are too generic to compare
+LSH_BANDS = 20
+LSH_ROWS = 6  # signature values per band; a pair at Jaccard 0.8 shares a band with probability > 0.99
+NUM_PERM = LSH_BANDS * LSH_ROWS
+MERSENNE_PRIME = (1 << 31) - 1
+WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+BATCH_SIZE = 500
+
+# Hash function coefficients. RandomState's stream is frozen across NumPy releases, so signatures
+# stored by earlier versions stay comparable.
+_random = np.random.RandomState(20240601)
+_A = _random.randint(1, MERSENNE_PRIME, size=NUM_PERM, dtype=np.uint64)
+_B = _random.randint(0, MERSENNE_PRIME, size=NUM_PERM, dtype=np.uint64)
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> List[str]:
+    """Overlapping runs of `size` lowercase words; empty when the text has fewer than MIN_WORDS words."""
+    words = WORD_PATTERN.findall((text or '').lower())
+    if len(words) < MIN_WORDS:
+        return []
+    return [' '.join(words[start:start + size]) for start in range(len(words) - size + 1)]
+
+
+def minhash_signature(text: str) -> Optional[np.ndarray]:
+    """
+    Compute the MinHash signature of a description.
+
+    Every shingle is hashed with crc32 (stable across processes, unlike hash()) and passed
+    through NUM_PERM universal hash functions at once; the signature keeps each function's minimum.
+
+    Returns:
+        Array of NUM_PERM uint32 values, or None for descriptions too short to compare
+    """
+    items = shingles(text)
+    if not items:
+        return None
+    hashes = np.fromiter((zlib.crc32(item.encode('utf-8')) for item in set(items)), dtype=np.uint64)
+    # a < 2^31 and crc32 < 2^32, so a * x + b stays below 2^64
+    permuted = (_A[:, None] * hashes[None, :] + _B[:, None]) % MERSENNE_PRIME
+    return permuted.min(axis=1).astype(np.uint32)
+
+
+def band_buckets(signature: np.ndarray) -> List[Tuple[int, int]]:
+    """(band, bucket) pairs of a signature; the bucket is a signed 64-bit hash so it fits an SQLite INTEGER."""
+    return [
+        (band, int.from_bytes(
+            hashlib.blake2b(signature[band * LSH_ROWS:(band + 1) * LSH_ROWS].tobytes(), digest_size=8).digest(),
+            'little', signed=True
+        ))
+        for band in range(LSH_BANDS)
+    ]
+
+
+def similarity(signature: np.ndarray, other: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two descriptions: the share of equal signature values."""
+    return float(np.mean(signature == other))
+
+
+def decode_signature(data: Optional[bytes]) -> Optional[np.ndarray]:
+    """Signature stored in Job.minhash, or None if there is none."""
+    if not data:
+        return None
+    return np.frombuffer(data, dtype=np.uint32)
+
+
+def store_signature(job: Job, signature: Optional[np.ndarray]) -> None:
+    """Store a signature (from minhash_signature) and its LSH buckets on a job (not committed)."""
+    job.minhash = signature.tobytes() if signature is not None else None
+    job.lsh_bands = [
+        JobLSHBand(band=band, bucket=bucket) for band, bucket in band_buckets(signature)
+    ] if signature is not None else []
+
+
+def signature_rows(job_id: int, signature: Optional[np.ndarray]) -> List[Dict[str, int]]:
+    """job_lsh_band rows of a signature, for Core bulk inserts."""
+    if signature is None:
+        return []
+    return [{'job_id': job_id, 'band': band, 'bucket': bucket} for band, bucket in band_buckets(signature)]
+
+
+def _signatures(job_ids: Iterable[int]) -> Dict[int, np.ndarray]:
+    """Stored signatures of the given jobs."""
+    job_ids = list(job_ids)
+    signatures = {}
+    for start in range(0, len(job_ids), BATCH_SIZE):
+        rows = db.session.query(Job.id, Job.minhash).filter(Job.id.in_(job_ids[start:start + BATCH_SIZE]))
+        for job_id, data in rows:
+            if (signature := decode_signature(data)) is not None:
+                signatures[job_id] = signature
+    return signatures
+
+
+def find_near_duplicates(signature: Optional[np.ndarray], exclude_id: Optional[int] = None,
+                         threshold: Optional[float] = None, limit: int = 5) -> List[Tuple[Job, float]]:
+    """
+    Find tracked jobs whose description is nearly the same as the given one.
+
+    Candidates are the jobs sharing at least one LSH bucket (LSH_BANDS indexed lookups); their
+    similarity is then estimated from the stored signatures.
+
+    Args:
+        signature: Output of minhash_signature
+        exclude_id: Job to leave out (the job being checked)
+        threshold: Lowest estimated similarity reported; DUPLICATE_THRESHOLD when omitted
+        limit: Maximum number of jobs returned
+
+    Returns:
+        List of (job, similarity) tuples, most similar first
+    """
+    if signature is None:
+        return []
+    if threshold is None:
+        threshold = current_app.config.get('DUPLICATE_THRESHOLD', 0.8)
+
+    # OR of (band, bucket) pairs: SQLite turns it into one index search per band, whereas a
+    # row-value IN list scans the table
+    candidates = {
+        job_id for (job_id,) in db.session.query(JobLSHBand.job_id).filter(or_(*(
+            and_(JobLSHBand.band == band, JobLSHBand.bucket == bucket) for band, bucket in band_buckets(signature)
+        ))).distinct()
+    }
+    candidates.discard(exclude_id)
+
+    matches = sorted(
+        ((job_id, similarity(signature, other)) for job_id, other in _signatures(candidates).items()),
+        key=lambda match: match[1], reverse=True
+    )
+    matches = [(job_id, score) for job_id, score in matches if score >= threshold][:limit]
+    jobs = {job.id: job for job in Job.query.filter(Job.id.in_([job_id for job_id, _ in matches]))} if matches else {}
+    return [(jobs[job_id], score) for job_id, score in matches if job_id in jobs]
+
+
+def duplicate_warning(duplicates: List[Tuple[Job, float]]) -> Optional[str]:
+    """Flash message naming the closest near-duplicate, or None if there is none."""
+    if not duplicates:
+        return None
+    job, score = duplicates[0]
+    others = f' and {len(duplicates) - 1} more' if len(duplicates) > 1 else ''
+    return (f'This posting looks like a near-duplicate of "{job.title}" at {job.company} '
+            f'(job #{job.id}, {score:.0%} similar){others}.')
+
+
+def find_duplicate_groups(threshold: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    Group all tracked jobs into clusters of near-duplicates.
+
+    Only jobs that share an LSH bucket are compared, pairs at or above the threshold are
+    joined with union-find, and each cluster is reported once.
+
+    Args:
+        threshold: Lowest estimated similarity of a duplicate pair; DUPLICATE_THRESHOLD when omitted
+
+    Returns:
+        List of groups, largest first; each has 'jobs' (oldest first) and 'similarity'
+        (lowest similarity measured between two of its jobs)
+    """
+    if threshold is None:
+        threshold = current_app.config.get('DUPLICATE_THRESHOLD', 0.8)
+
+    buckets = [
+        [int(job_id) for job_id in members.split(',')]
+        for (members,) in db.session.query(func.group_concat(JobLSHBand.job_id))
+        .group_by(JobLSHBand.band, JobLSHBand.bucket)
+        .having(func.count(JobLSHBand.id) > 1)
+    ]
+    signatures = _signatures({job_id for members in buckets for job_id in members})
+
+    parent: Dict[int, int] = {}
+    weakest: Dict[int, float] = {}
+
+    def find(job_id: int) -> int:
+        while parent.setdefault(job_id, job_id) != job_id:
+            parent[job_id] = parent[parent[job_id]]
+            job_id = parent[job_id]
+        return job_id
+
+    checked = set()
+    for members in buckets:
+        members = sorted(job_id for job_id in set(members) if job_id in signatures)
+        for i, first in enumerate(members):
+            for second in members[i + 1:]:
+                if (first, second) in checked:
+                    continue
+                checked.add((first, second))
+                score = similarity(signatures[first], signatures[second])
+                if score < threshold:
+                    continue
+                root_first, root_second = find(first), find(second)
+                root = min(root_first, root_second)
+                weakest[root] = min(score, weakest.get(root_first, 1.0), weakest.get(root_second, 1.0))
+                parent[max(root_first, root_second)] = root
+
+    clusters: Dict[int, List[int]] = {}
+    for job_id in parent:
+        clusters.setdefault(find(job_id), []).append(job_id)
+    clusters = {root: members for root, members in clusters.items() if len(members) > 1}
+
+    jobs = {}
+    job_ids = [job_id for members in clusters.values() for job_id in members]
+    for start in range(0, len(job_ids), BATCH_SIZE):
+        jobs.update((job.id, job) for job in Job.query.filter(Job.id.in_(job_ids[start:start + BATCH_SIZE])))
+
+    groups = [
+        {'jobs': [jobs[job_id] for job_id in sorted(members) if job_id in jobs], 'similarity': weakest[root]}
+        for root, members in clusters.items()
+    ]
+    groups.sort(key=lambda group: (-len(group['jobs']), group['jobs'][0].id if group['jobs'] else 0))
+    return groups
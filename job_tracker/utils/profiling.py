@@ -0,0 +1,226 @@
+"""
+Opt-in per-request profiler.
+A sampling thread records the stacks of the request thread while SQLAlchemy and template signals record
+query and render timings; results are written per endpoint as collapsed stacks (for flamegraph.pl or
+speedscope) and a JSON summary.
+"""
+
+import hmac
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+from flask import before_render_template, g, request, template_rendered
+from sqlalchemy import event
+
+# Literals are replaced so repeated statements with different parameters group together
+_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_UNSAFE_FILENAME = re.compile(r'[^A-Za-z0-9_.-]+')
+
+
+def normalize_statement(statement: str) -> str:
+    """Collapse whitespace and literals so the same query shape is counted once."""
+    return _LITERAL_PATTERN.sub('?', ' '.join(statement.split()))
+
+
+class StackSampler:
+    """Samples one thread's Python stack at a fixed interval into collapsed-stack counts."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='request-profiler', daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}')
+                frame = frame.f_back
+            self.stacks[';'.join(reversed(stack))] += 1
+
+
+class RequestProfile:
+    """Measurements collected for one profiled request."""
+
+    def __init__(self, interval: float):
+        self.started = time.perf_counter()
+        self.sampler = StackSampler(threading.get_ident(), interval)
+        self.queries: List[Dict] = []
+        self.templates: List[Dict] = []
+        self.duration = 0.0
+        self._query_start: Optional[float] = None
+        self._template_starts: Dict[str, tuple] = {}
+
+    @property
+    def query_time(self) -> float:
+        return sum(query['seconds'] for query in self.queries)
+
+    def summary(self, endpoint: str, status: int) -> Dict:
+        """Build the JSON summary, including statements repeated within the request (likely N+1 queries)."""
+        repeated = Counter(query['statement'] for query in self.queries)
+        return {
+            'endpoint': endpoint,
+            # The profile token is left out so it is never written to disk
+            'path': request.path,
+            'args': {key: value for key, value in request.args.items() if key != 'profile'},
+            'status': status,
+            'timestamp': datetime.utcnow().isoformat(),
+            'duration_ms': round(self.duration * 1000, 2),
+            'samples': sum(self.sampler.stacks.values()),
+            'query_count': len(self.queries),
+            'query_ms': round(self.query_time * 1000, 2),
+            'repeated_queries': [
+                {'statement': statement, 'count': count}
+                for statement, count in repeated.most_common() if count > 1
+            ],
+            'slowest_queries': sorted(self.queries, key=lambda query: query['seconds'], reverse=True)[:10],
+            'templates': self.templates,
+        }
+
+
+class RequestProfiler:
+    """
+    Flask extension that profiles requests when PROFILE_ENABLED is set, or when a request carries
+    ?profile=<PROFILE_TOKEN> or an X-Profile-Token header matching PROFILE_TOKEN.
+    """
+
+    def __init__(self):
+        self.app = None
+        self.enabled = False
+        self.token: Optional[str] = None
+        self.output_dir = None
+        self.interval = 0.005
+        self._write_lock = threading.Lock()
+
+    def init_app(self, app, engine):
+        """
+        Register request hooks, template signals and SQL event listeners.
+
+        Args:
+            app: Flask application
+            engine: SQLAlchemy engine whose queries are recorded
+        """
+        self.app = app
+        self.enabled = app.config.get('PROFILE_ENABLED', False)
+        self.token = app.config.get('PROFILE_TOKEN') or None
+        self.output_dir = app.config.get('PROFILE_DIR') or os.path.join(app.instance_path, 'profiles')
+        self.interval = app.config.get('PROFILE_INTERVAL_MS', 5) / 1000.0
+        app.extensions['request_profiler'] = self
+
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        app.teardown_request(self._teardown)
+        before_render_template.connect(self._before_render, app)
+        template_rendered.connect(self._after_render, app)
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+
+    def _requested(self) -> bool:
+        """Whether the current request should be profiled; the per-request switch needs the admin token."""
+        if self.enabled:
+            return True
+        if not self.token:
+            return False
+        supplied = request.args.get('profile') or request.headers.get('X-Profile-Token') or ''
+        return hmac.compare_digest(supplied.encode(), self.token.encode())
+
+    @staticmethod
+    def _current() -> Optional[RequestProfile]:
+        try:
+            return g.get('request_profile')
+        except RuntimeError:
+            # Outside a request/app context (e.g. background task workers)
+            return None
+
+    def _start(self):
+        if self._requested():
+            g.request_profile = RequestProfile(self.interval)
+            g.request_profile.sampler.start()
+
+    def _finish(self, response):
+        if (profile := g.pop('request_profile', None)) is None:
+            return response
+        profile.sampler.stop()
+        profile.duration = time.perf_counter() - profile.started
+        response.headers['Server-Timing'] = (
+            f'db;dur={profile.query_time * 1000:.2f};desc="{len(profile.queries)} queries", '
+            f'total;dur={profile.duration * 1000:.2f}'
+        )
+        self._write(profile, response.status_code)
+        return response
+
+    def _teardown(self, exc):
+        # Requests that raised never reach after_request; still stop the sampler and keep the data
+        if (profile := g.pop('request_profile', None)) is not None:
+            profile.sampler.stop()
+            profile.duration = time.perf_counter() - profile.started
+            self._write(profile, 500)
+
+    def _write(self, profile: RequestProfile, status: int) -> None:
+        """Append the stacks to <endpoint>.collapsed and save a timestamped JSON summary."""
+        endpoint = request.endpoint or 'unknown'
+        name = _UNSAFE_FILENAME.sub('_', endpoint)
+        summary = profile.summary(endpoint, status)
+        stamp = datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')
+
+        with self._write_lock:
+            os.makedirs(self.output_dir, exist_ok=True)
+            with open(os.path.join(self.output_dir, f'{name}.collapsed'), 'a', encoding='utf-8') as f:
+                for stack, count in profile.sampler.stacks.items():
+                    f.write(f'{stack} {count}\n')
+            with open(os.path.join(self.output_dir, f'{name}.{stamp}.json'), 'w', encoding='utf-8') as f:
+                json.dump(summary, f, indent=2)
+
+        if summary['repeated_queries']:
+            self.app.logger.warning(
+                "Repeated queries in %s: %s", endpoint,
+                ', '.join(f"{item['count']}x {item['statement'][:80]}" for item in summary['repeated_queries'][:3])
+            )
+
+    def _before_render(self, sender, template, context, **extra):
+        if (profile := self._current()) is not None:
+            profile._template_starts[template.name] = (time.perf_counter(), len(profile.queries))
+
+    def _after_render(self, sender, template, context, **extra):
+        if (profile := self._current()) is not None and template.name in profile._template_starts:
+            started, queries_before = profile._template_starts.pop(template.name)
+            # Queries issued while rendering usually come from lazy-loaded relationships in the template
+            profile.templates.append({
+                'template': template.name,
+                'ms': round((time.perf_counter() - started) * 1000, 2),
+                'queries': len(profile.queries) - queries_before,
+            })
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if (profile := self._current()) is not None:
+            profile._query_start = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if (profile := self._current()) is not None and profile._query_start is not None:
+            profile.queries.append({
+                'statement': normalize_statement(statement),
+                'seconds': time.perf_counter() - profile._query_start,
+            })
+            profile._query_start = None
+
+
+request_profiler = RequestProfiler()
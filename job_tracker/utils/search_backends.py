@@ -0,0 +1,163 @@
+"""
+Pluggable web search backends for company URL discovery.
+URLDiscovery only needs search(query) -> [{"link": ...}, ...]; the backend is chosen with SEARCH_BACKEND
+('simulated', 'fixture' or 'http') or replaced at runtime with set_search_backend().
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+import requests
+
+class SearchError(Exception):
+    """A search could not be run (network error, bad response). Not the same as a search without results."""
+
+
+class SearchBackend:
+    """Interface for search providers used by URLDiscovery."""
+
+    def search(self, query: str, num_results: int = 10) -> List[Dict]:
+        """
+        Run a web search.
+
+        Args:
+            query: Search query
+            num_results: Maximum number of results
+
+        Returns:
+            List of result dictionaries with at least a "link" key
+
+        Raises:
+            SearchError: If the provider could not be reached or answered with an error
+        """
+        raise NotImplementedError
+
+
+class SimulatedSearchBackend(SearchBackend):
+    """Offline backend that derives plausible results from the company name in the query."""
+
+    def search(self, query: str, num_results: int = 10) -> List[Dict]:
+        simulated_results = []
+
+        if "official website" in query:
+            company_name = query.replace("official website", "").strip().lower()
+            domain_name = company_name.replace(" ", "").replace(",", "").replace(".", "")
+            simulated_results = [
+                {"link": f"https://www.{domain_name}.com"},
+                {"link": f"https://www.{domain_name}.io"},
+                {"link": f"https://www.linkedin.com/company/{domain_name}"},
+                {"link": f"https://en.wikipedia.org/wiki/{company_name.replace(' ', '_')}"}
+            ]
+        elif "linkedin company" in query:
+            company_name = query.replace("linkedin company", "").strip().lower()
+            domain_name = company_name.replace(" ", "").replace(",", "").replace(".", "")
+            simulated_results = [
+                {"link": f"https://www.linkedin.com/company/{domain_name}"},
+                {"link": f"https://www.linkedin.com/company/{domain_name.replace(' ', '-')}"},
+                {"link": f"https://www.{domain_name}.com/about"},
+                {"link": f"https://www.glassdoor.com/Overview/{domain_name}-Overview-EI_IE12345.11,20.htm"}
+            ]
+        elif "glassdoor reviews" in query:
+            company_name = query.replace("glassdoor reviews", "").strip().lower()
+            domain_name = company_name.replace(" ", "").replace(",", "").replace(".", "")
+            simulated_results = [
+                {"link": f"https://www.glassdoor.com/Reviews/{domain_name.title()}-Reviews-E12345.htm"},
+                {"link": f"https://www.glassdoor.com/Reviews/{domain_name.replace(' ', '-')}-Reviews-E12345.htm"},
+                {"link": f"https://www.indeed.com/cmp/{domain_name}/reviews"},
+                {"link": f"https://www.linkedin.com/company/{domain_name}/reviews"}
+            ]
+
+        return simulated_results[:num_results]
+
+
+class FixtureSearchBackend(SearchBackend):
+    """
+    Local backend answering from a fixed {query: [results]} mapping, for tests.
+
+    Queries are matched case-insensitively; unknown queries return no results. `latency`
+    (seconds, or a {query: seconds} mapping) simulates slow searches.
+    """
+
+    def __init__(self, results: Dict[str, List[Dict]], latency=0.0):
+        self.results = {query.lower().strip(): items for query, items in results.items()}
+        self.latency = latency
+        self.queries: List[str] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path: str, latency=0.0) -> 'FixtureSearchBackend':
+        """Load the mapping from a JSON file."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f), latency)
+
+    def search(self, query: str, num_results: int = 10) -> List[Dict]:
+        key = query.lower().strip()
+        with self._lock:
+            self.queries.append(key)
+        delay = self.latency.get(key, 0.0) if isinstance(self.latency, dict) else self.latency
+        if delay:
+            time.sleep(delay)
+        return list(self.results.get(key, []))[:num_results]
+
+
+class HTTPSearchBackend(SearchBackend):
+    """
+    JSON search API backend (Google Custom Search style: GET ?q=&num=&key= returning {"items": [{"link"}]}).
+    """
+
+    def __init__(self, endpoint: str, api_key: Optional[str], timeout: float = 5):
+        self.endpoint = endpoint
+        self.api_key = api_key
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def search(self, query: str, num_results: int = 10) -> List[Dict]:
+        try:
+            response = self.session.get(
+                self.endpoint,
+                params={"q": query, "num": num_results, "key": self.api_key},
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            return response.json().get("items", [])[:num_results]
+        except (requests.RequestException, ValueError) as e:
+            # Raised rather than returned as [] so an outage is not cached as "no results"
+            raise SearchError(f"Search request failed: {e}") from e
+
+
+_backend: Optional[SearchBackend] = None
+_backend_lock = threading.Lock()
+
+
+def _backend_from_env() -> SearchBackend:
+    name = os.environ.get('SEARCH_BACKEND', 'simulated')
+    if name == 'fixture':
+        return FixtureSearchBackend.from_file(os.environ['SEARCH_FIXTURE_PATH'])
+    if name == 'http':
+        return HTTPSearchBackend(
+            os.environ['SEARCH_API_URL'],
+            os.environ.get('SEARCH_API_KEY'),
+            timeout=float(os.environ.get('SEARCH_TIMEOUT_SECONDS', 5))
+        )
+    return SimulatedSearchBackend()
+
+
+def get_search_backend() -> SearchBackend:
+    """
+    Return the process-wide backend, configured from SEARCH_BACKEND (simulated, fixture with
+    SEARCH_FIXTURE_PATH, or http with SEARCH_API_URL/SEARCH_API_KEY/SEARCH_TIMEOUT_SECONDS).
+    """
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = _backend_from_env()
+        return _backend
+
+
+def set_search_backend(backend: Optional[SearchBackend]) -> None:
+    """Replace the process-wide backend (None re-reads the environment on next use)."""
+    global _backend
+    with _backend_lock:
+        _backend = backend
@@ -0,0 +1,245 @@
+"""
+Full-text search over jobs with SQLite FTS5.
+The job_search table holds one document per job (posting fields, parsed sections, notes and contacts)
+and is kept in sync from ORM flushes; Core bulk inserts must call index_jobs() themselves.
+"""
+
+import json
+import logging
+import re
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from markupsafe import Markup, escape
+from sqlalchemy import DateTime, bindparam, event, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+from job_tracker.models import Job, Note, Contact
+
+logger = logging.getLogger(__name__)
+
+SEARCH_COLUMNS = ('title', 'company', 'location', 'description', 'sections', 'notes', 'contacts')
+# bm25() weights, in SEARCH_COLUMNS order: a hit in the title outranks one deep in the description
+COLUMN_WEIGHTS = (10.0, 5.0, 2.0, 1.0, 1.0, 2.0, 2.0)
+# Job columns whose changes require re-indexing the job
+INDEXED_JOB_COLUMNS = ('title', 'company', 'location', 'description', 'parsed_data')
+
+CREATE_TABLE_SQL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS job_search USING fts5("
+    f"{', '.join(SEARCH_COLUMNS)}, tokenize = 'porter unicode61 remove_diacritics 2')"
+)
+# Highlight markers are control characters so they survive HTML escaping of the snippet text
+MARK_START, MARK_END = '\x02', '\x03'
+BATCH_SIZE = 500
+WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+_indexed_engines: 'weakref.WeakSet[Engine]' = weakref.WeakSet()
+
+
+def ensure_search_index(engine: Engine) -> bool:
+    """
+    Create the job_search table if it is missing and fill it from the existing jobs.
+
+    Args:
+        engine: SQLAlchemy engine of the application database
+
+    Returns:
+        True if the index is available (SQLite with FTS5), False otherwise
+    """
+    if engine.dialect.name != 'sqlite':
+        return False
+
+    with engine.begin() as connection:
+        exists = connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_search'")
+        ).first()
+        try:
+            connection.execute(text(CREATE_TABLE_SQL))
+        except Exception:
+            logger.warning("SQLite was built without FTS5; job search is disabled", exc_info=True)
+            return False
+        _indexed_engines.add(engine)
+        if not exists:
+            rebuild_search_index(connection)
+    return True
+
+
+def rebuild_search_index(connection: Connection) -> int:
+    """Re-index every job. Returns the number of jobs indexed."""
+    connection.execute(text("DELETE FROM job_search"))
+    job_ids = [row[0] for row in connection.execute(text("SELECT id FROM job"))]
+    index_jobs(connection, job_ids)
+    return len(job_ids)
+
+
+def _flatten_sections(parsed_data: Optional[str]) -> str:
+    """Join the titles and content of the parsed description sections into plain text."""
+    try:
+        sections = json.loads(parsed_data).get('sections') or []
+    except (TypeError, ValueError, AttributeError):
+        return ''
+
+    parts = []
+    for section in sections:
+        if not isinstance(section, dict):
+            continue
+        parts.append(str(section.get('title') or ''))
+        content = section.get('content')
+        if isinstance(content, list):
+            parts.extend(str(item) for item in content)
+        elif content:
+            parts.append(str(content))
+    return '\n'.join(part for part in parts if part)
+
+
+def _select_in(connection: Connection, sql: str, ids: List[int]):
+    """Run a query with an expanding :ids parameter."""
+    return connection.execute(text(sql).bindparams(bindparam('ids', expanding=True)), {'ids': ids})
+
+
+def index_jobs(connection: Connection, job_ids: Iterable[int]) -> None:
+    """
+    Replace the search documents of the given jobs; ids of deleted jobs are just removed.
+    Does nothing when the database has no search index (see ensure_search_index).
+
+    Args:
+        connection: Connection in the transaction that wrote the jobs
+        job_ids: Jobs to (re-)index
+    """
+    if connection.engine not in _indexed_engines:
+        return
+    job_ids = sorted(set(job_ids))
+    for start in range(0, len(job_ids), BATCH_SIZE):
+        ids = job_ids[start:start + BATCH_SIZE]
+
+        notes: Dict[int, List[str]] = {}
+        for job_id, content in _select_in(connection, "SELECT job_id, content FROM note WHERE job_id IN :ids", ids):
+            notes.setdefault(job_id, []).append(content or '')
+
+        contacts: Dict[int, List[str]] = {}
+        for job_id, *fields in _select_in(
+            connection, "SELECT job_id, name, title, email, phone, linkedin, notes FROM contact WHERE job_id IN :ids", ids
+        ):
+            contacts.setdefault(job_id, []).append(' '.join(field for field in fields if field))
+
+        documents = [
+            {
+                'id': job_id, 'title': title or '', 'company': company or '', 'location': location or '',
+                'description': description or '', 'sections': _flatten_sections(parsed_data),
+                'notes': '\n'.join(notes.get(job_id, [])), 'contacts': '\n'.join(contacts.get(job_id, [])),
+            }
+            for job_id, title, company, location, description, parsed_data in _select_in(
+                connection,
+                "SELECT id, title, company, location, description, parsed_data FROM job WHERE id IN :ids",
+                ids
+            )
+        ]
+
+        _select_in(connection, "DELETE FROM job_search WHERE rowid IN :ids", ids)
+        if documents:
+            connection.execute(
+                text(f"INSERT INTO job_search (rowid, {', '.join(SEARCH_COLUMNS)}) "
+                     f"VALUES (:id, {', '.join(':' + column for column in SEARCH_COLUMNS)})"),
+                documents
+            )
+
+
+def _changed_job_ids(session: Session) -> Set[int]:
+    """Ids of jobs whose search document is affected by the flush in progress."""
+    job_ids = set()
+    for obj in session.new | session.deleted:
+        if isinstance(obj, Job):
+            job_ids.add(obj.id)
+        elif isinstance(obj, (Note, Contact)):
+            job_ids.add(obj.job_id)
+
+    for obj in session.dirty:
+        if isinstance(obj, Job):
+            state = inspect(obj)
+            if any(state.attrs[column].history.has_changes() for column in INDEXED_JOB_COLUMNS):
+                job_ids.add(obj.id)
+        elif isinstance(obj, (Note, Contact)) and session.is_modified(obj):
+            job_ids.add(obj.job_id)
+            history = inspect(obj).attrs['job_id'].history
+            job_ids.update(history.deleted or ())
+
+    job_ids.discard(None)
+    return job_ids
+
+
+@event.listens_for(Note.job_id, 'set', active_history=True)
+@event.listens_for(Contact.job_id, 'set', active_history=True)
+def _track_previous_job(target, value, oldvalue, initiator):
+    """
+    No-op; registering with active_history loads the old job_id of an expired note or contact
+    before it is replaced, so _changed_job_ids can re-index the job it was moved away from.
+    """
+
+
+@event.listens_for(Session, 'after_flush')
+def _sync_search_index(session, flush_context):
+    """Re-index the jobs touched by a flush inside the same transaction."""
+    job_ids = _changed_job_ids(session)
+    if job_ids:
+        index_jobs(session.connection(), job_ids)
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """
+    Turn free text into an FTS5 query: every word must match and the last one may be a prefix.
+
+    Words are quoted, so FTS5 operators and punctuation typed by the user cannot cause syntax errors.
+    """
+    words = WORD_PATTERN.findall(query or '')
+    if not words:
+        return None
+    return ' '.join(f'"{word}"' for word in words) + '*'
+
+
+def _highlight(value: Optional[str]) -> Markup:
+    """Escape a snippet and turn the FTS5 markers into <mark> tags."""
+    return Markup(str(escape(value or '')).replace(MARK_START, '<mark>').replace(MARK_END, '</mark>'))
+
+
+def search_jobs(session: Session, query: str, limit: int = 20, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Rank jobs matching a free-text query with bm25.
+
+    Args:
+        session: Database session
+        query: Text typed by the user
+        limit: Maximum number of results
+        offset: Number of results to skip
+
+    Returns:
+        Tuple of (results, total matches); each result has id, title, company, location,
+        status, date_added, rank and an HTML-safe snippet with the matches highlighted
+    """
+    match = build_match_query(query)
+    if match is None:
+        return [], 0
+
+    total = session.execute(text("SELECT count(*) FROM job_search WHERE job_search MATCH :match"),
+                            {'match': match}).scalar()
+    rows = session.execute(
+        text(f"""
+            SELECT job.id, job.title, job.company, job.location, job.status, job.date_added,
+                   bm25(job_search, {', '.join(str(weight) for weight in COLUMN_WEIGHTS)}) AS rank,
+                   highlight(job_search, 0, :start, :end) AS title_html,
+                   highlight(job_search, 1, :start, :end) AS company_html,
+                   snippet(job_search, -1, :start, :end, '…', 16) AS snippet
+            FROM job_search JOIN job ON job.id = job_search.rowid
+            WHERE job_search MATCH :match
+            ORDER BY rank
+            LIMIT :limit OFFSET :offset
+        """).columns(date_added=DateTime),
+        {'match': match, 'start': MARK_START, 'end': MARK_END, 'limit': limit, 'offset': offset}
+    ).mappings().all()
+
+    results = []
+    for row in rows:
+        result = dict(row)
+        result['title_html'] = _highlight(row['title_html'])
+        result['company_html'] = _highlight(row['company_html'])
+        result['snippet'] = _highlight(row['snippet'])
+        results.append(result)
+    return results, total
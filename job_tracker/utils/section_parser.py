@@ -0,0 +1,254 @@
+"""
+Heuristic job description section parser.
+All section header patterns are compiled once at import into a single alternation; one pass over the
+description finds every header line, and the text is then sliced into sections linearly.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Optional markdown decoration around a header ("## Benefits", "**Benefits**")
+_HEADER_PREFIX = r'^[ \t]*(?:#{1,6}[ \t]*|\*\*|__)?'
+# A title header is the phrase alone on its line, optionally "& More words", ending in ":" or end of line;
+# closing bold markers may come before or after the colon ("**Benefits**:", "**Benefits:**")
+_TITLE_SUFFIX = r'(?:[ \t]+(?:&|and)[ \t]+[\w ]{1,25}?)?[ \t]*(?:\*\*|__)?[ \t]*(?::(?:\*\*|__)?|$)'
+_APOS = "['’]"
+
+# (section title, title header phrases, lead-in phrases). A title header starts a section whose content
+# follows the header; a lead-in phrase starts a paragraph that itself belongs to the section.
+# Order matters where phrases overlap: earlier entries win at the same position.
+SECTION_DEFINITIONS: List[Tuple[str, List[str], List[str]]] = [
+    ("About the Role", [
+        r'about the (?:role|position|job|opportunity)',
+        r'(?:role|job|position) (?:overview|summary|description)',
+        r'the (?:role|opportunity)',
+    ], [
+        r'we(?: are|' + _APOS + r're) (?:looking for|seeking|hiring)',
+        r'the ideal candidate',
+    ]),
+    ("About the Company", [
+        r'about (?:us|the company|our company)',
+        r'about (?!the (?:role|position|job|opportunity)\b)[^\n:]{1,40}?',
+        r'company (?:description|overview)',
+        r'who we are',
+        r'our (?:story|mission|values)',
+    ], []),
+    ("Responsibilities", [
+        r'(?:key |main |primary |core |your )?(?:responsibilities|duties)',
+        r'job duties',
+        r'what you' + _APOS + r'll (?:do|be doing|be working on)',
+        r'what you will (?:do|be doing|be working on)',
+        r'day[ -]to[ -]day',
+        r'your role',
+        r'in this role',
+    ], [
+        r'in this role,? you will',
+        r'you will be responsible for',
+        r'your responsibilities include',
+        r'as (?:a|an|the) [^\n,]{1,30}, you will',
+    ]),
+    ("Skills", [
+        r'(?:technical |professional |soft |required |must[ -]have |key )?skills',
+        r'technical (?:requirements|qualifications|proficiency)',
+        r'tech(?:nology)? stack',
+        r'programming languages',
+        r'tools (?:&|and) technologies',
+        r'you (?:should|must) know',
+    ], []),
+    ("Requirements", [
+        r'(?:key |minimum |basic |preferred |required |job )?(?:requirements|qualifications)',
+        r'what you' + _APOS + r'll (?:need|bring)',
+        r'what you (?:need|will bring|need to have)',
+        r'what we(?: are|' + _APOS + r're) looking for',
+        r'you should have',
+        r'who you are',
+        r'we need someone who has',
+        r'nice to have',
+        r'bonus points(?: if you have)?',
+    ], []),
+    ("Education", [
+        r'education(?:al requirements)?',
+        r'academic(?: requirements| qualifications)?',
+        r'degree requirements',
+    ], [
+        r'(?:bachelor|master)' + _APOS + r's',
+        r'(?:a |an )?(?:degree|diploma) in',
+    ]),
+    ("Experience", [
+        r'(?:professional |work |required |minimum )?experience',
+        r'years of experience',
+    ], [
+        r'(?:at least |minimum of )?\d+\+? years',
+    ]),
+    ("Benefits", [
+        r'(?:our )?benefits',
+        r'perks(?: (?:&|and) benefits)?',
+        r'compensation(?: (?:&|and) benefits)?',
+        r'what we offer',
+        r'what' + _APOS + r's in it for you',
+        r'why (?:work (?:for|with)|join) us',
+        r'our offering',
+        r'what to expect',
+    ], [
+        r'(?:in return,? )?we offer',
+        r'you' + _APOS + r'll receive',
+        r'we provide',
+        r'(?:the |our )?package includes',
+    ]),
+    ("Additional Information", [
+        r'additional information',
+        r'(?:more|other) information',
+        r'notes',
+        r'(?:how )?to apply',
+        r'application process',
+        r'about the process',
+        r'equal (?:employment )?opportunity',
+        r'diversity(?: (?:&|and) inclusion)?',
+        r'accessibility',
+    ], [
+        r'we are an equal opportunity',
+        r'equal opportunity employer',
+    ]),
+]
+
+
+def _compile_header_pattern() -> Tuple[re.Pattern, Dict[str, Tuple[str, bool]]]:
+    """Build the combined header regex and a map of group name -> (section title, is_lead_in)."""
+    alternatives = []
+    groups = {}
+    for index, (title, title_phrases, lead_in_phrases) in enumerate(SECTION_DEFINITIONS):
+        name = f't{index}'
+        alternatives.append(f'(?P<{name}>(?:{"|".join(title_phrases)}){_TITLE_SUFFIX})')
+        groups[name] = (title, False)
+        if lead_in_phrases:
+            name = f'l{index}'
+            alternatives.append(f'(?P<{name}>(?:{"|".join(lead_in_phrases)})\\b)')
+            groups[name] = (title, True)
+    pattern = re.compile(_HEADER_PREFIX + '(?:' + '|'.join(alternatives) + ')', re.IGNORECASE | re.MULTILINE)
+    return pattern, groups
+
+
+HEADER_PATTERN, HEADER_GROUPS = _compile_header_pattern()
+BULLET_PATTERN = re.compile(r'(?:^|\n)[ \t]*(?:•|\*|-|\d+[\.\)]|\([a-z0-9]\))[ \t]+')
+BLANK_LINE_PATTERN = re.compile(r'\n[ \t]*\n')
+EDUCATION_PATTERN = re.compile(r'degree|education|bachelor|master|phd|diploma', re.IGNORECASE)
+EXPERIENCE_PATTERN = re.compile(r'\d+\+? years|experience in|experience with', re.IGNORECASE)
+
+MIN_SECTION_LENGTH = 30
+MAX_LIST_LINE_LENGTH = 150
+
+
+def find_headers(description: str) -> List[Tuple[str, int, int]]:
+    """
+    Locate section headers in one pass over the description.
+
+    A lead-in phrase only opens a section at the start of the text, after a blank line, or
+    right after another lead-in section; inside a titled section it is treated as content.
+
+    Returns:
+        List of (section title, header line start, content start) in text order
+    """
+    headers = []
+    previous_is_lead_in = True
+    for match in HEADER_PATTERN.finditer(description):
+        title, is_lead_in = HEADER_GROUPS[match.lastgroup]
+        if is_lead_in:
+            start = match.start()
+            # Matches begin at a line start, so check whether the previous line is blank
+            previous_line = description[description.rfind('\n', 0, max(start - 1, 0)) + 1:max(start - 1, 0)]
+            paragraph_start = start == 0 or not previous_line.strip()
+            if headers and not (paragraph_start or previous_is_lead_in):
+                continue
+            headers.append((title, match.start(), match.start()))
+        else:
+            headers.append((title, match.start(), match.end()))
+        previous_is_lead_in = is_lead_in
+    return headers
+
+
+def _build_section(title: str, body: str) -> Optional[Dict[str, Any]]:
+    """Classify a section body as a list or a paragraph and build the section dictionary."""
+    body = body.strip()
+    if len(body) <= MIN_SECTION_LENGTH:
+        return None
+
+    if BULLET_PATTERN.search(body):
+        items = [item.strip() for item in BULLET_PATTERN.split(body) if item.strip()]
+        return {"title": title, "type": "list", "content": items}
+
+    lines = [line.strip() for line in body.splitlines() if line.strip()]
+    if len(lines) >= 3 and all(len(line) <= MAX_LIST_LINE_LENGTH for line in lines):
+        return {"title": title, "type": "list", "content": lines}
+
+    return {"title": title, "type": "paragraph", "content": body}
+
+
+def _split_out(sections: List[Dict[str, Any]], source_title: str, title: str, pattern: re.Pattern) -> None:
+    """
+    Move matching items/lines from one section into a new section when it has no dedicated section.
+
+    Nothing is moved if half or more of the source content matches.
+    """
+    if any(section["title"] == title for section in sections):
+        return
+
+    for section in sections:
+        if section["title"] != source_title:
+            continue
+        content = section["content"]
+        if isinstance(content, list):
+            matched = [item for item in content if pattern.search(item)]
+            if matched and len(matched) < len(content) / 2:
+                sections.append({"title": title, "type": "list", "content": matched})
+                matched_items = set(matched)
+                section["content"] = [item for item in content if item not in matched_items]
+        elif isinstance(content, str):
+            lines = content.splitlines()
+            matched = [line for line in lines if pattern.search(line)]
+            if matched and len(''.join(matched)) < len(content) / 2:
+                sections.append({"title": title, "type": "paragraph", "content": '\n'.join(matched)})
+                matched_lines = set(matched)
+                section["content"] = '\n'.join(line for line in lines if line not in matched_lines).strip()
+        return
+
+
+def parse_sections(description: str) -> List[Dict[str, Any]]:
+    """
+    Split a job description into titled sections.
+
+    Args:
+        description: Raw job description text
+
+    Returns:
+        List of {"title", "type": "paragraph"|"list", "content"} dictionaries in text order;
+        a single "Job Description" section if no headers are found
+    """
+    text = (description or '').replace('\r\n', '\n')
+    headers = find_headers(text)
+
+    # Slice the text between consecutive headers; repeated titles are merged
+    bodies: Dict[str, List[str]] = {}
+    for index, (title, _, content_start) in enumerate(headers):
+        end = headers[index + 1][1] if index + 1 < len(headers) else len(text)
+        body = text[content_start:end]
+        if content_start == headers[index][1]:
+            # Lead-in paragraphs end at the first blank line
+            if blank := BLANK_LINE_PATTERN.search(body):
+                body = body[:blank.start()]
+        bodies.setdefault(title, []).append(body.strip())
+
+    sections = []
+    for title, parts in bodies.items():
+        if section := _build_section(title, '\n'.join(part for part in parts if part)):
+            sections.append(section)
+
+    _split_out(sections, "Requirements", "Education", EDUCATION_PATTERN)
+    _split_out(sections, "Requirements", "Experience", EXPERIENCE_PATTERN)
+
+    if not sections:
+        sections.append({
+            "title": "Job Description",
+            "type": "paragraph",
+            "content": text.strip()
+        })
+    return sections
@@ -0,0 +1,101 @@
+"""
+SQLite engine profiles.
+This module holds the connection pragmas and pool settings applied to the SQLAlchemy engine.
+"""
+
+import os
+from typing import Any, Dict
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# PRAGMA name -> value, applied in order on every new DBAPI connection
+SQLITE_PROFILES: Dict[str, Dict[str, Any]] = {
+    # SQLite defaults: rollback journal, readers block while a writer commits
+    "default": {},
+    # WAL lets readers proceed while a writer commits; NORMAL sync is safe with WAL
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "cache_size": -64000,  # negative values are KiB, i.e. 64 MB per connection
+        "mmap_size": 268435456,  # 256 MB
+        "temp_store": "MEMORY",
+    },
+}
+
+DEFAULT_PROFILE = "performance"
+
+
+def _is_file_sqlite(database_uri: str) -> bool:
+    """Return True for SQLite URIs backed by a file (pool and WAL settings do not apply to :memory:)."""
+    return database_uri.startswith("sqlite") and ":memory:" not in database_uri and database_uri.rstrip("/") != "sqlite:"
+
+
+def get_profile(profile_name: str) -> Dict[str, Any]:
+    """
+    Look up a profile by name.
+
+    Args:
+        profile_name: Key of SQLITE_PROFILES
+
+    Returns:
+        Dictionary of pragmas
+
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    try:
+        return SQLITE_PROFILES[profile_name]
+    except KeyError:
+        raise ValueError(f"Unknown database profile '{profile_name}'. Choose one of: {', '.join(SQLITE_PROFILES)}")
+
+
+def get_engine_options(profile_name: str, database_uri: str) -> Dict[str, Any]:
+    """
+    Build SQLALCHEMY_ENGINE_OPTIONS for a profile.
+
+    Pool sizes can be overridden with DB_POOL_SIZE, DB_MAX_OVERFLOW and DB_POOL_TIMEOUT.
+
+    Args:
+        profile_name: Key of SQLITE_PROFILES
+        database_uri: Configured SQLALCHEMY_DATABASE_URI
+
+    Returns:
+        Keyword arguments for sqlalchemy.create_engine
+    """
+    pragmas = get_profile(profile_name)
+    if not _is_file_sqlite(database_uri) or not pragmas:
+        return {}
+
+    return {
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", 10)),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 20)),
+        "pool_timeout": int(os.environ.get("DB_POOL_TIMEOUT", 30)),
+        "connect_args": {
+            # sqlite3's own lock wait, in seconds; matches busy_timeout
+            "timeout": pragmas.get("busy_timeout", 5000) / 1000,
+            "check_same_thread": False,
+        },
+    }
+
+
+def register_sqlite_pragmas(engine: Engine, profile_name: str) -> None:
+    """
+    Apply the profile's pragmas to every new connection made by the engine.
+
+    Args:
+        engine: SQLAlchemy engine
+        profile_name: Key of SQLITE_PROFILES
+    """
+    pragmas = get_profile(profile_name)
+    if engine.dialect.name != "sqlite" or not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
@@ -0,0 +1,60 @@
+"""
+In-process cache for dashboard statistics.
+The status histogram is computed with a single GROUP BY query and reused until a job write path invalidates it.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+from flask import current_app
+from sqlalchemy import func
+from job_tracker import db
+from job_tracker.models import Job
+
+INTERVIEW_STATUSES = ('Phone Interview', 'Technical Interview', 'Onsite Interview')
+
+_lock = threading.Lock()
+_histogram: Optional[Dict[str, int]] = None
+_loaded_at = 0.0
+# Bumped by every invalidation; a result is only stored if no invalidation happened while it was computed
+_generation = 0
+
+
+def get_status_histogram() -> Dict[str, int]:
+    """
+    Return a mapping of job status to job count.
+
+    The result is cached in-process. Entries also expire after STATUS_CACHE_TTL
+    seconds so that writes made by other worker processes become visible.
+
+    Returns:
+        Dictionary of {status: count}; jobs without a status are counted under 'Saved'
+    """
+    global _histogram, _loaded_at
+
+    ttl = current_app.config.get('STATUS_CACHE_TTL', 300)
+    with _lock:
+        if _histogram is not None and time.monotonic() - _loaded_at < ttl:
+            return dict(_histogram)
+        generation = _generation
+
+    rows = db.session.query(Job.status, func.count(Job.id)).group_by(Job.status).all()
+    histogram: Dict[str, int] = {}
+    for status, count in rows:
+        status = status or 'Saved'
+        histogram[status] = histogram.get(status, 0) + count
+
+    with _lock:
+        # Counts read before a concurrent write may predate it; return them but do not cache them
+        if generation == _generation:
+            _histogram = histogram
+            _loaded_at = time.monotonic()
+    return dict(histogram)
+
+
+def invalidate_status_histogram() -> None:
+    """Drop the cached histogram; call after any commit that adds, removes or changes a job's status."""
+    global _histogram, _generation
+    with _lock:
+        _histogram = None
+        _generation += 1
@@ -0,0 +1,162 @@
+"""
+In-process background task queue.
+Tasks are persisted in the task table so they survive restarts and are executed by a thread pool
+inside each web worker. Handlers are registered per task type with TaskQueue.handler().
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+from sqlalchemy import update
+from job_tracker import db
+from job_tracker.models import Job, Task
+
+ACTIVE_STATUSES = ('pending', 'running')
+
+
+class TaskQueue:
+    """Thread-pool task runner backed by the Task model."""
+
+    def __init__(self):
+        self.app = None
+        self.eager = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._handlers: Dict[str, Callable[[Task, Dict[str, Any]], Any]] = {}
+
+    def handler(self, task_type: str):
+        """
+        Decorator registering the function that executes a task type.
+
+        The function receives the Task row and its decoded payload and returns a
+        JSON-serializable result. It runs inside an application context and its
+        session changes are committed together with the task status. A handler may
+        commit partial progress itself; that part is kept if the task later fails.
+        """
+        def decorator(func):
+            self._handlers[task_type] = func
+            return func
+        return decorator
+
+    def init_app(self, app):
+        """
+        Start the worker pool for an application and resubmit unfinished tasks.
+
+        Uses TASK_QUEUE_WORKERS threads; TASK_QUEUE_EAGER (or zero workers) runs
+        tasks synchronously in the caller instead.
+        """
+        self.app = app
+        workers = app.config.get('TASK_QUEUE_WORKERS', 2)
+        self.eager = app.config.get('TASK_QUEUE_EAGER', False) or workers <= 0
+        if not self.eager:
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='task-worker')
+        app.extensions['task_queue'] = self
+
+        with app.app_context():
+            self.recover()
+
+    def enqueue(self, task_type: str, job_id: Optional[int] = None, **payload) -> Task:
+        """
+        Persist a task, mark its job as pending and hand it to the worker pool.
+
+        Args:
+            task_type: Registered handler name
+            job_id: Job the task works on, if any
+            **payload: JSON-serializable task arguments
+
+        Returns:
+            The created Task
+        """
+        if task_type not in self._handlers:
+            raise ValueError(f"No handler registered for task type '{task_type}'")
+
+        task = Task(task_type=task_type, job_id=job_id, payload=json.dumps(payload), status='pending')
+        db.session.add(task)
+        if job_id is not None and (job := db.session.get(Job, job_id)):
+            job.processing_status = 'pending'
+        db.session.commit()
+
+        self._submit(task.id)
+        return task
+
+    def find_active(self, task_type: str, job_id: int) -> Optional[Task]:
+        """Return a pending or running task of this type for the job, if one exists."""
+        return (Task.query
+                .filter(Task.job_id == job_id, Task.task_type == task_type, Task.status.in_(ACTIVE_STATUSES))
+                .first())
+
+    def recover(self) -> None:
+        """
+        Resubmit tasks left unfinished by a previous process.
+
+        Tasks stuck in 'running' for longer than TASK_STALE_SECONDS are assumed to
+        belong to a dead worker and are reset to 'pending' first.
+        """
+        stale_before = datetime.utcnow() - timedelta(seconds=self.app.config.get('TASK_STALE_SECONDS', 600))
+        db.session.execute(
+            update(Task)
+            .where(Task.status == 'running', Task.started_at < stale_before)
+            .values(status='pending')
+        )
+        db.session.commit()
+
+        pending_ids = [task_id for (task_id,) in
+                       db.session.query(Task.id).filter(Task.status == 'pending').order_by(Task.created_at).all()]
+        for task_id in pending_ids:
+            self._submit(task_id)
+
+    def _submit(self, task_id: int) -> None:
+        if self.eager:
+            self._run(task_id)
+        else:
+            self._executor.submit(self._run, task_id)
+
+    def _run(self, task_id: int) -> None:
+        """Claim and execute one task inside a fresh application context."""
+        with self.app.app_context():
+            # Claim atomically so sibling processes recovering the same task do not both run it
+            claimed = db.session.execute(
+                update(Task)
+                .where(Task.id == task_id, Task.status == 'pending')
+                .values(status='running', started_at=datetime.utcnow(), attempts=Task.attempts + 1)
+            ).rowcount
+            db.session.commit()
+            if not claimed:
+                return
+
+            task = db.session.get(Task, task_id)
+            try:
+                payload = json.loads(task.payload) if task.payload else {}
+                result = self._handlers[task.task_type](task, payload)
+                task.status = 'done'
+                task.result = json.dumps(result)
+            except Exception as e:
+                db.session.rollback()
+                task = db.session.get(Task, task_id)
+                task.status = 'failed'
+                task.error = str(e)
+                self.app.logger.exception("Task %s (%s) failed", task_id, task.task_type)
+            task.finished_at = datetime.utcnow()
+            db.session.flush()
+
+            self._update_job_status(task)
+            db.session.commit()
+
+    @staticmethod
+    def _update_job_status(task: Task) -> None:
+        """Set the job's processing_status once none of its tasks are still active."""
+        if task.job_id is None or not (job := db.session.get(Job, task.job_id)):
+            return
+
+        if task.status == 'failed':
+            job.processing_status = 'failed'
+            return
+
+        still_active = (Task.query
+                        .filter(Task.job_id == task.job_id, Task.status.in_(ACTIVE_STATUSES))
+                        .count())
+        if not still_active and job.processing_status != 'failed':
+            job.processing_status = 'ready'
+
+
+task_queue = TaskQueue()
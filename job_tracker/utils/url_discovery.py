@@ -3,12 +3,36 @@ Utility for automatically discovering company URLs.
 This module handles searching for company websites, LinkedIn profiles, and Glassdoor review pages.
 """
 
+import concurrent.futures
+import logging
+import os
+import threading
 import requests
 from bs4 import BeautifulSoup
 import re
 import json
 from typing import Dict, Optional, List, Tuple
 import urllib.parse
+from job_tracker.utils.search_backends import get_search_backend
+
+logger = logging.getLogger(__name__)
+
+DISCOVERY_WORKERS = 6
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Shared pool for discovery lookups, created on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=DISCOVERY_WORKERS, thread_name_prefix='url-discovery'
+            )
+        return _executor
+
 
 class URLDiscovery:
     """Class to discover company-related URLs from search engines."""
@@ -28,29 +52,65 @@ class URLDiscovery:
         Returns:
             Dictionary with discovered URLs
         """
+        return URLDiscovery.discover(company_name)[0]
+
+    @staticmethod
+    def discover(company_name: str) -> Tuple[Dict[str, Optional[str]], List[str]]:
+        """
+        Discover company website, LinkedIn, and Glassdoor URLs, reporting lookups that failed.
+
+        The three lookups run concurrently. Any still running after DISCOVERY_DEADLINE_SECONDS
+        (default 5) are left as None so the caller gets partial results instead of waiting.
+        
+        Args:
+            company_name: Name of the company to search for
+            
+        Returns:
+            Tuple of (dictionary with discovered URLs, keys of the lookups that raised or timed
+            out). A None URL whose key is not in the list means the search found nothing.
+        """
         result = {
             "website_url": None,
             "linkedin_url": None,
             "glassdoor_url": None
         }
+        failed = []
         
         # Clean up company name for search
         search_name = company_name.lower().strip()
-        
-        try:
-            # Find company website
-            result["website_url"] = URLDiscovery._find_company_website(search_name)
-            
-            # Find LinkedIn profile
-            result["linkedin_url"] = URLDiscovery._find_linkedin_profile(search_name)
-            
-            # Find Glassdoor page
-            result["glassdoor_url"] = URLDiscovery._find_glassdoor_page(search_name)
-            
-        except Exception as e:
-            print(f"Error discovering URLs for {company_name}: {str(e)}")
-        
-        return result
+        deadline = float(os.environ.get('DISCOVERY_DEADLINE_SECONDS', 5))
+
+        # The three lookups are independent searches, so run them side by side
+        finders = {
+            "website_url": URLDiscovery._find_company_website,
+            "linkedin_url": URLDiscovery._find_linkedin_profile,
+            "glassdoor_url": URLDiscovery._find_glassdoor_page,
+        }
+        futures = {
+            _get_executor().submit(finder, search_name): key
+            for key, finder in finders.items()
+        }
+        done, not_done = concurrent.futures.wait(futures, timeout=deadline)
+
+        for future in done:
+            try:
+                result[futures[future]] = future.result()
+            except Exception:
+                failed.append(futures[future])
+                logger.exception("Error discovering URLs", extra={"company": company_name, "field": futures[future]})
+
+        if not_done:
+            # Keep whatever finished in time; the stragglers finish in the background and are discarded
+            for future in not_done:
+                future.cancel()
+            failed.extend(futures[future] for future in not_done)
+            logger.warning(
+                "URL discovery deadline exceeded",
+                extra={"company": company_name, "deadline": deadline,
+                       "pending": sorted(futures[future] for future in not_done)}
+            )
+
+        return result, sorted(failed)
     
     @staticmethod
     def _find_company_website(company_name: str) -> Optional[str]:
@@ -158,59 +218,9 @@ class URLDiscovery:
     @staticmethod
     def _perform_search(query: str, num_results: int = 10) -> List[Dict]:
         """
-        Perform a search using a search API.
-        
-        Note: For production, you would want to use an actual search API like Google's Custom Search API,
-        Bing Web Search API, or another search service. This implementation uses a fake response for 
-        demonstration purposes.
-        
-        In a real implementation, replace this with an API call to a search service.
+        Perform a search using the configured search backend.
+
+        The backend defaults to simulated results; set SEARCH_BACKEND (see search_backends) to
+        use a real search API or a local fixture.
         """
-        
-        # For a real implementation, uncomment this and replace with your actual search API call
-        # try:
-        #     api_key = "YOUR_SEARCH_API_KEY"
-        #     endpoint = "https://api.search-service.com/search"
-        #     params = {
-        #         "q": query,
-        #         "num": num_results,
-        #         "key": api_key
-        #     }
-        #     response = requests.get(endpoint, params=params, headers=URLDiscovery.HEADERS)
-        #     return response.json().get("items", [])
-        # except Exception as e:
-        #     print(f"Error performing search: {str(e)}")
-        #     return []
-        
-        # For this demonstration, we'll return a simulated response based on the query
-        simulated_results = []
-        
-        if "official website" in query:
-            company_name = query.replace("official website", "").strip().lower()
-            domain_name = company_name.replace(" ", "").replace(",", "").replace(".", "")
-            simulated_results = [
-                {"link": f"https://www.{domain_name}.com"},
-                {"link": f"https://www.{domain_name}.io"},
-                {"link": f"https://www.linkedin.com/company/{domain_name}"},
-                {"link": f"https://en.wikipedia.org/wiki/{company_name.replace(' ', '_')}"}
-            ]
-        elif "linkedin company" in query:
-            company_name = query.replace("linkedin company", "").strip().lower()
-            domain_name = company_name.replace(" ", "").replace(",", "").replace(".", "")
-            simulated_results = [
-                {"link": f"https://www.linkedin.com/company/{domain_name}"},
-                {"link": f"https://www.linkedin.com/company/{domain_name.replace(' ', '-')}"},
-                {"link": f"https://www.{domain_name}.com/about"},
-                {"link": f"https://www.glassdoor.com/Overview/{domain_name}-Overview-EI_IE12345.11,20.htm"}
-            ]
-        elif "glassdoor reviews" in query:
-            company_name = query.replace("glassdoor reviews", "").strip().lower()
-            domain_name = company_name.replace(" ", "").replace(",", "").replace(".", "")
-            simulated_results = [
-                {"link": f"https://www.glassdoor.com/Reviews/{domain_name.title()}-Reviews-E12345.htm"},
-                {"link": f"https://www.glassdoor.com/Reviews/{domain_name.replace(' ', '-')}-Reviews-E12345.htm"},
-                {"link": f"https://www.indeed.com/cmp/{domain_name}/reviews"},
-                {"link": f"https://www.linkedin.com/company/{domain_name}/reviews"}
-            ]
-        
-        return simulated_results
+        return get_search_backend().search(query, num_results)
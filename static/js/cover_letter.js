@@ -3,25 +3,95 @@ document.addEventListener('DOMContentLoaded', function() {
     if (!btn) {
       return;
     }
+
+    function showError(output, message) {
+        const div = document.createElement('div');
+        div.className = 'text-danger';
+        div.textContent = message;
+        output.replaceChildren(div);
+    }
+
+    // Parse "event: x\ndata: {...}" blocks from the server-sent event stream
+    function parseEvents(buffer, onEvent) {
+        const blocks = buffer.split('\n\n');
+        const rest = blocks.pop();
+        blocks.forEach(block => {
+            let event = 'message';
+            let data = '';
+            block.split('\n').forEach(line => {
+                if (line.startsWith('event:')) {
+                    event = line.slice(6).trim();
+                } else if (line.startsWith('data:')) {
+                    data += line.slice(5).trim();
+                }
+            });
+            if (data) {
+                onEvent(event, JSON.parse(data));
+            }
+        });
+        return rest;
+    }
+
     btn.addEventListener('click', function() {
         const desc = document.getElementById('jobDescriptionRaw').textContent || '';
         const output = document.getElementById('coverLetterOutput');
         output.innerHTML = '<div class="text-info">Generating cover letter...</div>';
-        fetch('/cover-letter/generate', {
+        btn.disabled = true;
+
+        const pre = document.createElement('pre');
+        pre.className = 'bg-light p-3 border rounded';
+        pre.style.whiteSpace = 'pre-wrap';
+        let started = false;
+        let failed = false;
+
+        fetch('/cover-letter/stream', {
             method: 'POST',
             headers: {'Content-Type': 'application/json'},
             body: JSON.stringify({ job_description: desc })
         })
-        .then(resp => resp.json())
-        .then(data => {
-            if (data.cover_letter) {
-                output.innerHTML = `<pre class="bg-light p-3 border rounded">${data.cover_letter}</pre>`;
-            } else {
-                output.innerHTML = `<div class="text-danger">${data.error || 'Failed to generate cover letter.'}</div>`;
+        .then(resp => {
+            if (!resp.ok || !resp.body) {
+                return resp.json().then(data => {
+                    failed = true;
+                    showError(output, data.error || 'Failed to generate cover letter.');
+                });
             }
+            const reader = resp.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+
+            function handleEvent(event, data) {
+                if (event === 'error') {
+                    failed = true;
+                    showError(output, data.error || 'Failed to generate cover letter.');
+                } else if (event === 'message' && data.delta) {
+                    if (!started) {
+                        output.replaceChildren(pre);
+                        started = true;
+                    }
+                    pre.textContent += data.delta;
+                }
+            }
+
+            function read() {
+                return reader.read().then(({ done, value }) => {
+                    if (done) {
+                        if (!started && !failed) {
+                            showError(output, 'Failed to generate cover letter.');
+                        }
+                        return;
+                    }
+                    buffer = parseEvents(buffer + decoder.decode(value, { stream: true }), handleEvent);
+                    return read();
+                });
+            }
+            return read();
         })
         .catch(() => {
-            output.innerHTML = '<div class="text-danger">Error contacting server.</div>';
+            showError(output, 'Error contacting server.');
+        })
+        .finally(() => {
+            btn.disabled = false;
         });
     });
 });
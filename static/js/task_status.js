@@ -0,0 +1,24 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // Poll the task status endpoint while a job has background work pending,
+    // then reload so the page shows the parsed or fetched data.
+    const indicator = document.querySelector('[data-task-status-url]');
+    if (!indicator) {
+        return;
+    }
+    const statusUrl = indicator.dataset.taskStatusUrl;
+
+    function poll() {
+        fetch(statusUrl, {headers: {'Accept': 'application/json'}})
+            .then(resp => resp.json())
+            .then(data => {
+                if (data.processing_status === 'pending') {
+                    setTimeout(poll, 2000);
+                } else {
+                    window.location.reload();
+                }
+            })
+            .catch(() => setTimeout(poll, 5000));
+    }
+
+    setTimeout(poll, 2000);
+});
@@ -0,0 +1,108 @@
+"""
+Local stand-in for the Groq chat completions API.
+Serves /openai/v1/chat/completions with canned text, streamed as server-sent events when the request
+sets "stream": true, so cover letter streaming can be exercised without network access or an API key:
+
+    python stub_groq_server.py --port 8099
+    GROQ_API_URL=http://127.0.0.1:8099/openai/v1/chat/completions GROQ_API_KEY=stub python run.py
+"""
+
+import argparse
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STUB_LETTER = (
+    "Dear Hiring Manager,\n\n"
+    "I am excited to apply for this position. My experience described in my CV maps closely to the "
+    "responsibilities in your job description, and I would welcome the chance to contribute to your team.\n\n"
+    "Kind regards"
+)
+
+
+def make_handler(text, delay, first_token_delay, status):
+    """Build a request handler class that answers with `text`."""
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            pass
+
+        def handle(self):
+            # Pooled client connections are dropped without notice when the app exits
+            try:
+                super().handle()
+            except ConnectionResetError:
+                pass
+
+        def _send_json(self, code, body):
+            payload = json.dumps(body).encode('utf-8')
+            self.send_response(code)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_POST(self):
+            if not self.path.endswith('/chat/completions'):
+                self._send_json(404, {'error': {'message': 'Not found'}})
+                return
+            request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+            if status != 200:
+                self._send_json(status, {'error': {'message': f'Stub error {status}'}})
+                return
+
+            model = request.get('model', 'stub')
+            if not request.get('stream'):
+                time.sleep(first_token_delay + delay * len(text.split(' ')))
+                self._send_json(200, {
+                    'id': 'stub', 'object': 'chat.completion', 'model': model,
+                    'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text},
+                                 'finish_reason': 'stop'}],
+                })
+                return
+
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            time.sleep(first_token_delay)
+            words = text.split(' ')
+            for index, word in enumerate(words):
+                delta = word if index == 0 else ' ' + word
+                self._write_chunk({'id': 'stub', 'object': 'chat.completion.chunk', 'model': model,
+                                   'choices': [{'index': 0, 'delta': {'content': delta}, 'finish_reason': None}]})
+                time.sleep(delay)
+            self._write_event('[DONE]')
+            self.wfile.write(b'0\r\n\r\n')
+
+        def _write_chunk(self, body):
+            self._write_event(json.dumps(body))
+
+        def _write_event(self, data):
+            event = f'data: {data}\n\n'.encode('utf-8')
+            self.wfile.write(f'{len(event):x}\r\n'.encode('ascii') + event + b'\r\n')
+            self.wfile.flush()
+
+    return StubHandler
+
+
+def serve(host='127.0.0.1', port=8099, text=STUB_LETTER, delay=0.05, first_token_delay=0.1, status=200):
+    """Create the stub server (call serve_forever() on the result)."""
+    return ThreadingHTTPServer((host, port), make_handler(text, delay, first_token_delay, status))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a local stub of the Groq chat completions API")
+    parser.add_argument("--host", default="127.0.0.1", help="Host to bind")
+    parser.add_argument("--port", type=int, default=8099, help="Port to listen on")
+    parser.add_argument("--delay", type=float, default=0.05, help="Seconds between streamed words")
+    parser.add_argument("--first-token-delay", type=float, default=0.1, help="Seconds before the first word")
+    parser.add_argument("--status", type=int, default=200, help="HTTP status to answer with (e.g. 429, 500)")
+    args = parser.parse_args()
+
+    server = serve(args.host, args.port, delay=args.delay, first_token_delay=args.first_token_delay,
+                   status=args.status)
+    print(f"Stub Groq API on http://{args.host}:{args.port}/openai/v1/chat/completions")
+    server.serve_forever()
@@ -0,0 +1,74 @@
+"""
+Tests for bulk job import (job_tracker/utils/bulk_import.py).
+"""
+
+import io
+import pytest
+from job_tracker.models import Job
+from job_tracker.utils import bulk_import, llm_client
+from job_tracker.utils.company_parser import CompanyInfoParser
+from job_tracker.utils.bulk_import import INVALID_LINE, import_jobs, iter_records
+
+
+@pytest.fixture(autouse=True)
+def no_cv(monkeypatch):
+    """Skip CV match scoring; these tests are about reading and inserting records."""
+    monkeypatch.setattr(bulk_import, 'load_cv_terms', lambda: None)
+
+
+def test_iter_records_marks_unreadable_jsonl_lines():
+    stream = io.StringIO('{"title": "A", "company": "X"}\n{bad json\n\n[1, 2]\n{"title": "B", "company": "Y"}\n')
+    records = list(iter_records(stream, 'jsonl'))
+    assert records == [
+        {'title': 'A', 'company': 'X'},
+        {INVALID_LINE: 2},
+        {INVALID_LINE: 4},
+        {'title': 'B', 'company': 'Y'},
+    ]
+
+
+def test_bad_lines_do_not_stop_the_import(app):
+    stream = io.StringIO(
+        '{"title": "Data Engineer", "company": "Acme", "url": "https://example.com/1"}\n'
+        '{bad json\n'
+        '[1, 2]\n'
+        '{"title": "ML Engineer", "company": "Initech", "url": "https://example.com/2"}\n'
+    )
+    stats = import_jobs(iter_records(stream, 'jsonl'), workers=1, batch_size=10, parse=False)
+
+    assert stats['read'] == 4
+    assert stats['imported'] == 2
+    assert stats['errors'] == 2
+    assert stats['invalid_lines'] == [2, 3]
+    assert sorted(job.title for job in Job.query.all()) == ['Data Engineer', 'ML Engineer']
+
+
+def test_duplicate_urls_are_counted_not_inserted(app):
+    records = [
+        {'title': 'Data Engineer', 'company': 'Acme', 'url': 'https://example.com/1'},
+        {'title': 'Data Engineer', 'company': 'Acme', 'url': 'https://example.com/1'},
+        {'title': '', 'company': 'Acme'},
+    ]
+    stats = import_jobs(records, workers=1, batch_size=2, parse=False)
+
+    assert (stats['imported'], stats['duplicates'], stats['skipped']) == (1, 1, 1)
+    assert Job.query.count() == 1
+
+
+class OfflineLLMClient:
+    """Client that fails the test if anything tries to reach the LLM API."""
+
+    def chat_completion(self, *args, **kwargs):
+        pytest.fail('tests must not call the LLM API')
+
+
+def test_tests_never_reach_the_llm_api(app, monkeypatch):
+    monkeypatch.setattr(llm_client, '_client', OfflineLLMClient())
+    records = [{'title': 'Data Engineer', 'company': 'Acme',
+                'description': 'Requirements:\n- Python\n- SQL\n\nResponsibilities:\n- Build pipelines'}]
+    stats = import_jobs(records, workers=1, batch_size=10, parse=True)
+
+    assert stats['imported'] == 1
+    assert Job.query.one().parsed_data is not None
+    website = CompanyInfoParser._fetch_website_info('https://acme.example')
+    assert website['errors'] == ['Error in LLM agentic website info: GROQ_API_KEY not set']
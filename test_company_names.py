@@ -0,0 +1,57 @@
+"""
+Tests for company name normalization and the trigram index (job_tracker/utils/company_names.py).
+"""
+
+import pytest
+from job_tracker import db
+from job_tracker.utils import company_names
+from job_tracker.utils.company_enrichment import get_company_source, get_or_create_company_source
+from job_tracker.utils.company_names import CompanyNameIndex, normalize_company_name, trigrams
+
+
+@pytest.fixture(autouse=True)
+def fresh_index(monkeypatch):
+    # The index is cached per process; each test has its own database
+    monkeypatch.setattr(company_names, '_index', None)
+
+
+@pytest.mark.parametrize('name, expected', [
+    ('Google LLC', 'google'),
+    ('google inc.', 'google'),
+    ('AT&T Inc.', 'at and t'),
+    ('Société Générale S.A.', 'societe generale'),
+    ("McDonald's Corporation", 'mcdonalds'),
+    ('Co', 'co'),
+    ('', ''),
+])
+def test_normalize_company_name(name, expected):
+    assert normalize_company_name(name) == expected
+
+
+def test_trigrams_are_padded():
+    assert trigrams('ab') == {'  a', ' ab', 'ab '}
+
+
+def test_lookup_returns_the_most_similar_name_above_the_threshold():
+    index = CompanyNameIndex([(1, 'acme analytics'), (2, 'acme robotics'), (3, 'initech')])
+
+    source_id, similarity = index.lookup('acme analytic', 0.7)
+    assert source_id == 1 and 0.7 <= similarity < 1
+    assert index.lookup('acme analytics', 0.7) == (1, 1.0)
+    assert index.lookup('globex', 0.7) is None
+    assert index.lookup('acme', 0.7) is None
+
+
+def test_spelling_variants_share_one_company_source(app):
+    source = get_or_create_company_source('Acme Analytics, Inc.')
+    db.session.commit()
+
+    assert get_or_create_company_source('ACME Analytics LLC').id == source.id
+    assert get_company_source('Acme Analytic').id == source.id
+    assert get_company_source('Acme Robotics') is None
+
+    other = get_or_create_company_source('Initech Systems')
+    assert other.id != source.id
+    # Sources created in this process are added to the cached (already loaded) index right away
+    assert company_names._index is not None
+    assert get_company_source('Initech System').id == other.id
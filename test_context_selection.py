@@ -0,0 +1,58 @@
+"""
+Tests for cover letter context selection (job_tracker/utils/context_selection.py).
+"""
+
+from job_tracker.utils.context_selection import chunk_text, estimate_tokens, select_context, tokenize
+
+JOB = 'Data engineer to build Airflow pipelines on Spark and Kafka'
+CV_SUMMARY = 'Jane Doe, data engineer. Seven years building batch and streaming platforms.'
+CV_AIRFLOW = 'Built Airflow pipelines that move terabytes a day on Spark, with Kafka ingestion.'
+CV_HOBBIES = 'Enjoys long-distance running, baking sourdough bread and restoring old bicycles.'
+CV = '\n\n'.join([CV_SUMMARY, CV_HOBBIES, CV_AIRFLOW])
+
+
+def _padding(word, count=150):
+    """A paragraph longer than one chunk that shares no terms with JOB."""
+    return ' '.join([word] * count)
+
+
+def test_tokenize_keeps_technology_names():
+    assert tokenize('Experience with C++, C# and Node.js in the cloud.') == ['experience', 'c++', 'c#', 'node.js', 'cloud']
+
+
+def test_chunks_keep_paragraphs_and_split_long_ones():
+    assert chunk_text('one two\n\nthree', max_words=5) == ['one two\n\nthree']
+    assert chunk_text('one two\n\nthree four', max_words=3) == ['one two', 'three four']
+    assert chunk_text('a b c d e', max_words=2) == ['a b', 'c d', 'e']
+
+
+def test_everything_is_kept_under_the_budget():
+    cv, documents, stats = select_context(JOB, CV, ['Cover letter', ''], token_budget=1000)
+    assert (cv, documents) == (CV, ['Cover letter'])
+    assert stats['chunks'] is None and stats['tokens'] == stats['total_tokens']
+
+
+def test_most_relevant_chunks_fill_a_smaller_budget():
+    cv = '\n\n'.join([CV_SUMMARY, _padding('gardening'), CV_AIRFLOW])
+    letter = _padding('knitting') + '\n\nI designed Kafka and Spark pipelines orchestrated by Airflow.'
+    budget = estimate_tokens(CV_SUMMARY) + estimate_tokens(CV_AIRFLOW) + 20
+
+    cv_context, documents, stats = select_context(JOB, cv, [letter, CV_AIRFLOW], token_budget=budget)
+
+    assert stats['tokens'] <= budget < stats['total_tokens']
+    # The first CV chunk is always kept and sources keep their original order
+    assert cv_context == f'{CV_SUMMARY}\n\n{CV_AIRFLOW}'
+    # The document repeating a CV paragraph adds nothing; irrelevant padding is dropped
+    assert documents == ['I designed Kafka and Spark pipelines orchestrated by Airflow.']
+    assert 'gardening' not in cv_context and 'knitting' not in documents[0]
+
+
+def test_first_cv_chunk_is_kept_even_when_it_alone_exceeds_the_budget():
+    cv = '\n\n'.join([CV_SUMMARY, CV_AIRFLOW, _padding('gardening')])
+
+    cv_context, documents, stats = select_context(JOB, cv, [CV_HOBBIES], token_budget=8)
+
+    assert cv_context and CV_SUMMARY.startswith(cv_context)
+    assert estimate_tokens(cv_context) <= 8
+    assert stats['tokens'] <= 8
+    assert documents == []
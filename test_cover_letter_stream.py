@@ -0,0 +1,121 @@
+"""
+Tests for streamed cover letters against the local Groq stub (stub_groq_server.py): the SSE client in
+job_tracker/utils/llm_client.py and the /cover-letter/stream route.
+"""
+
+import json
+import threading
+import pytest
+from stub_groq_server import serve
+from job_tracker.routes import cover_letter_routes
+from job_tracker.utils import document_text, llm_client, llm_parser
+from job_tracker.utils.llm_client import LLMClient, LLMStreamError
+
+LETTER = "Dear Hiring Manager,\n\nI would love to build pipelines with you.\n\nKind regards"
+
+
+@pytest.fixture
+def stub_api(monkeypatch):
+    """Start a stub server on a free port and point the shared LLM client at it; yields a starter."""
+    servers = []
+
+    def start(**options):
+        server = serve(port=0, delay=0, first_token_delay=0, **options)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        url = f'http://127.0.0.1:{server.server_address[1]}/openai/v1/chat/completions'
+        monkeypatch.setattr(llm_parser, 'GROQ_API_URL', url)
+        monkeypatch.setattr(llm_parser, 'GROQ_API_KEY', 'stub')
+        # One quick retry keeps the error cases fast while still going through the retry loop
+        monkeypatch.setattr(llm_client, '_client', LLMClient(api_url=url, max_retries=1, backoff_base=0.01))
+        return url
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def uploads(tmp_path, monkeypatch):
+    """An upload folder holding a CV, and a private text cache."""
+    folder = tmp_path / 'uploads'
+    folder.mkdir()
+    (folder / 'cv.txt').write_text('Data engineer with five years of Python and Airflow.', encoding='utf-8')
+    monkeypatch.setattr(cover_letter_routes, 'UPLOAD_FOLDER', str(folder))
+    monkeypatch.setattr(cover_letter_routes, 'COVER_LETTERS_DIR', str(folder / 'cover_letters'))
+    monkeypatch.setattr(cover_letter_routes, 'OTHER_DOCS_DIR', str(folder / 'other_docs'))
+    monkeypatch.setattr(document_text, 'TEXT_CACHE_DIR', str(tmp_path / 'text_cache'))
+    yield folder
+    document_text._terminate_pool()
+
+
+def _events(body):
+    """Parse an SSE body into (event name, payload) pairs; unnamed events are called 'message'."""
+    events = []
+    for block in body.decode('utf-8').split('\n\n'):
+        if not block.strip():
+            continue
+        name, data = 'message', None
+        for line in block.split('\n'):
+            if line.startswith('event: '):
+                name = line[len('event: '):]
+            elif line.startswith('data: '):
+                data = json.loads(line[len('data: '):])
+        events.append((name, data))
+    return events
+
+
+def _stream(client):
+    response = client.post('/cover-letter/stream', json={'job_description': 'Data engineer building pipelines'})
+    assert response.status_code == 200
+    assert response.mimetype == 'text/event-stream'
+    return _events(response.data)
+
+
+def test_client_reassembles_streamed_deltas(stub_api):
+    url = stub_api(text=LETTER)
+    deltas = list(LLMClient(api_url=url).stream_chat_completion({'model': 'stub', 'messages': []}, api_key='stub'))
+    assert len(deltas) > 1
+    assert ''.join(deltas) == LETTER
+
+
+@pytest.mark.parametrize('status', [429, 500])
+def test_client_raises_on_error_status(stub_api, status):
+    url = stub_api(status=status)
+    client = LLMClient(api_url=url, max_retries=1, backoff_base=0.01)
+    with pytest.raises(LLMStreamError) as error:
+        list(client.stream_chat_completion({'model': 'stub', 'messages': []}, api_key='stub'))
+    assert error.value.status_code == status
+    assert f'Stub error {status}' in str(error.value)
+
+
+def test_route_streams_meta_deltas_then_done(app, client, stub_api, uploads):
+    stub_api(text=LETTER)
+    events = _stream(client)
+
+    names = [name for name, _ in events]
+    assert names[0] == 'meta'
+    assert names[-1] == 'done'
+    assert set(names[1:-1]) == {'message'} and len(names) > 3
+    meta = events[0][1]
+    assert meta['extraction'][0]['file'] == 'cv.txt'
+    assert 'context' in meta
+    assert ''.join(data['delta'] for name, data in events if name == 'message') == LETTER
+
+
+@pytest.mark.parametrize('status', [429, 500])
+def test_route_reports_api_errors_as_an_error_event(app, client, stub_api, uploads, status):
+    stub_api(status=status)
+    events = _stream(client)
+
+    assert [name for name, _ in events] == ['meta', 'error']
+    assert events[1][1]['error'].startswith(f'[LLM API Error: {status}]')
+
+
+def test_route_requires_a_cv(app, client, stub_api, uploads):
+    stub_api()
+    (uploads / 'cv.txt').unlink()
+    response = client.post('/cover-letter/stream', json={'job_description': 'Data engineer'})
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'No CV uploaded or unable to read CV.'
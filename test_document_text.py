@@ -0,0 +1,74 @@
+"""
+Tests for cached, pooled document text extraction (job_tracker/utils/document_text.py).
+"""
+
+import os
+import threading
+import time
+import pytest
+from job_tracker.utils import document_text
+from job_tracker.utils.document_text import extract_documents
+
+
+@pytest.fixture(autouse=True)
+def text_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(document_text, 'TEXT_CACHE_DIR', str(tmp_path / 'text_cache'))
+    yield
+    document_text._terminate_pool()
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def test_misses_are_extracted_in_the_pool_and_then_cached(tmp_path):
+    paths = [_write(tmp_path, f'doc{i}.txt', f'document {i}') for i in range(3)]
+
+    first = extract_documents(paths, workers=2, timeout=10)
+    second = extract_documents(paths, workers=2, timeout=10)
+
+    assert [result['text'] for result in first] == ['document 0', 'document 1', 'document 2']
+    assert not any(result['cached'] or result['error'] for result in first)
+    assert all(result['cached'] for result in second)
+
+
+def test_missing_files_are_reported_per_file(tmp_path):
+    path = _write(tmp_path, 'cv.txt', 'Python')
+
+    results = extract_documents([str(tmp_path / 'missing.txt'), path], workers=1, timeout=10)
+
+    assert results[0]['error'].startswith('FileNotFoundError')
+    assert results[1]['text'] == 'Python'
+
+
+@pytest.mark.skipif(not hasattr(os, 'mkfifo'), reason='needs named pipes')
+def test_a_stuck_file_does_not_block_other_requests(tmp_path):
+    # Reading a FIFO nobody writes to blocks forever, like a pathological PDF
+    stuck_path = str(tmp_path / 'stuck.txt')
+    os.mkfifo(stuck_path)
+    fast_path = _write(tmp_path, 'fast.txt', 'fast')
+    extract_documents([_write(tmp_path, 'warm.txt', 'warm')], workers=2, timeout=10)  # start the pool
+
+    stuck_results = []
+    stuck = threading.Thread(target=lambda: stuck_results.extend(extract_documents([stuck_path], workers=2, timeout=3)))
+    stuck.start()
+    time.sleep(0.2)
+
+    started = time.monotonic()
+    fast = extract_documents([fast_path], workers=2, timeout=10)[0]
+    assert fast['text'] == 'fast'
+    assert time.monotonic() - started < 2
+    assert stuck.is_alive()
+
+    stuck.join()
+    assert stuck_results[0]['error'] == 'Timed out after 3 s'
+    # The stuck pool was replaced; extraction keeps working
+    assert extract_documents([_write(tmp_path, 'after.txt', 'after')], workers=2, timeout=10)[0]['text'] == 'after'
+
+
+@pytest.mark.skipif('forkserver' not in document_text.multiprocessing.get_all_start_methods(),
+                    reason='platform without forkserver')
+def test_pool_does_not_fork_the_web_server():
+    assert document_text._pool_context().get_start_method() == 'forkserver'
@@ -0,0 +1,104 @@
+"""
+Tests for ETag/Last-Modified handling of the job and company pages (job_tracker/utils/http_cache.py).
+"""
+
+import json
+from job_tracker import create_app, db
+from job_tracker.models import CompanySource, Job
+from job_tracker.utils import http_cache
+
+
+def _add_job(**fields):
+    company_source = CompanySource(
+        company_name='Acme',
+        website_url='https://acme.example',
+        linkedin_url='https://linkedin.com/company/acme',
+        glassdoor_url='https://glassdoor.com/acme',
+        company_data=json.dumps({'consolidated_info': {'description': 'Makes anvils'}})
+    )
+    db.session.add(company_source)
+    db.session.flush()
+    job = Job(title='Data Engineer', company='Acme', company_source_id=company_source.id,
+              processing_status='ready', **fields)
+    db.session.add(job)
+    db.session.commit()
+    return job.id, company_source.id
+
+
+def test_job_page_answers_304_until_the_job_changes(client):
+    job_id, _ = _add_job(description='Build pipelines')
+
+    response = client.get(f'/jobs/jobs/{job_id}')
+    etag = response.headers['ETag']
+    assert response.status_code == 200
+    assert etag.startswith('W/')
+    assert response.headers['Last-Modified']
+    assert 'no-cache' in response.headers['Cache-Control']
+
+    assert client.get(f'/jobs/jobs/{job_id}', headers={'If-None-Match': etag}).status_code == 304
+    assert client.get(f'/jobs/jobs/{job_id}',
+                      headers={'If-Modified-Since': response.headers['Last-Modified']}).status_code == 304
+
+    db.session.get(Job, job_id).title = 'Senior Data Engineer'
+    db.session.commit()
+    response = client.get(f'/jobs/jobs/{job_id}', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert b'Senior Data Engineer' in response.data
+
+
+def test_etags_are_the_same_in_every_worker(app, client):
+    job_id, _ = _add_job(description='Build pipelines')
+    etag = client.get(f'/jobs/jobs/{job_id}').headers['ETag']
+
+    # A second application on the same database stands in for another gunicorn worker
+    other_worker = create_app()
+    with other_worker.app_context():
+        response = other_worker.test_client().get(f'/jobs/jobs/{job_id}', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+
+
+def test_pending_flashes_are_never_answered_with_304(client):
+    job_id, _ = _add_job(description='Build pipelines')
+    etag = client.get(f'/jobs/jobs/{job_id}').headers['ETag']
+
+    with client.session_transaction() as session:
+        session['_flashes'] = [('success', 'Note added successfully!')]
+    response = client.get(f'/jobs/jobs/{job_id}', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert b'Note added successfully!' in response.data
+    assert 'ETag' not in response.headers
+
+    assert client.get(f'/jobs/jobs/{job_id}', headers={'If-None-Match': etag}).status_code == 304
+
+
+def test_description_fragment_is_rendered_once_per_version(client, monkeypatch):
+    monkeypatch.setattr(http_cache, '_fragments', http_cache.OrderedDict())
+    job_id, _ = _add_job(description='Build pipelines')
+
+    client.get(f'/jobs/jobs/{job_id}')
+    client.get(f'/jobs/jobs/{job_id}')
+    assert len(http_cache._fragments) == 1
+
+    db.session.get(Job, job_id).description = 'Build streaming pipelines'
+    db.session.commit()
+    assert b'Build streaming pipelines' in client.get(f'/jobs/jobs/{job_id}').data
+    assert len(http_cache._fragments) == 2
+
+
+def test_company_page_and_api_follow_the_company_source(client):
+    job_id, company_source_id = _add_job()
+
+    page = client.get(f'/company/job/{job_id}/company')
+    api = client.get(f'/company/job/{job_id}')
+    assert page.status_code == api.status_code == 200
+    assert page.headers['ETag'] != api.headers['ETag']
+    assert client.get(f'/company/job/{job_id}/company',
+                      headers={'If-None-Match': page.headers['ETag']}).status_code == 304
+    assert client.get(f'/company/job/{job_id}', headers={'If-None-Match': api.headers['ETag']}).status_code == 304
+
+    db.session.get(CompanySource, company_source_id).company_data = json.dumps({'consolidated_info': {}})
+    db.session.commit()
+    response = client.get(f'/company/job/{job_id}', headers={'If-None-Match': api.headers['ETag']})
+    assert response.status_code == 200
+    assert response.json['company_data'] == {'consolidated_info': {}}
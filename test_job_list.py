@@ -0,0 +1,98 @@
+"""
+Tests for the keyset-paginated job list (job_tracker/routes/job_routes.py).
+"""
+
+from datetime import datetime, timedelta
+import pytest
+from job_tracker import db
+from job_tracker.models import Job
+from job_tracker.routes.job_routes import _decode_cursor, _encode_cursor, _paginate_jobs
+
+SCORES = [0.5, None, 0.9, 0.5, None, 0.1, None, 0.5]
+
+
+@pytest.fixture
+def jobs(app):
+    start = datetime(2024, 1, 1)
+    for index, score in enumerate(SCORES):
+        # Two jobs share a date_added to exercise the id tie-break
+        db.session.add(Job(title=f'Job {index}', company='Acme', match_score=score,
+                           date_added=start + timedelta(days=min(index, 6))))
+    db.session.commit()
+    return Job.query.all()
+
+
+def _walk(sort, per_page):
+    """Page forward to the end, then back to the start; return both id sequences."""
+    forward, pages, cursor = [], [], None
+    while True:
+        page, next_cursor, prev_cursor = _paginate_jobs(Job.query, per_page, after=_decode_cursor(cursor, sort), sort=sort)
+        forward += [job.id for job in page]
+        pages.append(prev_cursor)
+        if not next_cursor:
+            break
+        cursor = next_cursor
+
+    backward = [job.id for job in page]
+    cursor = pages[-1]
+    while cursor:
+        page, _, cursor = _paginate_jobs(Job.query, per_page, before=_decode_cursor(cursor, sort), sort=sort)
+        backward = [job.id for job in page] + backward
+    return forward, backward
+
+
+@pytest.mark.parametrize('per_page', [1, 2, 3, 10])
+def test_date_order_round_trips(jobs, per_page):
+    expected = [job.id for job in sorted(jobs, key=lambda job: (job.date_added, job.id), reverse=True)]
+    assert _walk('date', per_page) == (expected, expected)
+
+
+@pytest.mark.parametrize('per_page', [1, 2, 3, 10])
+def test_match_order_lists_unscored_jobs_last(jobs, per_page):
+    scored = sorted((job for job in jobs if job.match_score is not None),
+                    key=lambda job: (job.match_score, job.id), reverse=True)
+    unscored = sorted((job for job in jobs if job.match_score is None), key=lambda job: job.id, reverse=True)
+    expected = [job.id for job in scored + unscored]
+    assert _walk('match', per_page) == (expected, expected)
+
+
+def test_cursors_round_trip(jobs):
+    scored = next(job for job in jobs if job.match_score is not None)
+    unscored = next(job for job in jobs if job.match_score is None)
+    assert _decode_cursor(_encode_cursor(scored, 'match'), 'match') == (scored.match_score, scored.id)
+    assert _decode_cursor(_encode_cursor(unscored, 'match'), 'match') == (None, unscored.id)
+    assert _decode_cursor(_encode_cursor(scored, 'date'), 'date') == (scored.date_added, scored.id)
+    assert _decode_cursor('not a cursor', 'date') is None
+
+
+def test_match_sort_page_shows_every_job(jobs, client):
+    response = client.get('/jobs/jobs?sort=match&per_page=50')
+    assert response.status_code == 200
+    assert all(f'Job {index}'.encode() in response.data for index in range(len(SCORES)))
+
+
+@pytest.fixture
+def undated_jobs(jobs):
+    # Rows written outside the ORM (legacy data, direct inserts) miss the date_added default
+    for index in range(3):
+        db.session.execute(db.text("INSERT INTO job (title, company) VALUES (:title, 'Acme')"),
+                           {'title': f'Legacy {index}'})
+    db.session.commit()
+    return Job.query.all()
+
+
+@pytest.mark.parametrize('per_page', [1, 2, 3, 10])
+def test_date_order_lists_undated_jobs_last(undated_jobs, per_page):
+    dated = sorted((job for job in undated_jobs if job.date_added is not None),
+                   key=lambda job: (job.date_added, job.id), reverse=True)
+    undated = sorted((job for job in undated_jobs if job.date_added is None), key=lambda job: job.id, reverse=True)
+    expected = [job.id for job in dated + undated]
+    assert len(undated) == 3
+    assert _walk('date', per_page) == (expected, expected)
+    assert _decode_cursor(_encode_cursor(undated[0], 'date'), 'date') == (None, undated[0].id)
+
+
+def test_date_sort_page_shows_undated_jobs(undated_jobs, client):
+    response = client.get('/jobs/jobs?per_page=50')
+    assert response.status_code == 200
+    assert all(f'Legacy {index}'.encode() in response.data for index in range(3))
@@ -0,0 +1,66 @@
+"""
+Tests for skill extraction and seniority detection (job_tracker/utils/job_sections.py).
+"""
+
+from job_tracker.utils.job_sections import detect_seniority, extract_skills
+from job_tracker.utils.match_scoring import compute_match_scores, skill_key, text_terms
+
+# Skills section of a Python ML posting as the parser stores it: one paragraph, the header's
+# "Skills" split off from "& Qualifications"
+ML_ENGINEER_SKILLS = (
+    "& Qualifications:\r\n"
+    " 5+ years of hands-on experience in machine learning\r\n"
+    " Strong foundation in Computer Vision (e.g., image classification, object detection, OCR) and NLP "
+    "(e.g., transformers, text generation, embeddings)\r\n"
+    " Experience working with Large Language Models (OpenAI, Hugging Face, LLaMA, etc.)\r\n"
+    " Solid understanding of ML frameworks such as TensorFlow, PyTorch, or JAX\r\n"
+    " Experience deploying ML models in production environments\r\n"
+    " Proven track record of solving real-world business or technical problems using machine learning\r\n"
+    " Familiarity with optimizing ML models for mobile and edge devices is a strong plus\r\n"
+    " Proficient in Python and ML tooling (e.g., NumPy, Pandas, scikit-learn, Hugging Face, OpenCV)\r\n"
+    " Strong analytical and problem-solving skills"
+)
+
+
+def test_ml_engineer_skills():
+    skills = extract_skills([{'title': 'Skills', 'type': 'paragraph', 'content': ML_ENGINEER_SKILLS}])
+
+    assert skills == [
+        'Computer Vision', 'NLP', 'image classification', 'object detection', 'OCR',
+        'transformers', 'text generation', 'embeddings',
+        'Large Language Models', 'OpenAI', 'Hugging Face', 'LLaMA',
+        'ML frameworks', 'TensorFlow', 'PyTorch', 'JAX',
+        'Python', 'ML tooling', 'NumPy', 'Pandas', 'scikit-learn', 'OpenCV',
+        'analytical', 'problem-solving skills',
+    ]
+    assert not any('(' in skill or ')' in skill or skill.startswith('&') for skill in skills)
+
+
+def test_ml_engineer_matches_a_python_cv():
+    skills = extract_skills([{'title': 'Skills', 'type': 'paragraph', 'content': ML_ENGINEER_SKILLS}])
+    cv_terms = text_terms("Machine learning engineer. Python, PyTorch, NumPy, Pandas and OpenCV for computer vision.")
+
+    score = compute_match_scores({11: [skill_key(skill) for skill in skills]}, cv_terms)[11]
+
+    assert score is not None and score > 0.2
+
+
+def test_list_items_and_prose():
+    sections = [
+        {'title': 'Responsibilities', 'content': ['Python, Java']},
+        {'title': 'Skills', 'content': [
+            'Deep Learning, Knowledge Graphs',
+            'Experience with AWS or GCP',
+            'We expect you to communicate clearly with stakeholders across the company',
+            'Docker / Kubernetes; python',
+        ]},
+    ]
+    assert extract_skills(sections) == ['Deep Learning', 'Knowledge Graphs', 'AWS', 'GCP', 'Docker', 'Kubernetes', 'python']
+
+
+def test_seniority_from_title_then_years():
+    assert detect_seniority('Senior Machine Learning Engineer', []) == 'senior'
+    assert detect_seniority('Machine Learning Engineer', [
+        {'title': 'Requirements', 'content': ['3+ years of Python']}
+    ]) == 'mid'
+    assert detect_seniority('Machine Learning Engineer', []) is None
@@ -0,0 +1,96 @@
+"""
+Tests for the persistent LLM response cache (job_tracker/utils/llm_cache.py).
+"""
+
+import pytest
+from job_tracker.utils import llm_cache
+from job_tracker.utils.llm_cache import LLMResponseCache
+
+
+class FakeClock:
+    def __init__(self, start=1_700_000_000.0):
+        self.now = start
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(llm_cache, 'time', clock)
+    return clock
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return LLMResponseCache(path=str(tmp_path / 'llm_cache.db'), max_entries=3, ttl_seconds=60)
+
+
+def test_key_ignores_whitespace_only_differences():
+    key = LLMResponseCache.make_key('model', 'v1', 'Senior  Engineer\n\nPython, SQL')
+    assert LLMResponseCache.make_key('model', 'v1', '  Senior Engineer Python,\tSQL ') == key
+    assert LLMResponseCache.make_key('model', 'v1', 'Senior Engineer\r\nPython, SQL') == key
+
+
+def test_key_changes_with_case_model_and_prompt_version():
+    key = LLMResponseCache.make_key('model', 'v1', 'Senior Engineer')
+    # Case can change what the model extracts, so it is part of the key
+    assert LLMResponseCache.make_key('model', 'v1', 'senior engineer') != key
+    assert LLMResponseCache.make_key('other-model', 'v1', 'Senior Engineer') != key
+    assert LLMResponseCache.make_key('model', 'v2', 'Senior Engineer') != key
+    assert LLMResponseCache.make_key(None, 'v1', '') == LLMResponseCache.make_key('', 'v1', None)
+
+
+def test_round_trip_and_persistence(cache, tmp_path):
+    cache.set('key', {'sections': [{'title': 'Skills'}]})
+    assert cache.get('key') == {'sections': [{'title': 'Skills'}]}
+    assert cache.get('missing') is None
+    assert LLMResponseCache(path=cache.path).get('key') == {'sections': [{'title': 'Skills'}]}
+
+
+def test_entries_expire_after_the_ttl(cache, clock):
+    cache.set('key', 'value')
+    clock.now += 60
+    assert cache.get('key') == 'value'
+    clock.now += 1
+    assert cache.get('key') is None
+
+    # Reading does not extend the lifetime of an entry
+    cache.set('key', 'value')
+    clock.now += 50
+    assert cache.get('key') == 'value'
+    clock.now += 20
+    assert cache.get('key') is None
+
+
+def test_least_recently_used_entries_are_evicted(cache, clock):
+    for key in ('a', 'b', 'c'):
+        cache.set(key, key)
+        clock.now += 1
+    assert cache.get('a') == 'a'
+    clock.now += 1
+
+    cache.set('d', 'd')
+    assert [cache.get(key) for key in ('a', 'b', 'c', 'd')] == ['a', None, 'c', 'd']
+
+
+def test_zero_max_entries_disables_the_cache(tmp_path, clock):
+    cache = LLMResponseCache(path=str(tmp_path / 'llm_cache.db'), max_entries=0)
+    cache.set('key', 'value')
+    assert cache.get('key') is None
+
+
+def test_clear(cache):
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.clear()
+    assert cache.get('a') is None and cache.get('b') is None
+
+
+def test_database_errors_are_not_raised(tmp_path, clock):
+    # A directory cannot be opened as an SQLite database
+    cache = LLMResponseCache(path=str(tmp_path))
+    cache.set('key', 'value')
+    assert cache.get('key') is None
+    cache.clear()
@@ -0,0 +1,156 @@
+"""
+Tests for the shared LLM HTTP client (job_tracker/utils/llm_client.py): token bucket rate limiting,
+Retry-After parsing and the retry loop, with a fake clock and a fake session.
+"""
+
+from email.utils import formatdate
+import pytest
+import requests
+from job_tracker.utils import llm_client
+from job_tracker.utils.llm_client import LLMClient, TokenBucket, _parse_retry_after
+
+
+class FakeClock:
+    """Stands in for the time module: sleep() advances the clock instead of blocking."""
+
+    def __init__(self, start=1_700_000_000.0):
+        self.now = start
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    """Returns the queued responses (or raises the queued exceptions) in order."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def post(self, url, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(llm_client, 'time', clock)
+    return clock
+
+
+def _client(*outcomes, **options):
+    """Client over a fake session, with a bucket large enough that only retries sleep."""
+    client = LLMClient(api_url='http://llm.test/v1/chat/completions', requests_per_minute=6000, burst=100,
+                       backoff_base=1.0, backoff_max=30.0, **options)
+    client.session = FakeSession(*outcomes)
+    return client
+
+
+def test_bucket_allows_a_burst_then_waits_for_refill(clock):
+    bucket = TokenBucket(rate_per_second=2, capacity=3)
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_bucket_refills_over_time_up_to_capacity(clock):
+    bucket = TokenBucket(rate_per_second=1, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    clock.now += 1.5
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(0.5)
+
+    # A long idle period does not bank more than `capacity` tokens
+    clock.now += 60
+    assert [bucket.acquire() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.acquire() == pytest.approx(1.0)
+
+
+def test_retry_after_seconds():
+    assert _parse_retry_after('7') == 7.0
+    assert _parse_retry_after('1.5') == 1.5
+    assert _parse_retry_after('-3') == 0.0
+    assert _parse_retry_after(None) is None
+    assert _parse_retry_after('') is None
+    assert _parse_retry_after('soon') is None
+
+
+def test_retry_after_http_date(clock):
+    assert _parse_retry_after(formatdate(clock.now + 20, usegmt=True)) == pytest.approx(20)
+    # Dates in the past mean "retry now"
+    assert _parse_retry_after(formatdate(clock.now - 20, usegmt=True)) == 0.0
+
+
+def test_429_then_200_is_retried_after_retry_after(clock):
+    throttled = FakeResponse(429, {'Retry-After': '4'})
+    ok = FakeResponse(200)
+    client = _client(throttled, ok)
+
+    assert client.chat_completion({'model': 'test'}, api_key='key') is ok
+    assert client.session.calls == 2
+    assert throttled.closed
+    assert clock.sleeps == [4.0]
+
+
+def test_retry_after_is_capped_at_backoff_max(clock):
+    client = _client(FakeResponse(503, {'Retry-After': '3600'}), FakeResponse(200))
+
+    assert client.chat_completion({}, api_key='key').status_code == 200
+    assert clock.sleeps == [30.0]
+
+
+def test_the_last_error_response_is_returned_after_max_retries(clock):
+    client = _client(*(FakeResponse(500) for _ in range(3)), max_retries=2)
+
+    response = client.chat_completion({}, api_key='key')
+    assert response.status_code == 500
+    assert not response.closed
+    assert client.session.calls == 3
+    # Jittered exponential backoff: retry n waits at most backoff_base * 2^n
+    assert len(clock.sleeps) == 2
+    assert clock.sleeps[0] <= 1.0 and clock.sleeps[1] <= 2.0
+
+
+def test_client_errors_are_not_retried(clock):
+    client = _client(FakeResponse(401))
+
+    assert client.chat_completion({}, api_key='key').status_code == 401
+    assert client.session.calls == 1
+
+
+def test_connection_errors_are_retried_then_raised(clock):
+    ok = FakeResponse(200)
+    assert _client(requests.ConnectionError('reset'), ok).chat_completion({}, api_key='key') is ok
+
+    client = _client(requests.Timeout('slow'), requests.Timeout('slow'), max_retries=1)
+    with pytest.raises(requests.Timeout):
+        client.chat_completion({}, api_key='key')
+    assert client.session.calls == 2
@@ -0,0 +1,144 @@
+"""
+Tests for near-duplicate detection (job_tracker/utils/near_duplicates.py): MinHash signatures,
+LSH band lookups and the union-find grouping behind the duplicates report.
+"""
+
+import random
+from job_tracker import db
+from job_tracker.models import Job, JobLSHBand
+from job_tracker.utils.near_duplicates import (
+    LSH_BANDS,
+    NUM_PERM,
+    band_buckets,
+    decode_signature,
+    find_duplicate_groups,
+    find_near_duplicates,
+    minhash_signature,
+    similarity,
+    store_signature,
+)
+
+VOCABULARY = [f'word{index}' for index in range(400)]
+
+
+def _description(seed, words=120):
+    rng = random.Random(seed)
+    return ' '.join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def _edited(text, every=40):
+    """The text with one word in `every` replaced, like a reposted job with a changed date or salary."""
+    words = text.split()
+    return ' '.join('changed' if index % every == 0 else word for index, word in enumerate(words))
+
+
+def _add_job(description, title='Engineer'):
+    job = Job(title=title, company='Acme', description=description)
+    store_signature(job, minhash_signature(description))
+    db.session.add(job)
+    db.session.commit()
+    return job
+
+
+def test_signature_shape_and_stability():
+    text = _description(1)
+    signature = minhash_signature(text)
+    assert signature.shape == (NUM_PERM,)
+    assert (signature == minhash_signature(text.upper())).all()
+    assert (decode_signature(signature.tobytes()) == signature).all()
+    assert len(band_buckets(signature)) == LSH_BANDS
+
+
+def test_short_descriptions_have_no_signature():
+    assert minhash_signature('See link') is None
+    assert minhash_signature('') is None
+    assert decode_signature(None) is None
+
+
+def test_similarity_tracks_edits():
+    text = _description(1)
+    assert similarity(minhash_signature(text), minhash_signature(text)) == 1.0
+    assert similarity(minhash_signature(text), minhash_signature(_edited(text))) > 0.6
+    assert similarity(minhash_signature(text), minhash_signature(_description(2))) < 0.1
+
+
+def test_find_near_duplicates_uses_band_lookup(app):
+    original = _add_job(_description(1))
+    _add_job(_description(2))
+    assert JobLSHBand.query.filter_by(job_id=original.id).count() == LSH_BANDS
+
+    signature = minhash_signature(_description(1))
+    matches = find_near_duplicates(signature)
+    assert [(job.id, score) for job, score in matches] == [(original.id, 1.0)]
+
+    assert find_near_duplicates(signature, exclude_id=original.id) == []
+    assert find_near_duplicates(None) == []
+
+
+def test_find_near_duplicates_threshold_and_order(app):
+    text = _description(1)
+    original = _add_job(text)
+    repost = _add_job(_edited(text, every=60))
+    signature = minhash_signature(text)
+
+    matches = find_near_duplicates(signature, threshold=0.1)
+    assert [job.id for job, _ in matches] == [original.id, repost.id]
+    assert matches[0][1] == 1.0 > matches[1][1]
+    assert find_near_duplicates(signature, threshold=(1.0 + matches[1][1]) / 2) == matches[:1]
+    assert len(find_near_duplicates(signature, threshold=0.1, limit=1)) == 1
+
+
+def test_duplicate_groups_join_chains_with_union_find(app):
+    text = _description(1)
+    first = _add_job(text)
+    second = _add_job(text)
+    third = _add_job(text)
+    other_first = _add_job(_description(2))
+    other_second = _add_job(_description(2))
+    _add_job(_description(3))
+    _add_job('Too short to compare')
+
+    groups = find_duplicate_groups()
+    assert [[job.id for job in group['jobs']] for group in groups] == [
+        [first.id, second.id, third.id], [other_first.id, other_second.id]
+    ]
+    assert [group['similarity'] for group in groups] == [1.0, 1.0]
+
+
+def test_duplicate_group_similarity_is_the_weakest_pair(app):
+    text = _description(1)
+    first = _add_job(text)
+    second = _add_job(_edited(text, every=60))
+    expected = similarity(minhash_signature(text), minhash_signature(_edited(text, every=60)))
+
+    [group] = find_duplicate_groups(threshold=0.1)
+    assert [job.id for job in group['jobs']] == [first.id, second.id]
+    assert group['similarity'] == expected
+    assert find_duplicate_groups(threshold=1.0) == []
+
+
+def test_bands_are_replaced_and_deleted_with_the_job(app):
+    job = _add_job(_description(1))
+    store_signature(job, minhash_signature(_description(2)))
+    db.session.commit()
+    assert JobLSHBand.query.filter_by(job_id=job.id).count() == LSH_BANDS
+    assert find_near_duplicates(minhash_signature(_description(1))) == []
+
+    store_signature(job, None)
+    db.session.commit()
+    assert job.minhash is None
+    assert JobLSHBand.query.count() == 0
+
+    store_signature(job, minhash_signature(_description(1)))
+    db.session.commit()
+    db.session.delete(job)
+    db.session.commit()
+    assert JobLSHBand.query.count() == 0
+
+
+def test_duplicates_page(client):
+    _add_job(_description(1), title='Data Engineer')
+    _add_job(_description(1), title='Data Engineer (reposted)')
+    response = client.get('/jobs/jobs/duplicates')
+    assert response.status_code == 200
+    assert b'Data Engineer (reposted)' in response.data
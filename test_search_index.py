@@ -0,0 +1,126 @@
+"""
+Tests for full-text job search (job_tracker/utils/search_index.py): the FTS5 index kept in sync
+by the after_flush listener, Core imports indexed explicitly, and bm25 ranking.
+"""
+
+import json
+from job_tracker import db
+from job_tracker.models import Contact, Job, Note
+from job_tracker.utils.search_index import build_match_query, index_jobs, rebuild_search_index, search_jobs
+
+
+def _search(query):
+    results, total = search_jobs(db.session, query)
+    return [result['id'] for result in results], total
+
+
+def _add_job(**values):
+    job = Job(**{'title': 'Engineer', 'company': 'Acme', **values})
+    db.session.add(job)
+    db.session.commit()
+    return job
+
+
+def test_build_match_query_quotes_words_and_prefixes_the_last():
+    assert build_match_query('data  engineer') == '"data" "engineer"*'
+    assert build_match_query('c++ "OR" NEAR(') == '"c" "OR" "NEAR"*'
+    assert build_match_query('  -- ') is None
+
+
+def test_new_jobs_are_indexed_on_flush(app):
+    job = _add_job(title='Platform Engineer', description='Kubernetes and Terraform',
+                   parsed_data=json.dumps({'sections': [{'title': 'Skills', 'content': ['Rust']}]}))
+
+    assert _search('kubernetes') == ([job.id], 1)
+    assert _search('rust') == ([job.id], 1)
+    assert _search('terra') == ([job.id], 1)
+    assert _search('golang') == ([], 0)
+
+
+def test_edits_and_deletes_update_the_index(app):
+    job = _add_job(title='Data Engineer')
+    job.title = 'Backend Developer'
+    db.session.commit()
+    assert _search('data') == ([], 0)
+    assert _search('backend') == ([job.id], 1)
+
+    db.session.delete(job)
+    db.session.commit()
+    assert _search('backend') == ([], 0)
+
+
+def test_notes_and_contacts_are_part_of_the_job_document(app):
+    job = _add_job()
+    note = Note(content='Recruiter mentioned equity', job_id=job.id)
+    contact = Contact(name='Dana Whitfield', email='dana@acme.test', job_id=job.id)
+    db.session.add_all([note, contact])
+    db.session.commit()
+    assert _search('equity') == ([job.id], 1)
+    assert _search('whitfield') == ([job.id], 1)
+
+    note.content = 'Recruiter mentioned a signing bonus'
+    db.session.commit()
+    assert _search('equity') == ([], 0)
+    assert _search('bonus') == ([job.id], 1)
+
+    db.session.delete(contact)
+    db.session.commit()
+    assert _search('whitfield') == ([], 0)
+
+
+def test_moving_a_note_reindexes_both_jobs(app):
+    first, second = _add_job(), _add_job()
+    note = Note(content='Referral from Priya', job_id=first.id)
+    db.session.add(note)
+    db.session.commit()
+
+    note.job_id = second.id
+    db.session.commit()
+    assert _search('priya') == ([second.id], 1)
+
+
+def test_core_inserts_are_indexed_explicitly(app):
+    job_id = db.session.execute(db.insert(Job).returning(Job.id),
+                                [{'title': 'Compiler Engineer', 'company': 'Initech'}]).scalar_one()
+    assert _search('compiler') == ([], 0)
+
+    index_jobs(db.session.connection(), [job_id])
+    db.session.commit()
+    assert _search('compiler') == ([job_id], 1)
+
+
+def test_rebuild_indexes_every_job(app):
+    jobs = [_add_job(title=f'Engineer {index}') for index in range(3)]
+    db.session.execute(db.text("DELETE FROM job_search"))
+    assert _search('engineer') == ([], 0)
+
+    assert rebuild_search_index(db.session.connection()) == 3
+    db.session.commit()
+    assert sorted(_search('engineer')[0]) == [job.id for job in jobs]
+
+
+def test_title_hits_rank_first_and_are_highlighted(app):
+    in_description = _add_job(title='Analyst', description='Some Python scripting')
+    in_title = _add_job(title='Python Developer', description='Backend services')
+
+    results, total = search_jobs(db.session, 'python')
+    assert total == 2
+    assert [result['id'] for result in results] == [in_title.id, in_description.id]
+    assert results[0]['title_html'] == '<mark>Python</mark> Developer'
+
+    results, total = search_jobs(db.session, 'python', limit=1, offset=1)
+    assert total == 2
+    assert [result['id'] for result in results] == [in_description.id]
+
+
+def test_snippets_are_escaped(app):
+    _add_job(title='<b>Python</b> & Go')
+    results, _ = search_jobs(db.session, 'python')
+    assert str(results[0]['title_html']) == '&lt;b&gt;<mark>Python</mark>&lt;/b&gt; &amp; Go'
+
+
+def test_search_page(client):
+    _add_job(title='Site Reliability Engineer')
+    response = client.get('/jobs/jobs/search?q=reliab')
+    assert response.status_code == 200
+    assert b'<mark>Reliability</mark>' in response.data
@@ -0,0 +1,105 @@
+"""
+Tests for the heuristic section parser (job_tracker/utils/section_parser.py), over the sample
+postings that benchmark_parser.py times.
+"""
+
+import pytest
+from job_tracker.utils.section_parser import find_headers, parse_sections
+from test_job_parsing import TEST_JOB_DESCRIPTION
+from test_messy_job import MESSY_JOB_DESCRIPTION
+
+
+def _outline(sections):
+    return [(section['title'], section['type']) for section in sections]
+
+
+def _section(sections, title):
+    return next(section for section in sections if section['title'] == title)
+
+
+def test_clean_posting():
+    sections = parse_sections(TEST_JOB_DESCRIPTION)
+
+    assert _outline(sections) == [
+        ('About the Company', 'paragraph'),
+        ('About the Role', 'paragraph'),
+        ('Responsibilities', 'list'),
+        ('Requirements', 'list'),
+        ('Benefits', 'list'),
+        ('Education', 'list'),
+        ('Experience', 'list'),
+    ]
+    assert _section(sections, 'About the Company')['content'].startswith('For more than 30 years, TCP')
+    assert _section(sections, 'About the Role')['content'].startswith('We are seeking a passionate')
+    responsibilities = _section(sections, 'Responsibilities')['content']
+    assert len(responsibilities) == 7
+    assert responsibilities[0].startswith('Train and deploy production-level')
+    assert 'Strong programming skills in Python' in _section(sections, 'Requirements')['content']
+    # Degree and years-of-experience items are split out of the requirements
+    assert all('degree' in item or 'PhD' in item for item in _section(sections, 'Education')['content'])
+    assert not any('degree' in item for item in _section(sections, 'Requirements')['content'])
+
+
+def test_messy_posting():
+    sections = parse_sections(MESSY_JOB_DESCRIPTION)
+
+    assert _outline(sections) == [
+        ('About the Role', 'paragraph'),
+        ('Responsibilities', 'list'),
+        ('Requirements', 'list'),
+        ('Benefits', 'list'),
+        ('Experience', 'list'),
+    ]
+    assert _section(sections, 'About the Role')['content'].startswith('The ideal candidate will help build')
+    assert _section(sections, 'Responsibilities')['content'] == [
+        'Building RESTful APIs using Node.js and Express',
+        'Designing database schemas in MongoDB',
+        'Implementing real-time communication features using WebSockets',
+        'Optimizing application performance and scalability',
+        'Creating automated testing frameworks',
+        'Contributing to architecture decisions',
+        'Mentoring junior developers',
+        'Participating in code reviews',
+    ]
+    # "We need someone who has" and "Bonus points if you have" both feed the requirements,
+    # minus the experience items
+    requirements = _section(sections, 'Requirements')['content']
+    assert 'Knowledge of microservice architecture patterns' in requirements
+    assert 'Knowledge of AWS services' in requirements
+    assert _section(sections, 'Experience')['content'][:2] == [
+        '5+ years experience with JavaScript/TypeScript',
+        '3+ years working with Node.js in production environments',
+    ]
+    assert 'Experience with GraphQL' in _section(sections, 'Experience')['content']
+    assert _section(sections, 'Benefits')['content'][-1] == 'Regular team retreats to exciting locations'
+
+
+@pytest.mark.parametrize('description', ['', None, '   \n\n'])
+def test_empty_description(description):
+    assert parse_sections(description) == [{'title': 'Job Description', 'type': 'paragraph', 'content': ''}]
+
+
+def test_description_without_headers_is_one_section():
+    text = 'Great team, interesting problems.\r\nApply through the careers page to hear more from us.'
+    assert parse_sections(text) == [
+        {'title': 'Job Description', 'type': 'paragraph', 'content': text.replace('\r\n', '\n')}
+    ]
+
+
+def test_markdown_headers_and_lead_ins_inside_sections():
+    text = (
+        '## Benefits\n'
+        '- Remote-first work environment\n'
+        '- Annual learning budget\n'
+        '\n'
+        '**Requirements:**\n'
+        'You should be comfortable with Python and SQL in production.\n'
+        'We are looking for someone who enjoys mentoring.\n'
+    )
+    sections = parse_sections(text)
+
+    assert _outline(sections) == [('Benefits', 'list'), ('Requirements', 'paragraph')]
+    assert _section(sections, 'Requirements')['content'].startswith('You should be comfortable')
+    # The lead-in phrase in the middle of a titled section stays content
+    assert [title for title, _, _ in find_headers(text)] == ['Benefits', 'Requirements']
+    assert _section(sections, 'Requirements')['content'].endswith('someone who enjoys mentoring.')
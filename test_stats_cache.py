@@ -0,0 +1,59 @@
+"""
+Tests for the cached dashboard status histogram (job_tracker/utils/stats_cache.py).
+"""
+
+import pytest
+from sqlalchemy import event
+from job_tracker import db
+from job_tracker.models import Job
+from job_tracker.utils.stats_cache import get_status_histogram, invalidate_status_histogram
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(app):
+    invalidate_status_histogram()
+    yield
+    invalidate_status_histogram()
+
+
+def _add_job(status):
+    db.session.add(Job(title='Engineer', company='Acme', status=status))
+    db.session.commit()
+
+
+def test_histogram_is_cached_until_invalidated(app):
+    _add_job('Saved')
+    _add_job(None)
+    assert get_status_histogram() == {'Saved': 2}
+
+    _add_job('Applied')
+    assert get_status_histogram() == {'Saved': 2}
+
+    invalidate_status_histogram()
+    assert get_status_histogram() == {'Saved': 2, 'Applied': 1}
+
+
+def test_histogram_expires_after_ttl(app):
+    app.config['STATUS_CACHE_TTL'] = 0
+    _add_job('Saved')
+    assert get_status_histogram() == {'Saved': 1}
+    _add_job('Applied')
+    assert get_status_histogram() == {'Saved': 1, 'Applied': 1}
+
+
+def test_invalidation_during_the_query_is_not_lost(app):
+    _add_job('Saved')
+
+    # A write commits and invalidates after the GROUP BY read its counts but before they are stored
+    def concurrent_write(conn, cursor, statement, parameters, context, executemany):
+        if 'GROUP BY' in statement:
+            invalidate_status_histogram()
+
+    event.listen(db.engine, 'after_cursor_execute', concurrent_write)
+    try:
+        assert get_status_histogram() == {'Saved': 1}
+    finally:
+        event.remove(db.engine, 'after_cursor_execute', concurrent_write)
+
+    _add_job('Applied')
+    assert get_status_histogram() == {'Saved': 1, 'Applied': 1}
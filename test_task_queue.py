@@ -0,0 +1,128 @@
+"""
+Tests for the database-backed background task queue (job_tracker/utils/task_queue.py).
+"""
+
+import json
+from datetime import datetime, timedelta
+import pytest
+from job_tracker import db, tasks
+from job_tracker.models import CompanySource, Job, Task
+from job_tracker.utils import company_names
+from job_tracker.utils.search_backends import FixtureSearchBackend, set_search_backend
+from job_tracker.utils.task_queue import TaskQueue
+
+
+@pytest.fixture
+def queue(app):
+    """Eager queue (TASK_QUEUE_WORKERS=0) with test handlers."""
+    queue = TaskQueue()
+    calls = []
+
+    @queue.handler('rename')
+    def rename(task, payload):
+        calls.append(task.id)
+        db.session.get(Job, task.job_id).title = payload['title']
+        return {'renamed': True}
+
+    @queue.handler('explode')
+    def explode(task, payload):
+        db.session.get(Job, task.job_id).title = 'half-written'
+        raise RuntimeError('boom')
+
+    queue.init_app(app)
+    queue.calls = calls
+    return queue
+
+
+@pytest.fixture
+def job_id(app):
+    job = Job(title='Engineer', company='Acme')
+    db.session.add(job)
+    db.session.commit()
+    return job.id
+
+
+def test_task_runs_and_commits_with_its_status(queue, job_id):
+    task = queue.enqueue('rename', job_id=job_id, title='Data Engineer')
+
+    # Tasks run in their own application context, so reload what this session cached
+    db.session.expire_all()
+    task = db.session.get(Task, task.id)
+    job = db.session.get(Job, job_id)
+    assert (task.status, json.loads(task.result), task.attempts) == ('done', {'renamed': True}, 1)
+    assert task.finished_at is not None
+    assert (job.title, job.processing_status) == ('Data Engineer', 'ready')
+
+
+def test_failed_task_rolls_back_its_changes(queue, job_id):
+    task = queue.enqueue('explode', job_id=job_id)
+
+    db.session.expire_all()
+    task = db.session.get(Task, task.id)
+    job = db.session.get(Job, job_id)
+    assert (task.status, task.error) == ('failed', 'boom')
+    assert (job.title, job.processing_status) == ('Engineer', 'failed')
+
+
+def test_unknown_task_type_is_rejected(queue, job_id):
+    with pytest.raises(ValueError):
+        queue.enqueue('missing', job_id=job_id)
+
+
+def test_a_task_is_only_claimed_once(queue, job_id):
+    task = queue.enqueue('rename', job_id=job_id, title='Data Engineer')
+
+    # A sibling process recovering the same task finds it no longer pending
+    queue._run(task.id)
+    db.session.expire_all()
+    assert queue.calls == [task.id]
+    assert db.session.get(Task, task.id).attempts == 1
+
+
+def test_recover_resubmits_pending_and_stale_running_tasks(app, queue, job_id):
+    now = datetime.utcnow()
+    stale_seconds = app.config['TASK_STALE_SECONDS']
+    payload = json.dumps({'title': 'Recovered'})
+    pending = Task(task_type='rename', job_id=job_id, payload=payload, status='pending')
+    stale = Task(task_type='rename', job_id=job_id, payload=payload, status='running',
+                 started_at=now - timedelta(seconds=stale_seconds + 60))
+    live = Task(task_type='rename', job_id=job_id, payload=payload, status='running',
+                started_at=now - timedelta(seconds=10))
+    db.session.add_all([pending, stale, live])
+    db.session.commit()
+
+    queue.recover()
+
+    db.session.expire_all()
+    assert sorted(queue.calls) == sorted([pending.id, stale.id])
+    assert (pending.status, stale.status, live.status) == ('done', 'done', 'running')
+    job = db.session.get(Job, job_id)
+    assert job.title == 'Recovered'
+    # The live task is still active, so the job is not marked ready yet
+    assert job.processing_status != 'ready'
+
+
+def test_enrich_company_keeps_its_discovery_when_the_fetch_fails(queue, job_id, monkeypatch):
+    monkeypatch.setattr(company_names, '_index', None)
+    queue.handler('enrich_company')(tasks.enrich_company)
+    set_search_backend(FixtureSearchBackend({
+        'acme linkedin company': [{'link': 'https://www.linkedin.com/company/acme'}],
+    }))
+
+    def fail_fetch(company_source, only_missing=False):
+        company_source.company_data = 'half-written'
+        raise RuntimeError('LLM unavailable')
+
+    monkeypatch.setattr(tasks, 'refresh_company_data', fail_fetch)
+    try:
+        task = queue.enqueue('enrich_company', job_id=job_id, discover=True)
+    finally:
+        set_search_backend(None)
+
+    db.session.expire_all()
+    assert db.session.get(Task, task.id).status == 'failed'
+    # The early commit keeps the link and discovery; only the fetched profile is rolled back
+    company_source = db.session.get(Job, job_id).company_source
+    assert company_source.linkedin_url == 'https://www.linkedin.com/company/acme'
+    assert company_source.discovered_at is not None
+    assert db.session.query(CompanySource.company_data).scalar() is None
@@ -0,0 +1,109 @@
+"""
+Tests for company URL discovery and its cache of hits and misses
+(job_tracker/utils/url_discovery.py, company_enrichment.py).
+"""
+
+from datetime import datetime, timedelta
+import pytest
+import requests
+from job_tracker.models import CompanySource
+from job_tracker.utils.company_enrichment import discover_company_urls, needs_url_discovery
+from job_tracker.utils.search_backends import (
+    FixtureSearchBackend,
+    HTTPSearchBackend,
+    SearchBackend,
+    SearchError,
+    set_search_backend,
+)
+
+TTL, NEGATIVE_TTL, RETRY_TTL = 7 * 24 * 3600, 24 * 3600, 15 * 60
+RESULTS = {
+    'acme official website': [{'link': 'https://www.acme.com'}],
+    'acme linkedin company': [{'link': 'https://www.linkedin.com/company/acme'}],
+    'acme glassdoor reviews': [{'link': 'https://www.glassdoor.com/Reviews/Acme-Reviews-E1234.htm'}],
+}
+
+
+class FailingSearchBackend(SearchBackend):
+    """Backend whose searches all fail, as during a network outage."""
+
+    def search(self, query, num_results=10):
+        raise SearchError('connection refused')
+
+
+@pytest.fixture(autouse=True)
+def reset_backend():
+    yield
+    set_search_backend(None)
+
+
+def test_found_urls_are_a_hit():
+    set_search_backend(FixtureSearchBackend(RESULTS))
+    company_source = CompanySource(company_name='Acme')
+
+    discovered_urls = discover_company_urls(company_source)
+
+    assert company_source.discovery_hit is True
+    assert discovered_urls['linkedin_url'] == 'https://www.linkedin.com/company/acme'
+    assert company_source.website_url == 'https://www.acme.com'
+
+
+def test_empty_results_are_cached_as_a_miss():
+    set_search_backend(FixtureSearchBackend({}))
+    company_source = CompanySource(company_name='Acme')
+
+    discover_company_urls(company_source)
+
+    assert company_source.discovery_hit is False
+    later = company_source.discovered_at + timedelta(hours=1)
+    assert not needs_url_discovery(company_source, TTL, NEGATIVE_TTL, RETRY_TTL, now=later)
+
+
+def test_search_errors_are_retried_soon_instead_of_cached_as_a_miss():
+    set_search_backend(FailingSearchBackend())
+    company_source = CompanySource(company_name='Acme')
+
+    discover_company_urls(company_source)
+
+    assert company_source.discovered_at is not None
+    assert company_source.discovery_hit is None
+    soon = company_source.discovered_at + timedelta(seconds=RETRY_TTL - 1)
+    later = company_source.discovered_at + timedelta(seconds=RETRY_TTL)
+    assert not needs_url_discovery(company_source, TTL, NEGATIVE_TTL, RETRY_TTL, now=soon)
+    assert needs_url_discovery(company_source, TTL, NEGATIVE_TTL, RETRY_TTL, now=later)
+
+
+def test_deadline_counts_as_a_failure(monkeypatch):
+    monkeypatch.setenv('DISCOVERY_DEADLINE_SECONDS', '0.05')
+    set_search_backend(FixtureSearchBackend(RESULTS, latency={'acme glassdoor reviews': 0.5}))
+    company_source = CompanySource(company_name='Acme')
+
+    discovered_urls = discover_company_urls(company_source)
+
+    assert discovered_urls['website_url'] == 'https://www.acme.com'
+    assert discovered_urls['glassdoor_url'] is None
+    assert company_source.discovery_hit is None
+
+
+def test_http_backend_raises_on_request_errors(monkeypatch):
+    backend = HTTPSearchBackend('https://search.invalid/api', api_key=None, timeout=1)
+
+    def refuse(*args, **kwargs):
+        raise requests.ConnectionError('connection refused')
+
+    monkeypatch.setattr(backend.session, 'get', refuse)
+    with pytest.raises(SearchError):
+        backend.search('acme official website')
+
+
+def test_ttls():
+    now = datetime(2024, 6, 1)
+    assert needs_url_discovery(None, TTL, NEGATIVE_TTL, RETRY_TTL, now=now)
+    assert not needs_url_discovery(
+        CompanySource(company_name='Acme', website_url='a', linkedin_url='b', glassdoor_url='c'),
+        TTL, NEGATIVE_TTL, RETRY_TTL, now=now
+    )
+    hit = CompanySource(company_name='Acme', discovered_at=now - timedelta(days=2), discovery_hit=True)
+    miss = CompanySource(company_name='Acme', discovered_at=now - timedelta(days=2), discovery_hit=False)
+    assert not needs_url_discovery(hit, TTL, NEGATIVE_TTL, RETRY_TTL, now=now)
+    assert needs_url_discovery(miss, TTL, NEGATIVE_TTL, RETRY_TTL, now=now)
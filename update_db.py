@@ -3,14 +3,301 @@ Consolidated database migration script.
 """
 import sqlite3
 import os
+import time
 from job_tracker import create_app, db  # Import app and db
+from job_tracker.utils.company_names import normalize_company_name
+from job_tracker.utils.job_sections import (
+    detect_seniority,
+    extract_skills,
+    load_parsed_data,
+    materialize_parsed_data,
+    normalize_skill,
+)
+from job_tracker.utils.match_scoring import compute_match_scores, load_cv_terms
+from job_tracker.utils.near_duplicates import minhash_signature, signature_rows
 from datetime import datetime
 
+# Secondary indexes (name, table, columns); created with IF NOT EXISTS so reruns are safe
+INDEXES = [
+    ("ix_job_status_date_added", "job", "status, date_added"),
+    ("ix_job_date_added", "job", "date_added"),
+    ("ix_job_url", "job", "url"),
+    ("ix_company_source_company_name", "company_source", "company_name"),
+    ("ix_company_source_normalized_name", "company_source", "normalized_name"),
+    ("ix_job_company_source_id", "job", "company_source_id"),
+    ("ix_job_seniority_date_added", "job", "seniority, date_added"),
+    ("ix_job_match_score_id", "job", "match_score, id"),
+    ("ix_job_lsh_band_band_bucket_job_id", "job_lsh_band", "band, bucket, job_id"),
+    ("ix_job_lsh_band_job_id", "job_lsh_band", "job_id"),
+    ("ix_job_skill_normalized_job_id", "job_skill", "normalized, job_id"),
+    ("ix_job_skill_job_id", "job_skill", "job_id"),
+    ("ix_note_job_id_date_added", "note", "job_id, date_added"),
+    ("ix_contact_job_id", "contact", "job_id"),
+    ("ix_task_status_created_at", "task", "status, created_at"),
+    ("ix_task_job_id", "task", "job_id"),
+]
+
+# Representative lookups issued by the routes, used for the before/after query-plan benchmark
+BENCHMARK_QUERIES = [
+    ("list_jobs by status",
+     "SELECT id, title FROM job WHERE status = ? ORDER BY date_added DESC, id DESC LIMIT 50", ("Applied",)),
+    ("list_jobs all",
+     "SELECT id, title FROM job ORDER BY date_added DESC, id DESC LIMIT 50", ()),
+    ("parse_url duplicate check",
+     "SELECT id FROM job WHERE url = ? LIMIT 1", ("https://example.com/job",)),
+    ("company source lookup",
+     "SELECT id FROM company_source WHERE normalized_name = ? LIMIT 1", ("example",)),
+    ("notes for job",
+     "SELECT id FROM note WHERE job_id = ? ORDER BY date_added DESC", (1,)),
+    ("contacts for job",
+     "SELECT id FROM contact WHERE job_id = ?", (1,)),
+    ("list_jobs by skill",
+     "SELECT id, title FROM job WHERE id IN (SELECT job_id FROM job_skill WHERE normalized = ?) "
+     "ORDER BY date_added DESC, id DESC LIMIT 50", ("pytorch",)),
+    ("list_jobs by match score",
+     "SELECT id, title FROM job WHERE match_score IS NOT NULL ORDER BY match_score DESC, id DESC LIMIT 50", ()),
+    ("near-duplicate candidates",
+     "SELECT DISTINCT job_id FROM job_lsh_band WHERE band = ? AND bucket = ?", (0, 0)),
+]
+
+
+def _benchmark_queries(cursor, label, repeat=200):
+    """
+    Print the query plan and average latency of each benchmark query.
+    
+    Args:
+        cursor: SQLite cursor
+        label: Heading printed above the results (e.g. "before")
+        repeat: Number of executions to average over
+    """
+    print(f"Query plans {label} creating indexes:")
+    for name, sql, params in BENCHMARK_QUERIES:
+        try:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            plan = "; ".join(row[-1] for row in cursor.fetchall())
+            
+            start = time.perf_counter()
+            for _ in range(repeat):
+                cursor.execute(sql, params)
+                cursor.fetchall()
+            elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+        except sqlite3.OperationalError as e:
+            print(f"  {name}: skipped ({str(e)})")
+            continue
+        print(f"  {name}: {elapsed_ms:.3f} ms | {plan}")
+
+
+def _create_indexes(cursor):
+    """Create any missing secondary indexes listed in INDEXES."""
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+    existing = {row[0] for row in cursor.fetchall()}
+    
+    for name, table, columns in INDEXES:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table,))
+        if not cursor.fetchone():
+            print(f"Table {table} doesn't exist, skipping index {name}")
+            continue
+        if name in existing:
+            print(f"Index {name} already exists")
+            continue
+        print(f"Creating index {name} on {table}({columns})...")
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})")
+    
+    cursor.execute("ANALYZE")
+
+
+def _merge_company_sources(cursor):
+    """
+    Key company sources by normalized name, folding sources that normalize to the same name
+    into the oldest one (missing URLs and enrichment are taken from the duplicates).
+    
+    Returns:
+        Dictionary of normalized name to company_source id
+    """
+    cursor.execute("""
+        SELECT id, company_name, website_url, linkedin_url, glassdoor_url, company_data, company_reviews
+        FROM company_source ORDER BY id
+    """)
+    by_name = {}
+    merged = 0
+    for source_id, company_name, *fields in cursor.fetchall():
+        normalized = normalize_company_name(company_name)
+        if normalized not in by_name:
+            by_name[normalized] = source_id
+            cursor.execute("UPDATE company_source SET normalized_name = ? WHERE id = ?", (normalized, source_id))
+            continue
+        
+        keep_id = by_name[normalized]
+        cursor.execute("""
+            UPDATE company_source SET
+                website_url = COALESCE(website_url, ?),
+                linkedin_url = COALESCE(linkedin_url, ?),
+                glassdoor_url = COALESCE(glassdoor_url, ?),
+                company_data = COALESCE(company_data, ?),
+                company_reviews = COALESCE(company_reviews, ?)
+            WHERE id = ?
+        """, (*fields, keep_id))
+        cursor.execute("UPDATE job SET company_source_id = ? WHERE company_source_id = ?", (keep_id, source_id))
+        cursor.execute("DELETE FROM company_source WHERE id = ?", (source_id,))
+        merged += 1
+    
+    print(f"Normalized {len(by_name)} company sources, merged {merged} duplicates")
+    return by_name
+
+
+def _migrate_company_enrichment(cursor):
+    """
+    Link every job to the company source for its company and move the per-job
+    company_data/company_reviews copies onto the source (newest copy wins), clearing
+    the job columns once the source holds the data.
+    """
+    by_name = _merge_company_sources(cursor)
+    
+    cursor.execute("SELECT id, company, company_source_id FROM job ORDER BY id DESC")
+    created = linked = 0
+    for job_id, company, company_source_id in cursor.fetchall():
+        normalized = normalize_company_name(company)
+        if normalized not in by_name:
+            cursor.execute(
+                "INSERT INTO company_source (company_name, normalized_name, last_updated) VALUES (?, ?, ?)",
+                (company, normalized, datetime.utcnow())
+            )
+            by_name[normalized] = cursor.lastrowid
+            created += 1
+        if company_source_id != by_name[normalized]:
+            cursor.execute("UPDATE job SET company_source_id = ? WHERE id = ?", (by_name[normalized], job_id))
+            linked += 1
+    print(f"Linked {linked} jobs to company sources ({created} sources created)")
+    
+    # Newest job first, so the most recent enrichment of a company is the one kept
+    for column in ('company_data', 'company_reviews'):
+        cursor.execute(f"""
+            UPDATE company_source SET
+                {column} = (
+                    SELECT job.{column} FROM job
+                    WHERE job.company_source_id = company_source.id AND job.{column} IS NOT NULL
+                    ORDER BY job.id DESC LIMIT 1
+                ),
+                enriched_at = COALESCE(enriched_at, ?)
+            WHERE {column} IS NULL AND EXISTS (
+                SELECT 1 FROM job WHERE job.company_source_id = company_source.id AND job.{column} IS NOT NULL
+            )
+        """, (datetime.utcnow(),))
+        moved = cursor.rowcount
+        cursor.execute(f"""
+            UPDATE job SET {column} = NULL
+            WHERE {column} IS NOT NULL AND company_source_id IN (
+                SELECT id FROM company_source WHERE {column} IS NOT NULL
+            )
+        """)
+        print(f"Moved {column} to {moved} company sources, cleared {cursor.rowcount} job copies")
+
+
+def _materialize_parsed_data(cursor):
+    """
+    Clean parsed_data written before cleaning moved to write time and fill in the
+    job_skill rows and seniority column for those jobs; jobs without parsed_data
+    get a seniority from their title. Already cleaned jobs get their skills
+    re-extracted, so improvements to extract_skills reach stored rows.
+    """
+    cursor.execute("SELECT job_id, name FROM job_skill ORDER BY id")
+    stored_skills = {}
+    for job_id, name in cursor.fetchall():
+        stored_skills.setdefault(job_id, []).append(name)
+
+    cursor.execute("SELECT id, title, parsed_data, seniority FROM job")
+    materialized = titled = reextracted = 0
+    for job_id, title, parsed_data, seniority in cursor.fetchall():
+        data = load_parsed_data(parsed_data)
+        if data is not None and not data.get('metadata', {}).get('cleaned'):
+            values = materialize_parsed_data(title, data)
+            cursor.execute("UPDATE job SET parsed_data = ?, seniority = ? WHERE id = ?",
+                           (values['parsed_data'], values['seniority'], job_id))
+            _replace_skills(cursor, job_id, values['skills'])
+            materialized += 1
+            continue
+        if data is not None:
+            skills = extract_skills(data.get('sections') or [])
+            if skills != stored_skills.get(job_id, []):
+                _replace_skills(cursor, job_id, skills)
+                reextracted += 1
+        if seniority is None:
+            level = detect_seniority(title, (data or {}).get('sections'))
+            if level:
+                cursor.execute("UPDATE job SET seniority = ? WHERE id = ?", (level, job_id))
+                titled += 1
+    print(f"Materialized parsed data for {materialized} jobs, re-extracted skills for {reextracted}, "
+          f"set seniority from the title for {titled}")
+
+
+def _replace_skills(cursor, job_id, skills):
+    """Replace a job's job_skill rows."""
+    cursor.execute("DELETE FROM job_skill WHERE job_id = ?", (job_id,))
+    cursor.executemany(
+        "INSERT INTO job_skill (job_id, name, normalized) VALUES (?, ?, ?)",
+        [(job_id, skill, normalize_skill(skill)) for skill in skills]
+    )
+
+
+def _score_jobs(cursor):
+    """Compute every job's CV match score, if a CV has been uploaded."""
+    cv_terms = load_cv_terms()
+    if cv_terms is None:
+        print("No readable CV uploaded, match scores left empty")
+        return
+    
+    cursor.execute("SELECT id FROM job")
+    job_skills = {job_id: [] for (job_id,) in cursor.fetchall()}
+    cursor.execute("SELECT job_id, normalized FROM job_skill")
+    for job_id, normalized in cursor.fetchall():
+        if job_id in job_skills:
+            job_skills[job_id].append(normalized)
+    
+    scores = compute_match_scores(job_skills, cv_terms)
+    cursor.executemany("UPDATE job SET match_score = ? WHERE id = ?",
+                       [(score, job_id) for job_id, score in scores.items()])
+    print(f"Scored {sum(score is not None for score in scores.values())} of {len(scores)} jobs against the CV")
+
+
+def _compute_minhash(cursor):
+    """Store MinHash signatures and LSH buckets for jobs that do not have them yet."""
+    cursor.execute("SELECT id, description FROM job WHERE minhash IS NULL AND description IS NOT NULL")
+    computed = 0
+    for job_id, description in cursor.fetchall():
+        signature = minhash_signature(description)
+        if signature is None:
+            continue
+        cursor.execute("UPDATE job SET minhash = ? WHERE id = ?", (signature.tobytes(), job_id))
+        cursor.execute("DELETE FROM job_lsh_band WHERE job_id = ?", (job_id,))
+        cursor.executemany("INSERT INTO job_lsh_band (job_id, band, bucket) VALUES (:job_id, :band, :bucket)",
+                           signature_rows(job_id, signature))
+        computed += 1
+    print(f"Computed MinHash signatures for {computed} jobs")
+
+
+def _backfill_updated_at(cursor):
+    """Give rows written before updated_at existed a version timestamp (their last known change)."""
+    now = str(datetime.utcnow())
+    cursor.execute("UPDATE job SET updated_at = COALESCE(date_added, ?) WHERE updated_at IS NULL", (now,))
+    print(f"Set updated_at on {cursor.rowcount} jobs")
+    cursor.execute("""
+        UPDATE company_source SET updated_at = COALESCE(enriched_at, last_updated, ?)
+        WHERE updated_at IS NULL
+    """, (now,))
+    print(f"Set updated_at on {cursor.rowcount} company sources")
+
+
 def update_database():
     """
     Consolidated migration to update the database schema.
     Adds company_data and company_reviews columns to the job table if they don't exist,
-    and creates the company_source table if it doesn't exist.
+    adds the processing_status column used by background tasks, creates the
+    company_source table if it doesn't exist, adds its URL discovery cache columns,
+    moves company enrichment from jobs onto their company source, materializes cleaned
+    parsed_data, skills and seniority, computes CV match scores and near-duplicate
+    signatures, backfills the updated_at columns that version the job and company
+    pages, and creates the secondary indexes
+    used by the list, duplicate-check and related-data queries.
     """
     print("Starting database migration...")
     
@@ -46,6 +333,48 @@ def update_database():
             else:
                 print("company_reviews column already exists")
             
+            # Add processing_status column (state of background tasks) if it doesn't exist
+            if 'processing_status' not in columns:
+                print("Adding processing_status column to job table...")
+                cursor.execute("ALTER TABLE job ADD COLUMN processing_status VARCHAR(20)")
+            else:
+                print("processing_status column already exists")
+            
+            # Add seniority column (materialized from parsed_data) if it doesn't exist
+            if 'seniority' not in columns:
+                print("Adding seniority column to job table...")
+                cursor.execute("ALTER TABLE job ADD COLUMN seniority VARCHAR(20)")
+            else:
+                print("seniority column already exists")
+            
+            # Add match_score column (share of the job's skills found in the CV) if it doesn't exist
+            if 'match_score' not in columns:
+                print("Adding match_score column to job table...")
+                cursor.execute("ALTER TABLE job ADD COLUMN match_score FLOAT")
+            else:
+                print("match_score column already exists")
+            
+            # Add minhash column (near-duplicate signature of the description) if it doesn't exist
+            if 'minhash' not in columns:
+                print("Adding minhash column to job table...")
+                cursor.execute("ALTER TABLE job ADD COLUMN minhash BLOB")
+            else:
+                print("minhash column already exists")
+            
+            # Add updated_at column (versions the job pages for HTTP caching) if it doesn't exist
+            if 'updated_at' not in columns:
+                print("Adding updated_at column to job table...")
+                cursor.execute("ALTER TABLE job ADD COLUMN updated_at TIMESTAMP")
+            else:
+                print("updated_at column already exists")
+            
+            # Add company_source_id column (shared company enrichment) if it doesn't exist
+            if 'company_source_id' not in columns:
+                print("Adding company_source_id column to job table...")
+                cursor.execute("ALTER TABLE job ADD COLUMN company_source_id INTEGER REFERENCES company_source(id)")
+            else:
+                print("company_source_id column already exists")
+            
             # Check if CompanySource table exists
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='company_source'")
             if not cursor.fetchone():
@@ -63,8 +392,38 @@ def update_database():
             else:
                 print("CompanySource table already exists")
             
+            # Add the discovery cache, lookup key and shared enrichment columns to company_source if they don't exist
+            cursor.execute("PRAGMA table_info(company_source)")
+            source_columns = [column[1] for column in cursor.fetchall()]
+            for column, column_type in [('discovered_at', 'TIMESTAMP'), ('discovery_hit', 'BOOLEAN'),
+                                        ('normalized_name', 'VARCHAR(100)'), ('company_data', 'TEXT'),
+                                        ('company_reviews', 'TEXT'), ('enriched_at', 'TIMESTAMP'),
+                                        ('updated_at', 'TIMESTAMP')]:
+                if column not in source_columns:
+                    print(f"Adding {column} column to company_source table...")
+                    cursor.execute(f"ALTER TABLE company_source ADD COLUMN {column} {column_type}")
+                else:
+                    print(f"{column} column already exists")
+            
+            # Store enrichment once per company instead of on every job
+            _migrate_company_enrichment(cursor)
+            
+            # Store cleaned sections, skills and seniority once instead of on every read
+            _materialize_parsed_data(cursor)
+            _score_jobs(cursor)
+            _compute_minhash(cursor)
+            _backfill_updated_at(cursor)
+            
+            # Create secondary indexes, reporting query plans before and after
+            _benchmark_queries(cursor, "before")
+            _create_indexes(cursor)
+            _benchmark_queries(cursor, "after")
+            
             # Commit changes
             conn.commit()
+            
+            # Give the space of the cleared per-job copies back to the filesystem
+            cursor.execute("VACUUM")
             print("Database migration completed successfully!")
             
         except Exception as e: